@@ -348,20 +348,12 @@ class Grassmann:
 
         # For each point perform svd.
         if append_samples:
-            for i in range(nargs_new):
-                u, s, v = svd(samples_new[i], int(ranks_new[i]))
-                self.psi.append(u)
-                self.sigma.append(np.diag(s))
-                self.phi.append(v)
+            psi, sigma, phi = self.__svd(samples_new, ranks_new)
+            self.psi.extend(psi)
+            self.sigma.extend(sigma)
+            self.phi.extend(phi)
         else:
-            psi = []  # initialize the left singular eigenvectors as a list.
-            sigma = []  # initialize the singular values as a list.
-            phi = []  # initialize the right singular eigenvectors as a list.
-            for i in range(nargs):
-                u, s, v = svd(samples[i], int(ranks[i]))
-                psi.append(u)
-                sigma.append(np.diag(s))
-                phi.append(v)
+            psi, sigma, phi = self.__svd(samples, ranks)
 
             self.samples = samples
             self.psi = psi
@@ -375,6 +367,50 @@ class Grassmann:
         self.nargs = nargs
         self.max_rank = int(np.max(ranks))
 
+    @staticmethod
+    def __svd(samples, ranks):
+
+        """
+        Private method: Perform the singular value decomposition of the samples.
+
+        If all the samples have the same shape they are decomposed in a single batched call, otherwise each sample is
+        decomposed separately.
+
+        **Input:**
+
+        * **samples** (`list`)
+            Input matrices.
+
+        * **ranks** (`list`)
+            Number of singular values to keep for each matrix.
+
+        **Output/Returns:**
+
+        * **psi** (`list`)
+            Left singular eigenvectors.
+
+        * **sigma** (`list`)
+            Singular values.
+
+        * **phi** (`list`)
+            Right singular eigenvectors.
+
+        """
+
+        ranks = [int(rnk) for rnk in ranks]
+        if len(set(np.shape(sample) for sample in samples)) == 1:
+            psi, sigma, phi = batched_svd(np.asarray(samples, dtype=float), ranks)
+        else:
+            psi, sigma, phi = [], [], []
+            for i in range(len(samples)):
+                u, s, v = svd(samples[i], ranks[i])
+                psi.append(u)
+                sigma.append(s)
+                phi.append(v)
+
+        sigma = [np.diag(s) for s in sigma]
+        return psi, sigma, phi
+
     def distance(self, points_grassmann=None):
 
         """
@@ -957,6 +957,168 @@ class MVNormal(DistributionND):
             raise ValueError('UQpy: moments2return must be "number_of_variables", "v" or "mv".')
 
 
+class MVNormalMixture(DistributionND):
+    """
+    Mixture of multivariate normal distributions having probability density function
+
+    .. math:: f(x) = \sum_{j=1}^{J} w_j \dfrac{1}{\sqrt{(2\pi)^k\det\Sigma_j}}\exp{-\dfrac{1}{2}(x-\mu_j)^T\Sigma_j^{-1}(x-\mu_j)}
+
+    where :math:`w_j`, :math:`\mu_j` and :math:`\Sigma_j` are the weight, mean vector and covariance matrix of the
+    `j-th` component and :math:`k` is the dimension of `x`.
+
+    **Inputs:**
+
+    * **weights** (`ndarray`):
+        weights of the components, `ndarray` of shape `(ncomponents, )`; should sum to 1
+    * **means** (`ndarray`):
+        mean vectors, `ndarray` of shape `(ncomponents, dimension)`
+    * **covs** (`ndarray`):
+        covariance matrices, `ndarray` of shape `(ncomponents, dimension, dimension)`
+
+    The following methods are available for ``MVNormalMixture``:
+
+    * ``pdf``, ``log_pdf``, ``rvs``, ``moments``.
+    """
+    def __init__(self, weights, means, covs):
+        weights, means, covs = np.atleast_1d(weights), np.atleast_2d(means), np.array(covs)
+        if covs.shape != (means.shape[0], means.shape[1], means.shape[1]) or weights.shape != (means.shape[0], ):
+            raise ValueError('Inputs weights, means and covs must be of shapes (ncomponents, ), (ncomponents, '
+                             'dimension) and (ncomponents, dimension, dimension).')
+        super().__init__(weights=weights, means=means, covs=covs, order_params=['weights', 'means', 'covs'])
+
+    def pdf(self, x):
+        return np.exp(self.log_pdf(x))
+
+    def log_pdf(self, x):
+        from scipy.special import logsumexp
+        weights, means, covs = self.params['weights'], self.params['means'], self.params['covs']
+        x = self._check_x_dimension(x, d=means.shape[1])
+        # Log-density of each component from the Cholesky factors of the covariances, for all points at once
+        chol = np.linalg.cholesky(covs)
+        diff = x[np.newaxis, :, :] - means[:, np.newaxis, :]
+        y = np.linalg.solve(chol, np.transpose(diff, (0, 2, 1)))
+        log_det = 2 * np.sum(np.log(np.diagonal(chol, axis1=1, axis2=2)), axis=1)
+        log_comp = -0.5 * (np.sum(y ** 2, axis=1) + log_det[:, np.newaxis] + means.shape[1] * np.log(2 * np.pi))
+        return np.atleast_1d(logsumexp(log_comp, b=weights[:, np.newaxis], axis=0))
+
+    def rvs(self, nsamples=1, random_state=None):
+        if not (isinstance(nsamples, int) and nsamples >= 1):
+            raise ValueError('Input nsamples must be an integer > 0.')
+        if isinstance(random_state, int):
+            random_state = np.random.RandomState(random_state)
+        random = np.random if random_state is None else random_state
+        weights, means, covs = self.params['weights'], self.params['means'], self.params['covs']
+        components = random.choice(weights.size, size=nsamples, p=weights / np.sum(weights))
+        chol = np.linalg.cholesky(covs)
+        eps = random.standard_normal((nsamples, means.shape[1]))
+        return means[components] + np.einsum('nij,nj->ni', chol[components], eps)
+
+    def moments(self, moments2return='mv'):
+        weights, means, covs = self.params['weights'], self.params['means'], self.params['covs']
+        mean = np.sum(weights[:, np.newaxis] * means, axis=0)
+        diff = means - mean
+        cov = np.sum(weights[:, np.newaxis, np.newaxis] * (covs + np.einsum('ji,jk->jik', diff, diff)), axis=0)
+        if moments2return == 'm':
+            return mean
+        elif moments2return == 'v':
+            return cov
+        elif moments2return == 'mv':
+            return mean, cov
+        else:
+            raise ValueError('UQpy: moments2return must be "m", "v" or "mv".')
+
+
+class VonMisesFisherNakagami(DistributionND):
+    """
+    von Mises-Fisher-Nakagami distribution.
+
+    The random vector is :math:`x = r a`, where the direction :math:`a` on the unit hypersphere follows a von
+    Mises-Fisher distribution with mean direction :math:`\mu` and concentration :math:`\kappa`, and the radius
+    :math:`r` follows a Nakagami distribution with shape :math:`m` and spread :math:`\Omega`, i.e.
+
+    .. math:: f(x) = \dfrac{2m^m}{\Gamma(m)\Omega^m}r^{2m-1}\exp{\left(-\dfrac{m}{\Omega}r^2\right)} \dfrac{\kappa^{k/2-1}}{(2\pi)^{k/2}I_{k/2-1}(\kappa)}\exp{(\kappa\mu^Ta)} \dfrac{1}{r^{k-1}}
+
+    where :math:`k` is the dimension of `x` and :math:`I_\\nu` is the modified Bessel function of the first kind. With
+    :math:`\kappa=0`, :math:`m=k/2` and :math:`\Omega=k` it is the standard normal distribution in :math:`k`
+    dimensions. This distribution is mainly used as an importance sampling density in high dimensions.
+
+    **Inputs:**
+
+    * **mu** (`ndarray`):
+        mean direction, `ndarray` of shape `(dimension, )` with unit norm
+    * **kappa** (`float`):
+        concentration of the direction, must be non-negative
+    * **m** (`float`):
+        shape of the radius, must be larger than or equal to 0.5
+    * **omega** (`float`):
+        spread of the radius, must be positive
+
+    The following methods are available for ``VonMisesFisherNakagami``:
+
+    * ``pdf``, ``log_pdf``, ``rvs``.
+    """
+    def __init__(self, mu, kappa, m, omega):
+        mu = np.atleast_1d(mu).astype(float)
+        if len(mu.shape) != 1:
+            raise ValueError('Input mu must be a 1D array.')
+        super().__init__(mu=mu / np.linalg.norm(mu), kappa=kappa, m=m, omega=omega,
+                         order_params=['mu', 'kappa', 'm', 'omega'])
+
+    def pdf(self, x):
+        return np.exp(self.log_pdf(x))
+
+    def log_pdf(self, x):
+        from scipy.special import gammaln, ive
+        mu, kappa, m, omega = self.params['mu'], self.params['kappa'], self.params['m'], self.params['omega']
+        x = self._check_x_dimension(x, d=mu.size)
+        d = mu.size
+        r = np.linalg.norm(x, axis=1)
+        log_radius = np.log(2.) + m * np.log(m / omega) - gammaln(m) + (2 * m - 1) * np.log(r) - m / omega * r ** 2
+        if kappa == 0:
+            log_direction = gammaln(d / 2) - np.log(2.) - d / 2 * np.log(np.pi) * np.ones_like(r)
+        else:
+            # The exponentially scaled Bessel function avoids overflow for large concentrations
+            log_norm = (d / 2 - 1) * np.log(kappa) - d / 2 * np.log(2 * np.pi) - np.log(ive(d / 2 - 1, kappa)) - kappa
+            log_direction = log_norm + kappa * (x @ mu) / r
+        return np.atleast_1d(log_radius + log_direction - (d - 1) * np.log(r))
+
+    def rvs(self, nsamples=1, random_state=None):
+        if not (isinstance(nsamples, int) and nsamples >= 1):
+            raise ValueError('Input nsamples must be an integer > 0.')
+        if isinstance(random_state, int):
+            random_state = np.random.RandomState(random_state)
+        random = np.random if random_state is None else random_state
+        mu, kappa, m, omega = self.params['mu'], self.params['kappa'], self.params['m'], self.params['omega']
+        d = mu.size
+
+        # Radius: the square of a Nakagami(m, omega) variable is Gamma(m, omega / m)
+        r = np.sqrt(random.gamma(shape=m, scale=omega / m, size=nsamples))
+
+        # Direction: component along mu by the rejection sampler of Wood (1994), accepted in vectorized batches
+        if kappa == 0:
+            a = random.standard_normal((nsamples, d))
+            return r[:, np.newaxis] * a / np.linalg.norm(a, axis=1)[:, np.newaxis]
+        b = (d - 1) / (2 * kappa + np.sqrt(4 * kappa ** 2 + (d - 1) ** 2))
+        x0 = (1 - b) / (1 + b)
+        c = kappa * x0 + (d - 1) * np.log(1 - x0 ** 2)
+        w = np.zeros(nsamples)
+        todo = np.arange(nsamples)
+        while todo.size > 0:
+            z = random.beta((d - 1) / 2, (d - 1) / 2, size=todo.size)
+            u = random.uniform(size=todo.size)
+            w_ = (1 - (1 + b) * z) / (1 - (1 - b) * z)
+            accept = kappa * w_ + (d - 1) * np.log(1 - x0 * w_) - c >= np.log(u)
+            w[todo[accept]] = w_[accept]
+            todo = todo[~accept]
+
+        # Uniform direction orthogonal to mu
+        v = random.standard_normal((nsamples, d))
+        v = v - np.outer(v @ mu, mu)
+        v = v / np.linalg.norm(v, axis=1)[:, np.newaxis]
+        a = w[:, np.newaxis] * mu + np.sqrt(1 - w ** 2)[:, np.newaxis] * v
+        return r[:, np.newaxis] * a
+
+
 class Multinomial(DistributionND):
     """
     Multinomial distribution having probability mass function
@@ -24,7 +24,8 @@ following classes:
 * ``InferenceModel``: Define a probabilistic model for Inference.
 * ``MLEstimation``: Compute maximum likelihood parameter estimate.
 * ``InfoModelSelection``: Perform model selection using information theoretic criteria.
-* ``BayesParameterEstimation``: Perform Bayesian parameter estimation (estimate posterior density) via MCMC or IS.
+* ``BayesParameterEstimation``: Perform Bayesian parameter estimation (estimate posterior density) via MCMC, IS or
+  TMCMC.
 * ``BayesModelSelection``: Estimate model posterior probabilities.
 """
 
@@ -32,7 +33,7 @@ import numpy as np
 
 from UQpy.Distributions import Distribution, Normal, MVNormal
 from UQpy.RunModel import RunModel
-from UQpy.SampleMethods import MCMC, IS
+from UQpy.SampleMethods import MCMC, IS, TMCMC
 
 
 ########################################################################################################################
@@ -457,8 +458,9 @@ class BayesParameterEstimation:
     """
     Estimate the parameter posterior density given some data.
 
-    This class generates samples from the parameter posterior distribution using Markov Chain Monte Carlo or Importance
-    Sampling. It leverages the ``MCMC`` and ``IS`` classes from the ``SampleMethods`` module.
+    This class generates samples from the parameter posterior distribution using Markov Chain Monte Carlo, Importance
+    Sampling or transitional Markov Chain Monte Carlo. It leverages the ``MCMC``, ``IS`` and ``TMCMC`` classes from the
+    ``SampleMethods`` module.
 
 
     **Inputs:**
@@ -470,16 +472,20 @@ class BayesParameterEstimation:
         Available data, `ndarray` of shape consistent with log-likelihood function in ``InferenceModel``
 
     * **sampling_class** (class instance):
-        Class instance, must be a subclass of ``MCMC`` or ``IS``.
+        Class instance, must be a subclass of ``MCMC``, ``IS`` or ``TMCMC``.
 
     * **kwargs_sampler**:
-        Keyword arguments of the sampling class, see ``SampleMethods.MCMC`` or ``SampleMethods.IS``.
+        Keyword arguments of the sampling class, see ``SampleMethods.MCMC``, ``SampleMethods.IS`` or
+        ``SampleMethods.TMCMC``.
 
         Note on the seed for ``MCMC``: if input `seed` is not provided, a seed (`ndarray` of shape
         `(nchains, dimension)`) is sampled from the prior pdf, which must have an `rvs` method.
 
         Note on the proposal for ``IS``: if no input `proposal` is provided, the prior is used as proposal.
 
+        Note on ``TMCMC``: the prior of the inference model is used, and the log likelihood is evaluated for all the
+        samples of a stage at once with the ``evaluate_log_likelihood`` method of the ``InferenceModel``.
+
     * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
         Random seed used to initialize the pseudo-random number generator. Default is None.
 
@@ -522,7 +528,7 @@ class BayesParameterEstimation:
             raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
         self.verbose = verbose
 
-        from UQpy.SampleMethods import MCMC, IS
+        from UQpy.SampleMethods import MCMC, IS, TMCMC
         # MCMC algorithm
         if issubclass(sampling_class, MCMC):
             # If the seed is not provided, sample one from the prior pdf of the parameters
@@ -548,8 +554,16 @@ class BayesParameterEstimation:
                 log_pdf_target=self.inference_model.evaluate_log_posterior, args_target=(self.data, ),
                 random_state=self.random_state, verbose=self.verbose, nsamples=None, **kwargs_sampler)
 
+        elif issubclass(sampling_class, TMCMC):
+            if self.inference_model.prior is None:
+                raise NotImplementedError('UQpy: A prior must be provided for TMCMC.')
+            self.sampler = sampling_class(
+                log_likelihood=self.inference_model.evaluate_log_likelihood, args_likelihood=(self.data, ),
+                prior=self.inference_model.prior, random_state=self.random_state, verbose=self.verbose,
+                nsamples=None, **kwargs_sampler)
+
         else:
-            raise ValueError('UQpy: Sampling_class should be either a MCMC algorithm or IS.')
+            raise ValueError('UQpy: Sampling_class should be either a MCMC algorithm, IS or TMCMC.')
 
         # Run the analysis if a certain number of samples was provided
         if (nsamples is not None) or (nsamples_per_chain is not None):
@@ -565,7 +579,7 @@ class BayesParameterEstimation:
         **Inputs:**
 
         * **nsamples** (`int`):
-            Number of samples used in ``MCMC``/``IS``
+            Number of samples used in ``MCMC``/``IS``/``TMCMC``
 
         * **samples_per_chain** (`int`):
             Number of samples per chain used in ``MCMC``
@@ -575,13 +589,14 @@ class BayesParameterEstimation:
         if isinstance(self.sampler, MCMC):
             self.sampler.run(nsamples=nsamples, nsamples_per_chain=nsamples_per_chain)
 
-        elif isinstance(self.sampler, IS):
+        elif isinstance(self.sampler, (IS, TMCMC)):
             if nsamples_per_chain is not None:
-                raise ValueError('UQpy: nsamples_per_chain is not an appropriate input for IS.')
+                raise ValueError('UQpy: nsamples_per_chain is not an appropriate input for ' +
+                                 self.sampler.__class__.__name__ + '.')
             self.sampler.run(nsamples=nsamples)
 
         else:
-            raise ValueError('UQpy: sampling class should be a subclass of MCMC or IS')
+            raise ValueError('UQpy: sampling class should be a subclass of MCMC, IS or TMCMC')
 
         if self.verbose:
             print('UQpy: Parameter estimation with ' + self.sampler.__class__.__name__ + ' completed successfully!')
@@ -849,12 +864,15 @@ class BayesModelSelection:
 
     This class leverages the ``BayesParameterEstimation`` class to get samples from the parameter posterior densities.
     These samples are then used to compute the model evidence `p(data|model)` for all models and the model posterior
-    probabilities.
+    probabilities. If the ``TMCMC`` sampling class is used for a model, its evidence is obtained directly as a
+    by-product of the sampling.
 
     **References:**
 
     1. A.E. Raftery, M.A. Newton, J.M. Satagopan, and P.N. Krivitsky. "Estimating the integrated likelihood via
        posterior simulation using the harmonic mean identity". In Bayesian Statistics 8, pages 1–45, 2007.
+    2. J. Ching and Y.-C. Chen, "Transitional Markov chain Monte Carlo method for Bayesian model updating, model class
+       selection, and model averaging", Journal of Engineering Mechanics, 133(7):816–832, 2007.
 
     **Inputs:**
 
@@ -868,7 +886,8 @@ class BayesModelSelection:
         Prior probabilities of each model, default is [1/nmodels, ] * nmodels
 
     * **method_evidence_computation** (`str`):
-        as of v3, only the harmonic mean method is supported
+        as of v3, only the harmonic mean method is supported for ``MCMC`` and ``IS`` samplers. It is not used for
+        models sampled with ``TMCMC``, whose evidence is computed by the sampler.
 
     * **kwargs**:
         Keyword arguments to the ``BayesParameterEstimation`` class, for each model.
@@ -940,7 +959,9 @@ class BayesModelSelection:
             raise TypeError('UQpy: Extra inputs to model selection must be lists of length len(candidate_models)')
         for i, inference_model in enumerate(self.candidate_models):
             kwargs_i = dict([(key, value[i]) for (key, value) in kwargs.items()])
-            kwargs_i.update({'concat_chains': True, 'save_log_pdf': True})
+            sampling_class = kwargs_i.get('sampling_class', None)
+            if not (isinstance(sampling_class, type) and issubclass(sampling_class, TMCMC)):
+                kwargs_i.update({'concat_chains': True, 'save_log_pdf': True})
             bayes_estimator = BayesParameterEstimation(
                 inference_model=inference_model, data=self.data, verbose=self.verbose,
                 random_state=self.random_state, nsamples=None, nsamples_per_chain=None, **kwargs_i)
@@ -993,10 +1014,13 @@ class BayesModelSelection:
                 bayes_estimator.run(nsamples_per_chain=nsamples_per_chain[i])
             else:
                 raise ValueError('UQpy: ither nsamples or nsamples_per_chain should be non None')
-            self.evidences[i] = self._estimate_evidence(
-                method_evidence_computation=self.method_evidence_computation,
-                inference_model=inference_model, posterior_samples=bayes_estimator.sampler.samples,
-                log_posterior_values=bayes_estimator.sampler.log_pdf_values)
+            if isinstance(bayes_estimator.sampler, TMCMC):
+                self.evidences[i] = bayes_estimator.sampler.evidence
+            else:
+                self.evidences[i] = self._estimate_evidence(
+                    method_evidence_computation=self.method_evidence_computation,
+                    inference_model=inference_model, posterior_samples=bayes_estimator.sampler.samples,
+                    log_posterior_values=bayes_estimator.sampler.log_pdf_values)
 
         # Compute posterior probabilities
         self.probabilities = self._compute_posterior_probabilities(
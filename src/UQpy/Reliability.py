@@ -22,14 +22,20 @@ The module currently contains the following classes:
 - ``TaylorSeries``: Class to perform reliability analysis using First Order Reliability Method (FORM) and Second Order
   Reliability Method (SORM).
 - ``SubsetSimulation``: Class to perform reliability analysis using subset simulation.
+- ``DesignPointIS``: Class to perform reliability analysis using importance sampling around the FORM design point(s).
+- ``CrossEntropyIS``: Class to perform reliability analysis using adaptive (cross-entropy) importance sampling.
+- ``LineSampling``: Class to perform reliability analysis using line sampling.
+- ``DirectionalSimulation``: Class to perform reliability analysis using directional simulation.
 """
 
 import warnings
 from inspect import isclass
 
+from UQpy.Distributions import MVNormal, MVNormalMixture, VonMisesFisherNakagami
 from UQpy.RunModel import RunModel
-from UQpy.SampleMethods import MCMC, MMH
+from UQpy.SampleMethods import MCMC, MH, MMH, IS
 from UQpy.Transformations import *
+from UQpy.Utilities import gradient
 
 
 ########################################################################################################################
@@ -76,6 +82,44 @@ class SubsetSimulation:
     * **verbose** (Boolean):
         A boolean declaring whether to write text to the terminal.
 
+    * **block_size** (`int`)
+        Number of MCMC steps per chain proposed and evaluated together in each conditional level.
+
+        If `block_size` is provided, the chains of a conditional level are advanced in blocks: `block_size` candidate
+        states are drawn for every chain from its current state in a single call to the MCMC kernel, and all the
+        candidates that moved are evaluated in a single call to the ``RunModel`` object (which can run them in
+        parallel, see `ntasks`). The candidates of a chain are then processed sequentially; once a candidate is
+        accepted, the remaining candidates of that chain in the block were proposed from a state that is no longer
+        current and are discarded. The Markov chains are therefore identical in distribution to step-by-step
+        propagation, at the price of some additional model evaluations.
+
+        `block_size` requires a single-chain MCMC kernel (``MH`` or ``MMH``): the candidates of a chain are drawn
+        from copies of its current state, which ensemble kernels such as ``Stretch`` or ``DREAM`` would use to build
+        their moves.
+
+        Default: None (the chains are propagated one step at a time).
+
+    * **surrogate_object** (``Surrogates.Kriging`` object)
+        Kriging surrogate of the performance function used to pre-screen the proposed states.
+
+        If `surrogate_object` is provided, it is refit at the beginning of each conditional level on the model
+        evaluations closest to the current threshold, and proposed states whose prediction is confidently above the
+        threshold, i.e. `mean - surrogate_nstd * std > g_level`, are rejected without evaluating the model. Only the
+        remaining states are evaluated with the ``RunModel`` object. Screening saves model evaluations for smooth
+        performance functions but introduces an approximation: a state wrongly screened out is rejected.
+
+        Default: None (every proposed state that moved is evaluated with the model).
+
+    * **surrogate_nstd** (`float`)
+        Number of predicted standard deviations defining a confident prediction for the surrogate pre-screening.
+
+        Default: 3
+
+    * **surrogate_ntrain** (`int`)
+        Maximum number of model evaluations used to fit the surrogate at each conditional level.
+
+        Default: 200
+
     * **mcmc_kwargs** (`dict`)
         Any additional keyword arguments needed for the specific ``MCMC`` class.
 
@@ -99,12 +143,20 @@ class SubsetSimulation:
     * **cov2** (`float`)
         Coefficient of variation of the probability of failure estimate with dependent chains. From [4]_
 
+    * **acceptance_rate** (`list`)
+        Mean acceptance rate of the MCMC chains in each conditional level.
+
+    * **nscreened** (`list`)
+        Number of proposed states rejected by the surrogate pre-screening in each conditional level (only if
+        `surrogate_object` is provided).
+
 
     **Methods:**
     """
 
     def __init__(self, runmodel_object, mcmc_class=MMH, samples_init=None, p_cond=0.1, nsamples_per_ss=1000,
-                 max_level=10, verbose=False, **mcmc_kwargs):
+                 max_level=10, verbose=False, block_size=None, surrogate_object=None, surrogate_nstd=3,
+                 surrogate_ntrain=200, **mcmc_kwargs):
 
         # Store the MCMC object to create a new object of this type for each subset
         self.mcmc_kwargs = mcmc_kwargs
@@ -117,6 +169,10 @@ class SubsetSimulation:
         self.nsamples_per_ss = nsamples_per_ss
         self.max_level = max_level
         self.verbose = verbose
+        self.block_size = block_size
+        self.surrogate_object = surrogate_object
+        self.surrogate_nstd = surrogate_nstd
+        self.surrogate_ntrain = surrogate_ntrain
 
         # Check that a RunModel object is being passed in.
         if not isinstance(self.runmodel_object, RunModel):
@@ -143,6 +199,10 @@ class SubsetSimulation:
         self.samples = list()
         self.g = list()
         self.g_level = list()
+        self.acceptance_rate = list()
+        self.nscreened = list()
+        self._train_samples = list()
+        self._train_g = list()
 
         if self.verbose:
             print('UQpy: Running Subset Simulation with MCMC of type: ' + str(type(mcmc_object)))
@@ -189,13 +249,18 @@ class SubsetSimulation:
                           'distribution.')
             self.mcmc_objects[0].run(nsamples=self.nsamples_per_ss)
             self.samples.append(self.mcmc_objects[0].samples)
+            self.acceptance_rate.append(np.mean(self.mcmc_objects[0].acceptance_rate))
         else:
             self.samples.append(self.samples_init)
+            self.acceptance_rate.append(np.nan)
 
         # Run the model for the initial samples, sort them by their performance function, and identify the
         # conditional level
         self.runmodel_object.run(samples=np.atleast_2d(self.samples[step]))
         self.g.append(np.squeeze(self.runmodel_object.qoi_list))
+        if self.surrogate_object is not None:
+            self._train_samples.append(np.atleast_2d(self.samples[step]))
+            self._train_g.append(np.atleast_1d(self.g[step]))
         g_ind = np.argsort(self.g[step])
         self.g_level.append(self.g[step][g_ind[n_keep - 1]])
 
@@ -218,6 +283,32 @@ class SubsetSimulation:
             self.g.append(np.zeros_like(self.g[step - 1]))
             self.g[step][:n_keep] = self.g[step - 1][g_ind[:n_keep]]
 
+            if self.surrogate_object is not None:
+                self._fit_surrogate(step)
+                self.nscreened.append(0)
+
+            if self.block_size is not None:
+                # Propagate the chains in blocks of candidates evaluated together
+                n_prop_test = self.nsamples_per_ss / n_keep
+                if n_prop_test.is_integer():
+                    n_prop = self.nsamples_per_ss // n_keep
+                else:
+                    raise AttributeError(
+                        'UQpy: The number of samples per subset (nsamples_per_ss) must be an integer multiple of '
+                        'the number of MCMC chains.')
+                rate = self._run_level_blocks(step, n_keep, n_prop)
+                self.acceptance_rate.append(np.mean(rate))
+                g_ind = np.argsort(self.g[step])
+                self.g_level.append(self.g[step][g_ind[n_keep]])
+
+                d1, d2 = self._cov_sus(step)
+                d12.append(d1 ** 2)
+                d22.append(d2 ** 2)
+
+                if self.verbose:
+                    print('UQpy: Subset Simulation, conditional level ' + str(step) + ' complete.')
+                continue
+
             # Unpack the attributes
 
             # Initialize a new MCMC object for each conditional level
@@ -247,40 +338,28 @@ class SubsetSimulation:
                 # Decide whether a new simulation is needed for each proposed state
                 a = self.mcmc_objects[step].samples[i * n_keep:(i + 1) * n_keep, :]
                 b = self.mcmc_objects[step].samples[(i + 1) * n_keep:(i + 2) * n_keep, :]
-                test1 = np.equal(a, b)
-                test = np.logical_and(test1[:, 0], test1[:, 1])
-
-                # Pull out the indices of the false values in the test list
-                ind_false = [i for i, val in enumerate(test) if not val]
-                # Pull out the indices of the true values in the test list
-                ind_true = [i for i, val in enumerate(test) if val]
-
-                # Do not run the model for those samples where the MCMC state remains unchanged.
-                self.samples[step][[x + (i + 1) * n_keep for x in ind_true], :] = \
-                    self.mcmc_objects[step].samples[ind_true, :]
-                self.g[step][[x + (i + 1) * n_keep for x in ind_true]] = self.g[step][ind_true]
-
-                # Run the model at each of the new sample points
-                x_run = self.mcmc_objects[step].samples[[x + (i + 1) * n_keep for x in ind_false], :]
+                moved = np.any(a != b, axis=1)
+
+                # By default each chain remains at its current state
+                rows = np.arange((i + 1) * n_keep, (i + 2) * n_keep)
+                self.samples[step][rows] = self.samples[step][rows - n_keep]
+                self.g[step][rows] = self.g[step][rows - n_keep]
+
+                # Run the model only at the new sample points, and accept the states with g <= g_level
+                rows_run = rows[moved]
+                x_run = b[moved]
+                if self.surrogate_object is not None and x_run.size != 0:
+                    ambiguous = self._screen(x_run, step)
+                    rows_run, x_run = rows_run[ambiguous], x_run[ambiguous]
                 if x_run.size != 0:
-                    self.runmodel_object.run(samples=x_run)
+                    g_temp = self._evaluate(x_run)
 
-                    # Temporarily save the latest model runs
-                    g_temp = np.asarray(self.runmodel_object.qoi_list[-len(x_run):])
-
-                    # Accept the states with g <= g_level
-                    ind_accept = np.where(g_temp <= self.g_level[step - 1])[0]
-                    for ii in ind_accept:
-                        self.samples[step][(i + 1) * n_keep + ind_false[ii]] = x_run[ii]
-                        self.g[step][(i + 1) * n_keep + ind_false[ii]] = g_temp[ii]
-
-                    # Reject the states with g > g_level
-                    ind_reject = np.where(g_temp > self.g_level[step - 1])[0]
-                    for ii in ind_reject:
-                        self.samples[step][(i + 1) * n_keep + ind_false[ii]] = \
-                            self.samples[step][i * n_keep + ind_false[ii]]
-                        self.g[step][(i + 1) * n_keep + ind_false[ii]] = self.g[step][i * n_keep + ind_false[ii]]
+                    accept = g_temp <= self.g_level[step - 1]
+                    rows_accept = rows_run[accept]
+                    self.samples[step][rows_accept] = x_run[accept]
+                    self.g[step][rows_accept] = g_temp[accept]
 
+            self.acceptance_rate.append(np.mean(self.mcmc_objects[step].acceptance_rate))
             g_ind = np.argsort(self.g[step])
             self.g_level.append(self.g[step][g_ind[n_keep]])
 
@@ -300,6 +379,192 @@ class SubsetSimulation:
 
         return pf, cov1, cov2
 
+    def _run_level_blocks(self, step, n_keep, n_prop):
+        """
+        Propagate the chains of a conditional level in blocks of candidates
+
+        This is an instance method that fills the samples and performance function values of conditional level `step`
+        when `block_size` is provided. At each block, `block_size` candidates are drawn for each chain from its current
+        state, all candidates that moved are evaluated with a single call to the ``RunModel`` object, and each chain
+        consumes its candidates up to (and including) the first one that falls in the conditional level.
+
+        **Input:**
+
+        :param step: Current conditional level
+        :type step: int
+
+        :param n_keep: Number of Markov chains in the conditional level
+        :type n_keep: int
+
+        :param n_prop: Number of samples of each Markov chain in the conditional level
+        :type n_prop: int
+
+        **Output/Returns:**
+
+        :param rate: Acceptance rate of the MCMC kernel for each chain
+        :type rate: numpy array
+        """
+
+        states = self.samples[step][:n_keep].copy()
+        g_states = self.g[step][:n_keep].copy()
+        filled = np.ones(n_keep, dtype=int)
+        n_moved = np.zeros(n_keep)
+        n_steps = np.zeros(n_keep)
+
+        while np.any(filled < n_prop):
+            chains = np.nonzero(filled < n_prop)[0]
+            remaining = n_prop - filled[chains]
+            nblock = int(min(self.block_size, np.max(remaining)))
+
+            candidates = self._draw_candidates(states[chains], nblock, first_block=(len(self.mcmc_objects) == step))
+            position = np.arange(nblock)[np.newaxis, :]
+            usable = position < remaining[:, np.newaxis]
+            moved = np.any(candidates != states[chains][:, np.newaxis, :], axis=2) & usable
+
+            # Evaluate all the candidates that moved (and are not screened out) with a single model call
+            run = moved.copy()
+            if self.surrogate_object is not None and np.any(moved):
+                run[moved] = self._screen(candidates[moved], step)
+            g_candidates = np.full(moved.shape, np.inf)
+            if np.any(run):
+                g_candidates[run] = self._evaluate(candidates[run])
+            accept = run & (g_candidates <= self.g_level[step - 1])
+
+            # Each chain consumes its candidates up to the first accepted one
+            first = np.where(np.any(accept, axis=1), np.argmax(accept, axis=1), nblock)
+            n_used = np.minimum(np.minimum(first + 1, nblock), remaining)
+            used = position < n_used[:, np.newaxis]
+            is_first = (position == first[:, np.newaxis])
+
+            rows = (filled[chains][:, np.newaxis] + position) * n_keep + chains[:, np.newaxis]
+            new_samples = np.where(is_first[..., np.newaxis], candidates, states[chains][:, np.newaxis, :])
+            new_g = np.where(is_first, g_candidates, g_states[chains][:, np.newaxis])
+            self.samples[step][rows[used]] = new_samples[used]
+            self.g[step][rows[used]] = new_g[used]
+
+            accepted = first < n_used
+            states[chains[accepted]] = candidates[accepted, first[accepted]]
+            g_states[chains[accepted]] = g_candidates[accepted, first[accepted]]
+            n_moved[chains] += np.sum(moved & used, axis=1)
+            n_steps[chains] += n_used
+            filled[chains] += n_used
+
+        return n_moved / n_steps
+
+    def _evaluate(self, samples):
+        """
+        Evaluate the performance function at new samples
+
+        This is an instance method that runs the model at the given samples and, if a surrogate is used, stores the
+        evaluations as training data for the surrogate.
+
+        **Input:**
+
+        :param samples: Samples at which to evaluate the model
+        :type samples: numpy array
+
+        **Output/Returns:**
+
+        :param g: Performance function values at the samples
+        :type g: numpy array
+        """
+
+        self.runmodel_object.run(samples=samples)
+        g = np.asarray(self.runmodel_object.qoi_list[-len(samples):], dtype=float).reshape(-1)
+        if self.surrogate_object is not None:
+            self._train_samples.append(samples)
+            self._train_g.append(g)
+
+        return g
+
+    def _fit_surrogate(self, step):
+        """
+        Fit the surrogate on the model evaluations closest to the current threshold
+
+        This is an instance method that refits `surrogate_object` at the beginning of conditional level `step` using
+        the (at most `surrogate_ntrain`) distinct model evaluations whose performance function is closest to the
+        threshold of the previous level.
+
+        **Input:**
+
+        :param step: Current conditional level
+        :type step: int
+        """
+
+        x_train = np.concatenate(self._train_samples, axis=0)
+        g_train = np.concatenate(self._train_g)
+        self._train_samples, self._train_g = [x_train], [g_train]
+
+        x_train, ind = np.unique(x_train, axis=0, return_index=True)
+        g_train = g_train[ind]
+        ind = np.argsort(np.abs(g_train - self.g_level[step - 1]))[:self.surrogate_ntrain]
+        self.surrogate_object.fit(x_train[ind], g_train[ind])
+
+    def _screen(self, samples, step):
+        """
+        Pre-screen proposed states with the surrogate
+
+        This is an instance method that identifies the proposed states whose surrogate prediction is not confidently
+        above the threshold of the previous level. The other states are counted in `nscreened`.
+
+        **Input:**
+
+        :param samples: Proposed states
+        :type samples: numpy array
+
+        :param step: Current conditional level
+        :type step: int
+
+        **Output/Returns:**
+
+        :param ambiguous: Boolean array, True for the states that must be evaluated with the model
+        :type ambiguous: numpy array
+        """
+
+        g_mean, g_std = self.surrogate_object.predict(samples, return_std=True)
+        g_mean, g_std = np.reshape(g_mean, -1), np.reshape(g_std, -1)
+        ambiguous = g_mean - self.surrogate_nstd * g_std <= self.g_level[step - 1]
+        self.nscreened[step - 1] += int(np.count_nonzero(~ambiguous))
+
+        return ambiguous
+
+    def _draw_candidates(self, states, nblock, first_block=False):
+        """
+        Draw candidate states from the MCMC kernel
+
+        This is an instance method that draws `nblock` independent transitions of the MCMC kernel from each state, using
+        a single iteration of an object of class `mcmc_class` seeded with `nblock` copies of each state. The chains of a
+        single-chain kernel (``MH`` or ``MMH``) are propagated independently, so the copies do not interact.
+
+        **Input:**
+
+        :param states: Current states of the chains
+        :type states: numpy array
+
+        :param nblock: Number of candidates per chain
+        :type nblock: int
+
+        :param first_block: If True, the MCMC object is stored in `mcmc_objects`
+        :type first_block: bool
+
+        **Output/Returns:**
+
+        :param candidates: Candidate states of shape (nchains, nblock, dimension)
+        :type candidates: numpy array
+        """
+
+        mcmc_kwargs = dict(self.mcmc_kwargs)
+        for key in ['nchains', 'nsamples', 'nsamples_per_chain']:
+            mcmc_kwargs.pop(key, None)
+        mcmc_kwargs.update(seed=np.repeat(states, nblock, axis=0), nburn=0, jump=1, concat_chains=False,
+                           random_state=self.random_state)
+        mcmc_object = self.mcmc_class(**mcmc_kwargs)
+        mcmc_object.run(nsamples_per_chain=2)
+        if first_block:
+            self.mcmc_objects.append(mcmc_object)
+
+        return mcmc_object.samples[1].reshape((states.shape[0], nblock, -1))
+
     # -----------------------------------------------------------------------------------------------------------------------
     # Support functions for subset simulation
 
@@ -338,6 +603,17 @@ class SubsetSimulation:
         if type(self.max_level).__name__ != 'int':
             raise AttributeError('UQpy: The maximum subset level (max_level) must be integer valued.')
 
+        # Check that block_size is a positive integer
+        if self.block_size is not None and (not isinstance(self.block_size, int) or self.block_size < 1):
+            raise AttributeError('UQpy: The block size (block_size) must be a positive integer.')
+        if self.block_size is not None and not issubclass(self.mcmc_class, (MH, MMH)):
+            raise ValueError('UQpy: block_size requires a single-chain MCMC kernel, i.e. mcmc_class MH or MMH.')
+
+        # Check that the surrogate can be fit and used for prediction
+        if self.surrogate_object is not None and not (hasattr(self.surrogate_object, 'fit') and
+                                                      hasattr(self.surrogate_object, 'predict')):
+            raise AttributeError('UQpy: surrogate_object must have fit and predict methods, e.g. a Kriging object.')
+
     def _cov_sus(self, step):
 
         """
@@ -450,22 +726,18 @@ class SubsetSimulation:
 
         """
 
-        beta = 0
-        for i in range(np.shape(g)[1]):
-            for j in range(i + 1, np.shape(g)[1]):
-                if g[0, i] == g[0, j]:
-                    beta = beta + 1
-        beta = beta * 2
+        n_s, n_c = np.shape(g)
+
+        # Count the pairs of seeds with identical performance function values by grouping the sorted values
+        _, counts = np.unique(g[0, :], return_counts=True)
+        beta = np.sum(counts * (counts - 1))
 
-        ar = np.asarray(self.mcmc_objects[step].acceptance_rate)
-        ar_mean = np.mean(ar)
+        ar_mean = self.acceptance_rate[step]
 
-        factor = 0
-        for i in range(np.shape(g)[0] - 1):
-            factor = factor + (1 - (i + 1) * np.shape(g)[0] / np.shape(g)[1]) * (1 - ar_mean)
-        factor = factor * 2 + 1
+        lags = np.arange(1, n_s)
+        factor = 2 * np.sum((1 - lags * n_s / n_c) * (1 - ar_mean)) + 1
 
-        beta = beta / np.shape(g)[1] * factor
+        beta = beta / n_c * factor
 
         return beta
 
@@ -591,6 +863,9 @@ class TaylorSeries:
         A method to estimate the derivatives (1st-order, 2nd-order, mixed) of a function using a central difference
         scheme after transformation to the standard normal space.
 
+        The complete finite difference stencil is built in the standard normal space, transformed to the parameter
+        space with a single call to the ``Nataf`` object and evaluated with a single call to the ``RunModel`` object.
+
         This is a static method of the ``FORM`` class.
 
         **Inputs:**
@@ -616,7 +891,7 @@ class TaylorSeries:
             An object of the ``Nataf`` class (see ``Nataf`` class).
 
         * **order** (`str`):
-            Order of the derivative. Available options: 'first', 'second', 'mixed'.
+            Order of the derivative. Available options: 'first', 'second' (second-order and mixed derivatives).
 
             Default: 'first'.
 
@@ -636,140 +911,60 @@ class TaylorSeries:
         * **du_dj** (`ndarray`):
             Vector of first-order derivatives (if order = 'first').
 
-        * **d2u_dj** (`ndarray`):
-            Vector of second-order derivatives (if order = 'second').
+        * **qoi** (`float`):
+            Model evaluated at `point_x` (if order = 'first').
 
-        * **d2u_dij** (`ndarray`):
-            Vector of mixed derivatives (if order = 'mixed').
+        * **hessian** (`ndarray`):
+            Matrix of second-order and mixed derivatives (if order = 'second').
 
         """
 
-        list_of_samples = list()
-        if order.lower() == 'first' or (order.lower() == 'second' and point_qoi is None):
-            list_of_samples.append(point_x.reshape(1, -1))
-
-        for ii in range(point_u.shape[0]):
-            y_i1_j = point_u.tolist()
-            y_i1_j[ii] = y_i1_j[ii] + df_step
-
-            z_i1_j = Correlate(np.array(y_i1_j).reshape(1, -1), nataf_object.corr_z).samples_z
-            nataf_object.run(samples_z=z_i1_j.reshape(1, -1), jacobian=False)
-            temp_x_i1_j = nataf_object.samples_x
-            x_i1_j = temp_x_i1_j
-            list_of_samples.append(x_i1_j)
-
-            y_1i_j = point_u.tolist()
-            y_1i_j[ii] = y_1i_j[ii] - df_step
-            z_1i_j = Correlate(np.array(y_1i_j).reshape(1, -1), nataf_object.corr_z).samples_z
-            nataf_object.run(samples_z=z_1i_j.reshape(1, -1), jacobian=False)
-            temp_x_1i_j = nataf_object.samples_x
-            x_1i_j = temp_x_1i_j
-            list_of_samples.append(x_1i_j)
+        if order.lower() not in ['first', 'second']:
+            raise ValueError("UQpy: order must be either 'first' or 'second'.")
 
-        array_of_samples = np.array(list_of_samples)
-        array_of_samples = array_of_samples.reshape((len(array_of_samples), -1))
+        order = order.lower()
+        point_u = np.asarray(point_u, dtype=float).reshape(1, -1)
+        qoi_point = []
 
-        runmodel_object.run(samples=array_of_samples, append_samples=False)
-        if verbose:
-            print('samples to evaluate the model: {0}'.format(array_of_samples))
-            print('model evaluations: {0}'.format(runmodel_object.qoi_list))
+        def evaluate(stencil_u):
+            # Transform the whole stencil from U to X with a single Nataf call and evaluate it with a single model call.
+            run = np.ones(stencil_u.shape[0], dtype=bool)
+            if order == 'second' and point_qoi is not None:
+                # The model value at the point is known, so the center of the stencil is not evaluated again.
+                run = np.any(stencil_u != point_u, axis=1)
 
-        if order.lower() == 'first':
-            gradient = np.zeros(point_u.shape[0])
+            stencil_z = Correlate(stencil_u[run], nataf_object.corr_z).samples_z
+            nataf_object.run(samples_z=stencil_z, jacobian=False)
+            array_of_samples = nataf_object.samples_x
+            if order == 'first':
+                array_of_samples = np.vstack([np.asarray(point_x).reshape(1, -1), array_of_samples])
 
-            for jj in range(point_u.shape[0]):
-                qoi_plus = runmodel_object.qoi_list[2 * jj + 1]
-                qoi_minus = runmodel_object.qoi_list[2 * jj + 2]
-                gradient[jj] = ((qoi_plus - qoi_minus) / (2 * df_step))
-
-            return gradient, runmodel_object.qoi_list[0]
-
-        elif order.lower() == 'second':
+            runmodel_object.run(samples=array_of_samples, append_samples=False)
             if verbose:
-                print('UQpy: Calculating second order derivatives..')
-            d2y_dj = np.zeros([point_u.shape[0]])
-
-            if point_qoi is None:
-                qoi = [runmodel_object.qoi_list[0]]
-                output_list = runmodel_object.qoi_list
-            else:
-                qoi = [point_qoi]
-                output_list = qoi + runmodel_object.qoi_list
-
-            for jj in range(point_u.shape[0]):
-                qoi_plus = output_list[2 * jj + 1]
-                qoi_minus = output_list[2 * jj + 2]
-
-                d2y_dj[jj] = ((qoi_minus - 2 * qoi[0] + qoi_plus) / (df_step ** 2))
+                print('samples to evaluate the model: {0}'.format(array_of_samples))
+                print('model evaluations: {0}'.format(runmodel_object.qoi_list))
 
-            list_of_mixed_points = list()
-            import itertools
-            range_ = list(range(point_u.shape[0]))
-            d2y_dij = np.zeros([int(point_u.shape[0] * (point_u.shape[0] - 1) / 2)])
-            count = 0
-            for i in itertools.combinations(range_, 2):
-                y_i1_j1 = point_u.tolist()
-                y_i1_1j = point_u.tolist()
-                y_1i_j1 = point_u.tolist()
-                y_1i_1j = point_u.tolist()
+            qoi = np.array(runmodel_object.qoi_list, dtype=float).flatten()
+            if order == 'first':
+                qoi_point.append(runmodel_object.qoi_list[0])
+                qoi = qoi[1:]
 
-                y_i1_j1[i[0]] += df_step
-                y_i1_j1[i[1]] += df_step
+            qoi_stencil = np.zeros(stencil_u.shape[0])
+            qoi_stencil[run] = qoi
+            if not np.all(run):
+                qoi_stencil[~run] = np.asarray(point_qoi, dtype=float).flatten()[0]
+            return qoi_stencil
 
-                y_i1_1j[i[0]] += df_step
-                y_i1_1j[i[1]] -= df_step
-
-                y_1i_j1[i[0]] -= df_step
-                y_1i_j1[i[1]] += df_step
-
-                y_1i_1j[i[0]] -= df_step
-                y_1i_1j[i[1]] -= df_step
-
-                z_i1_j1 = Correlate(np.array(y_i1_j1).reshape(1, -1), nataf_object.corr_z).samples_z
-                nataf_object.run(samples_z=z_i1_j1.reshape(1, -1), jacobian=False)
-                x_i1_j1 = nataf_object.samples_x
-                list_of_mixed_points.append(x_i1_j1)
-
-                z_i1_1j = Correlate(np.array(y_i1_1j).reshape(1, -1), nataf_object.corr_z).samples_z
-                nataf_object.run(samples_z=z_i1_1j.reshape(1, -1), jacobian=False)
-                x_i1_1j = nataf_object.samples_x
-                list_of_mixed_points.append(x_i1_1j)
-
-                z_1i_j1 = Correlate(np.array(y_1i_j1).reshape(1, -1), nataf_object.corr_z).samples_z
-                nataf_object.run(samples_z=z_1i_j1.reshape(1, -1), jacobian=False)
-                x_1i_j1 = nataf_object.samples_x
-                list_of_mixed_points.append(x_1i_j1)
-
-                z_1i_1j = Correlate(np.array(y_1i_1j).reshape(1, -1), nataf_object.corr_z).samples_z
-                nataf_object.run(samples_z=z_1i_1j.reshape(1, -1), jacobian=False)
-                x_1i_1j = nataf_object.samples_x
-                list_of_mixed_points.append(x_1i_1j)
-
-                count = count + 1
-
-            array_of_mixed_points = np.array(list_of_mixed_points)
-            array_of_mixed_points = array_of_mixed_points.reshape((len(array_of_mixed_points), -1))
-            runmodel_object.run(samples=array_of_mixed_points, append_samples=False)
+        if order == 'first':
+            du_dj = gradient(runmodel_object=evaluate, point=point_u, order='first', df_step=df_step,
+                             scheme='central')[0]
+            return du_dj, qoi_point[0]
 
+        else:
             if verbose:
-                print('samples for gradient: {0}'.format(array_of_mixed_points[1:]))
-                print('model evaluations for the gradient: {0}'.format(runmodel_object.qoi_list[1:]))
-
-            for j in range(count):
-                qoi_0 = runmodel_object.qoi_list[4 * j]
-                qoi_1 = runmodel_object.qoi_list[4 * j + 1]
-                qoi_2 = runmodel_object.qoi_list[4 * j + 2]
-                qoi_3 = runmodel_object.qoi_list[4 * j + 3]
-                d2y_dij[j] = ((qoi_0 + qoi_3 - qoi_1 - qoi_2) / (4 * df_step * df_step))
-
-            hessian = np.diag(d2y_dj)
-            import itertools
-            range_ = list(range(point_u.shape[0]))
-            add_ = 0
-            for i in itertools.combinations(range_, 2):
-                hessian[i[0], i[1]] = d2y_dij[add_]
-                hessian[i[1], i[0]] = hessian[i[0], i[1]]
-                add_ += 1
+                print('UQpy: Calculating second order derivatives..')
+            hessian = gradient(runmodel_object=evaluate, point=point_u, order='hessian', df_step=df_step,
+                               scheme='central')[0]
 
             return hessian
 
@@ -826,6 +1021,13 @@ class FORM(TaylorSeries):
     * **error_record** (`list`):
         Record of the error defined by criteria `e1, e2, e3`.
 
+    * **beta_seeds** (`ndarray`):
+        Hasofer-Lind reliability index of each seed (rows) and limit state (columns) computed by ``run_batch``. Seeds
+        that did not converge are `nan`.
+
+    * **iterations_seeds** (`ndarray`):
+        Number of iterations of each seed (rows) and limit state (columns) computed by ``run_batch``.
+
     **Methods:**
 
      """
@@ -866,6 +1068,8 @@ class FORM(TaylorSeries):
         self.alpha_record = None
         self.beta_record = None
         self.jzx = None
+        self.beta_seeds = None
+        self.iterations_seeds = None
 
         self.call = None
 
@@ -896,7 +1100,7 @@ class FORM(TaylorSeries):
             self.nataf_object.run(samples_x=seed_x.reshape(1, -1), jacobian=False)
             seed_z = self.nataf_object.samples_z
             from UQpy.Transformations import Decorrelate
-            seed = Decorrelate(seed_z, self.nataf_object.corr_z)
+            seed = Decorrelate(seed_z, self.nataf_object.corr_z).samples_u
         elif seed_u is not None and seed_x is None:
             seed = np.squeeze(seed_u)
         else:
@@ -965,76 +1169,15 @@ class FORM(TaylorSeries):
 
             u[k + 1, :] = -beta[k + 1] * self.alpha
 
-            if (self.tol1 is not None) and (self.tol2 is not None) and (self.tol3 is not None):
-                error1 = np.linalg.norm(u[k + 1, :] - u[k, :])
-                error2 = np.linalg.norm(beta[k + 1] - beta[k])
-                error3 = np.linalg.norm(dg_u_record[k + 1, :] - dg_u_record[k, :])
-                error_record.append([error1, error2, error3])
-                if error1 <= self.tol1 and error2 <= self.tol2 and error3 < self.tol3:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            if (self.tol1 is None) and (self.tol2 is None) and (self.tol3 is None):
-                error1 = np.linalg.norm(u[k + 1, :] - u[k, :])
-                error2 = np.linalg.norm(beta[k + 1] - beta[k])
-                error3 = np.linalg.norm(dg_u_record[k + 1, :] - dg_u_record[k, :])
-                error_record.append([error1, error2, error3])
-                if error1 <= 1e-3 or error2 <= 1e-3 or error3 < 1e-3:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            elif (self.tol1 is not None) and (self.tol2 is None) and (self.tol3 is None):
-                error1 = np.linalg.norm(u[k + 1, :] - u[k, :])
-                error_record.append(error1)
-                if error1 <= self.tol1:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            elif (self.tol1 is None) and (self.tol2 is not None) and (self.tol3 is None):
-                error2 = np.linalg.norm(beta[k + 1] - beta[k])
-                error_record.append(error2)
-                if error2 <= self.tol2:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            elif (self.tol1 is None) and (self.tol2 is None) and (self.tol3 is not None):
-                error3 = np.linalg.norm(dg_u_record[k + 1, :] - dg_u_record[k, :])
-                error_record.append(error3)
-                if error3 < self.tol3:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            elif (self.tol1 is not None) and (self.tol2 is not None) and (self.tol3 is None):
-                error1 = np.linalg.norm(u[k + 1, :] - u[k, :])
-                error2 = np.linalg.norm(beta[k + 1] - beta[k])
-                error_record.append([error1, error2])
-                if error1 <= self.tol1 and error2 <= self.tol1:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            elif (self.tol1 is not None) and (self.tol2 is None) and (self.tol3 is not None):
-                error1 = np.linalg.norm(u[k + 1, :] - u[k, :])
-                error3 = np.linalg.norm(dg_u_record[k + 1, :] - dg_u_record[k, :])
-                error_record.append([error1, error3])
-                if error1 <= self.tol1 and error3 < self.tol3:
-                    conv_flag = True
-                else:
-                    k = k + 1
-
-            elif (self.tol1 is None) and (self.tol2 is not None) and (self.tol3 is not None):
-                error2 = np.linalg.norm(beta[k + 1] - beta[k])
-                error3 = np.linalg.norm(dg_u_record[k + 1, :] - dg_u_record[k, :])
-                error_record.append([error2, error3])
-                if error2 <= self.tol2 and error3 < self.tol3:
-                    conv_flag = True
-                else:
-                    k = k + 1
+            error1 = np.linalg.norm(u[k + 1, :] - u[k, :])
+            error2 = np.linalg.norm(beta[k + 1] - beta[k])
+            error3 = np.linalg.norm(dg_u_record[k + 1, :] - dg_u_record[k, :])
+            converged, error = self._check_convergence(error1, error2, error3)
+            error_record.append(error)
+            if converged:
+                conv_flag = True
+            else:
+                k = k + 1
 
             if self.verbose:
                 print('Error:', error_record[-1])
@@ -1079,6 +1222,194 @@ class FORM(TaylorSeries):
                 self.alpha_record = self.alpha_record + [alpha_record]
             self.call = True
 
+    def run_batch(self, seeds_u=None, seeds_x=None, nseeds=None, random_state=None):
+        """
+        Run FORM for several seeds and several limit states in lock-step.
+
+        The `HLRF` iterations of all (seed, limit state) pairs are advanced together. At every iteration the gradient
+        stencils of all distinct iteration points are transformed with a single ``Nataf`` call and evaluated with a
+        single call to the ``RunModel`` object, so that the model evaluations of all iterations can run in parallel.
+        The model may return a vector of limit state values for each sample, in which case each component is treated
+        as a separate limit state.
+
+        For each limit state, the converged design point with the smallest reliability index is retained and appended
+        to the attributes of the ``FORM`` object (`beta_form`, `DesignPoint_U`, `DesignPoint_X`, `Pf_form`, ...).
+
+        **Input:**
+
+        * **seeds_u** or **seeds_x** (`ndarray`):
+            Starting points of shape ``(nseeds, dimension)`` in the uncorrelated standard normal space **U** or in the
+            parameter space **X**.
+
+        * **nseeds** (`int`):
+            Number of seeds to draw if neither `seeds_u` nor `seeds_x` is provided. The first seed is the origin of
+            the standard normal space and the others are drawn from the standard normal distribution.
+
+            Default: 1
+
+        * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+            Random seed used to draw the seeds.
+
+        """
+        if seeds_u is not None and seeds_x is not None:
+            raise ValueError('UQpy: Only one of seeds_x or seeds_u must be provided')
+        elif seeds_u is not None:
+            seeds = np.atleast_2d(np.asarray(seeds_u, dtype=float))
+        elif seeds_x is not None:
+            self.nataf_object.run(samples_x=np.atleast_2d(seeds_x), jacobian=False)
+            seeds = np.atleast_2d(Decorrelate(self.nataf_object.samples_z, self.nataf_object.corr_z).samples_u)
+        else:
+            if nseeds is None:
+                nseeds = 1
+            if isinstance(random_state, int):
+                random_state = np.random.RandomState(random_state)
+            elif not isinstance(random_state, (type(None), np.random.RandomState)):
+                raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+            seeds = stats.norm.rvs(size=(nseeds, self.dimension), random_state=random_state)
+            seeds[0, :] = 0.
+        seeds = seeds.reshape(-1, self.dimension)
+        nseeds = seeds.shape[0]
+
+        df_step = 0.01 if self.df_step is None else self.df_step
+        # Central difference stencil: the point itself, followed by the forward and the backward steps
+        offsets = np.vstack([np.zeros((1, self.dimension)), df_step * np.eye(self.dimension),
+                             -df_step * np.eye(self.dimension)])
+
+        def evaluate(points_u):
+            # Evaluate the limit states and their gradients at all points with one Nataf and one model call.
+            stencil_u = (points_u[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, self.dimension)
+            stencil_z = Correlate(stencil_u, self.nataf_object.corr_z).samples_z
+            self.nataf_object.run(samples_z=stencil_z, jacobian=False)
+            stencil_x = self.nataf_object.samples_x
+            self.runmodel_object.run(samples=stencil_x, append_samples=False)
+            qoi = np.array(self.runmodel_object.qoi_list, dtype=float).reshape(points_u.shape[0], offsets.shape[0],
+                                                                               -1)
+            grad = np.swapaxes(qoi[:, 1:self.dimension + 1, :] - qoi[:, self.dimension + 1:, :], 1, 2) / (2 * df_step)
+            return qoi[:, 0, :], grad, stencil_x.reshape(points_u.shape[0], offsets.shape[0], -1)[:, 0, :]
+
+        if self.verbose:
+            print('UQpy: Running FORM for {0} seeds...'.format(nseeds))
+
+        # The limit states are identified from the model output at the seeds.
+        g_seeds, dg_seeds, x_seeds = evaluate(seeds)
+        nlimit = g_seeds.shape[1]
+        nchains = nseeds * nlimit
+        seed_index = np.repeat(np.arange(nseeds), nlimit)
+        limit_index = np.tile(np.arange(nlimit), nseeds)
+
+        u = np.zeros((self.n_iter + 1, nchains, self.dimension))
+        x = np.zeros((self.n_iter + 1, nchains, self.dimension))
+        g = np.zeros((self.n_iter + 1, nchains))
+        dg_u = np.zeros((self.n_iter + 1, nchains, self.dimension))
+        alpha = np.zeros((self.n_iter + 1, nchains, self.dimension))
+        beta = np.zeros((self.n_iter + 1, nchains))
+        u[0] = seeds[seed_index]
+        iterations = np.full(nchains, self.n_iter)
+        converged = np.zeros(nchains, dtype=bool)
+        error_record = [list() for _ in range(nchains)]
+
+        for k in range(self.n_iter):
+            active = np.nonzero(~converged)[0]
+            if active.size == 0:
+                break
+            if k == 0:
+                g_k = g_seeds[seed_index, limit_index]
+                dg_k = dg_seeds[seed_index, limit_index]
+                x_k = x_seeds[seed_index]
+            else:
+                # Chains sharing the same point (e.g. different limit states) share the model evaluations.
+                points, inverse = np.unique(u[k, active], axis=0, return_inverse=True)
+                inverse = inverse.flatten()
+                g_p, dg_p, x_p = evaluate(points)
+                g_k = g_p[inverse, limit_index[active]]
+                dg_k = dg_p[inverse, limit_index[active]]
+                x_k = x_p[inverse]
+
+            x[k, active] = x_k
+            g[k, active] = g_k
+            dg_u[k + 1, active] = dg_k
+            norm_grad = np.linalg.norm(dg_k, axis=1)
+            alpha[k, active] = dg_k / norm_grad[:, np.newaxis]
+            beta[k, active] = -np.sum(u[k, active] * alpha[k, active], axis=1)
+            beta[k + 1, active] = beta[k, active] + g_k / norm_grad
+            u[k + 1, active] = -beta[k + 1, active][:, np.newaxis] * alpha[k, active]
+
+            error1 = np.linalg.norm(u[k + 1, active] - u[k, active], axis=1)
+            error2 = np.abs(beta[k + 1, active] - beta[k, active])
+            error3 = np.linalg.norm(dg_u[k + 1, active] - dg_u[k, active], axis=1)
+            converged_k, error = self._check_convergence(error1, error2, error3)
+            for i, chain in enumerate(active):
+                error_record[chain].append(np.asarray(error)[..., i].tolist())
+            converged[active[converged_k]] = True
+            iterations[active[converged_k]] = k
+
+        beta_chains = np.where(converged, beta[iterations, np.arange(nchains)], np.nan)
+        self.beta_seeds = beta_chains.reshape(nseeds, nlimit)
+        self.iterations_seeds = iterations.reshape(nseeds, nlimit)
+
+        for limit in range(nlimit):
+            chains = np.nonzero((limit_index == limit) & converged)[0]
+            if chains.size == 0:
+                print('UQpy: Maximum number of iterations {0} was reached before convergence for limit state {1}.'
+                      .format(self.n_iter, limit))
+                continue
+            best = chains[np.argmin(np.abs(beta_chains[chains]))]
+            k = iterations[best]
+            if self.call is None:
+                self.beta_record, self.beta_form, self.error_record = [], [], []
+                self.DesignPoint_U, self.DesignPoint_X, self.Pf_form, self.form_iterations = [], [], [], []
+                self.u_record, self.x_record, self.g_record, self.dg_u_record, self.alpha_record = [], [], [], [], []
+                self.call = True
+            self.beta_record = self.beta_record + [beta[:k, best]]
+            self.beta_form = self.beta_form + [beta[k, best]]
+            self.error_record = self.error_record + error_record[best]
+            self.DesignPoint_U = self.DesignPoint_U + [u[k, best]]
+            self.DesignPoint_X = self.DesignPoint_X + [x[k, best]]
+            self.Pf_form = self.Pf_form + [stats.norm.cdf(-beta[k, best])]
+            self.form_iterations = self.form_iterations + [k]
+            self.u_record = self.u_record + [u[:k, best]]
+            self.x_record = self.x_record + [x[:k, best]]
+            self.g_record = self.g_record + [g[:k + 1, best]]
+            self.dg_u_record = self.dg_u_record + [dg_u[:k, best]]
+            self.alpha_record = self.alpha_record + [alpha[:k + 1, best]]
+            self.alpha = alpha[k, best]
+            self.x = x[k, best]
+
+    def _check_convergence(self, error1, error2, error3):
+        """
+        Check the convergence criteria `e1`, `e2`, `e3` of the `HLRF` algorithm.
+
+        If no tolerance is provided, convergence is reached when any of the criteria is below 1.0e-3. Otherwise, all
+        the criteria with a provided tolerance must be satisfied. The errors may be scalars or arrays.
+
+        **Output/Returns:**
+
+        * **converged** (`bool` or `ndarray`):
+            Convergence flag.
+
+        * **error** (`float` or `list`):
+            Errors of the criteria that are checked, to be stored in `error_record`.
+
+        """
+        if self.tol1 is None and self.tol2 is None and self.tol3 is None:
+            converged = (error1 <= 1e-3) | (error2 <= 1e-3) | (error3 < 1e-3)
+            return converged, [error1, error2, error3]
+
+        converged = True
+        error = []
+        if self.tol1 is not None:
+            converged = converged & (error1 <= self.tol1)
+            error.append(error1)
+        if self.tol2 is not None:
+            converged = converged & (error2 <= self.tol2)
+            error.append(error2)
+        if self.tol3 is not None:
+            converged = converged & (error3 < self.tol3)
+            error.append(error3)
+        if len(error) == 1:
+            error = error[0]
+        return converged, error
+
 
 class SORM(TaylorSeries):
     """
@@ -1202,3 +1533,957 @@ class SORM(TaylorSeries):
             self.beta_sorm = self.beta_sorm + [-stats.norm.ppf(self.Pf_sorm)]
 
         self.call = True
+
+
+########################################################################################################################
+########################################################################################################################
+#                                        Importance Sampling
+########################################################################################################################
+
+class DesignPointIS:
+    """
+    Estimate the probability of failure with importance sampling around the FORM design point(s).
+
+    The importance sampling density is a mixture of Gaussian densities in the uncorrelated standard normal space **U**,
+    centered at the design point(s) identified by ``FORM``. Samples are drawn in batches, transformed to the parameter
+    space **X** with the ``Nataf`` object of the ``FORM`` object and evaluated with a single call to the ``RunModel``
+    object per batch. Sampling stops when the coefficient of variation of the estimate reaches `target_cov`, or when
+    `max_nsamples` samples have been drawn. The ``run`` method can be invoked many times; each time sampling continues
+    from the existing samples.
+
+    **Input:**
+
+    * **form_object** (``FORM`` object):
+        A ``FORM`` object that has been run. All its design points (`DesignPoint_U`) are used as centers of the mixture.
+
+    * **design_points_u** (`ndarray`):
+        Centers of the mixture in the standard normal space **U**, of shape `(npoints, dimension)`.
+
+        Default: `DesignPoint_U` of `form_object`.
+
+    * **weights** (`ndarray`):
+        Weights of the mixture components.
+
+        Default: Proportional to the first-order probability of failure :math:`\\Phi(-||\\textbf{U}^\\star||)` of
+        each design point.
+
+    * **proposal_std** (`float`):
+        Standard deviation of each mixture component.
+
+        Default: 1.
+
+    * **batch_size** (`int`):
+        Number of samples drawn and evaluated at each batch.
+
+        Default: 1000
+
+    * **target_cov** (`float`):
+        Target coefficient of variation of the probability of failure estimate.
+
+        Default: 0.05
+
+    * **max_nsamples** (`int`):
+        Maximum total number of samples.
+
+        Default: 100000
+
+    * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+        Random seed used to initialize the pseudo-random number generator. Default is None.
+
+        If an integer is provided, this sets the seed for an object of class ``numpy.random.RandomState``. Otherwise,
+        the object itself can be passed directly.
+
+    * **verbose** (`Boolean`):
+        A boolean declaring whether to write text to the terminal.
+
+    **Attributes:**
+
+    * **pf** (`float`):
+        Importance sampling estimate of the probability of failure.
+
+    * **cov** (`float`):
+        Coefficient of variation of the probability of failure estimate.
+
+    * **nsamples** (`int`):
+        Total number of samples (model evaluations).
+
+    * **samples_u** (`ndarray`):
+        Samples in the standard normal space **U**.
+
+    * **samples_x** (`ndarray`):
+        Samples in the parameter space **X**.
+
+    * **g** (`ndarray`):
+        Performance function at the samples. If the model returns several performance functions, failure is the union
+        of their failure events (series system) and `g` stores their minimum.
+
+    * **weights_is** (`ndarray`):
+        Importance weights :math:`\\phi(\\textbf{u})/h(\\textbf{u})` of the samples.
+
+    * **pf_record** (`list`):
+        Running estimate of the probability of failure after each batch.
+
+    * **cov_record** (`list`):
+        Running coefficient of variation after each batch.
+
+    **Methods:**
+
+    """
+
+    def __init__(self, form_object, design_points_u=None, weights=None, proposal_std=1., batch_size=1000,
+                 target_cov=0.05, max_nsamples=100000, random_state=None, verbose=False):
+
+        if not isinstance(form_object, FORM):
+            raise TypeError('UQpy: An object of type ``FORM`` is required to run DesignPointIS.')
+        self.form_object = form_object
+        self.nataf_object = form_object.nataf_object
+        self.runmodel_object = form_object.runmodel_object
+
+        if design_points_u is None:
+            if form_object.DesignPoint_U is None:
+                raise ValueError('UQpy: The FORM object must be run before DesignPointIS.')
+            design_points_u = form_object.DesignPoint_U
+        self.design_points_u = np.atleast_2d(np.asarray(design_points_u, dtype=float))
+        self.dimension = self.design_points_u.shape[1]
+
+        if weights is None:
+            weights = stats.norm.cdf(-np.linalg.norm(self.design_points_u, axis=1))
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (self.design_points_u.shape[0],) or np.any(weights < 0) or np.sum(weights) == 0:
+            raise ValueError('UQpy: weights must be non-negative with one weight per design point.')
+        self.weights = weights / np.sum(weights)
+
+        self.proposal_std = proposal_std
+        self.batch_size = batch_size
+        self.target_cov = target_cov
+        self.max_nsamples = max_nsamples
+        self.verbose = verbose
+
+        self.random_state = random_state
+        if isinstance(self.random_state, int):
+            self.random_state = np.random.RandomState(self.random_state)
+        elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
+            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+
+        # Initialize the outputs
+        self.pf = None
+        self.cov = None
+        self.nsamples = 0
+        self.samples_u = None
+        self.samples_x = None
+        self.g = None
+        self.weights_is = None
+        self.pf_record = []
+        self.cov_record = []
+        self._sum = 0.
+        self._sum_sq = 0.
+
+        self.run()
+
+    def run(self, target_cov=None, max_nsamples=None):
+        """
+        Run importance sampling.
+
+        This is an instance method that draws batches of samples until the coefficient of variation of the estimate
+        reaches `target_cov` or the total number of samples reaches `max_nsamples`. It is automatically called when the
+        ``DesignPointIS`` class is instantiated; subsequent calls continue from the existing samples.
+
+        **Inputs:**
+
+        * **target_cov** (`float`):
+            Target coefficient of variation. If not provided, the value given at instantiation is used.
+
+        * **max_nsamples** (`int`):
+            Maximum total number of samples. If not provided, the value given at instantiation is used.
+
+        **Output/Returns:**
+
+        The ``run`` method has no returns, although it creates and/or appends the attributes of the ``DesignPointIS``
+        class.
+
+        """
+
+        if target_cov is not None:
+            self.target_cov = target_cov
+        if max_nsamples is not None:
+            self.max_nsamples = max_nsamples
+
+        while self.nsamples < self.max_nsamples:
+            if self.cov is not None and self.cov <= self.target_cov:
+                break
+            nbatch = int(min(self.batch_size, self.max_nsamples - self.nsamples))
+
+            # Draw the batch from the mixture and compute the importance weights in log-space
+            random = np.random if self.random_state is None else self.random_state
+            components = random.choice(self.weights.size, size=nbatch, p=self.weights)
+            u = self.design_points_u[components] + self.proposal_std * random.standard_normal((nbatch, self.dimension))
+            log_weights = self._log_weights(u)
+
+            # Transform to the parameter space and evaluate the model once for the whole batch
+            z = Correlate(u, self.nataf_object.corr_z).samples_z
+            self.nataf_object.run(samples_z=z, jacobian=False)
+            x = np.atleast_2d(self.nataf_object.samples_x).reshape(nbatch, -1)
+            self.runmodel_object.run(samples=x)
+            g = np.asarray(self.runmodel_object.qoi_list[-nbatch:], dtype=float).reshape(nbatch, -1).min(axis=1)
+
+            weighted = np.where(g <= 0, np.exp(log_weights), 0.)
+            self._sum = self._sum + np.sum(weighted)
+            self._sum_sq = self._sum_sq + np.sum(weighted ** 2)
+            self.nsamples = self.nsamples + nbatch
+
+            if self.samples_u is None:
+                self.samples_u, self.samples_x, self.g, self.weights_is = u, x, g, np.exp(log_weights)
+            else:
+                self.samples_u = np.concatenate([self.samples_u, u], axis=0)
+                self.samples_x = np.concatenate([self.samples_x, x], axis=0)
+                self.g = np.concatenate([self.g, g])
+                self.weights_is = np.concatenate([self.weights_is, np.exp(log_weights)])
+
+            # Running estimate of the probability of failure and its coefficient of variation
+            self.pf = self._sum / self.nsamples
+            variance = max(self._sum_sq / self.nsamples - self.pf ** 2, 0.) / self.nsamples
+            self.cov = np.sqrt(variance) / self.pf if self.pf > 0 else np.inf
+            self.pf_record.append(self.pf)
+            self.cov_record.append(self.cov)
+
+            if self.verbose:
+                print('UQpy: DesignPointIS, {0} samples, Pf: {1}, CoV: {2}'.format(self.nsamples, self.pf, self.cov))
+
+        if self.verbose and self.cov > self.target_cov:
+            print('UQpy: DesignPointIS reached the maximum number of samples before the target coefficient of '
+                  'variation.')
+
+    def _log_weights(self, u):
+        """
+        Log of the importance weights of samples in the standard normal space.
+
+        **Input:**
+
+        :param u: Samples in the standard normal space
+        :type u: numpy array
+
+        **Output/Returns:**
+
+        :param log_weights: Log of the ratio of the standard normal density to the mixture density
+        :type log_weights: numpy array
+        """
+
+        from scipy.special import logsumexp
+
+        # The normalizing constants (2 * pi)^(-d/2) of the target and of the mixture components cancel out.
+        log_target = -0.5 * np.sum(u ** 2, axis=1)
+        distance = np.sum((u[:, np.newaxis, :] - self.design_points_u[np.newaxis, :, :]) ** 2, axis=2)
+        log_components = -0.5 * distance / self.proposal_std ** 2 - self.dimension * np.log(self.proposal_std)
+        log_proposal = logsumexp(log_components, b=self.weights[np.newaxis, :], axis=1)
+
+        return log_target - log_proposal
+
+
+class CrossEntropyIS:
+    """
+    Estimate the probability of failure with adaptive (cross-entropy) importance sampling.
+
+    The importance sampling density is adapted in the uncorrelated standard normal space **U** with the improved
+    cross-entropy method [6]_: the indicator function of the failure event is approximated by the smooth function
+    :math:`\\Phi(-G(\\textbf{u})/\\sigma_j)`, and the smoothing parameter :math:`\\sigma_j` decreases from level to level
+    such that the coefficient of variation of the ratio of successive smoothed indicators equals `cov_target`. At each
+    level the parameters of the density are updated by weighted maximum likelihood (cross-entropy minimization) using
+    all samples of the level, until the coefficient of variation of the ratio of the indicator to its smooth
+    approximation falls below `cov_target`. Two parametric families are available: a (mixture of) Gaussian
+    density(ies) and the von Mises-Fisher-Nakagami density, which scales to high dimensions.
+
+    Each level is sampled with an ``IS`` object from the ``SampleMethods`` module, and its samples are evaluated with a
+    single call to the ``RunModel`` object (which can run them in parallel, see `ntasks`).
+
+    **Input:**
+
+    * **dist_object** ((list of ) ``Distribution`` object(s)):
+        Marginal probability distributions of each random variable. Must be an object of type
+        ``DistributionContinuous1D`` or ``JointInd``.
+
+    * **runmodel_object** (``RunModel`` object):
+        The computational model. It should be of type ``RunModel`` (see ``RunModel`` class).
+
+    * **corr_z** or **corr_x** (`ndarray`):
+        Correlation matrix of the standard normal random vector **Z** or of the random vector **X** (see ``Nataf``).
+
+        Default: `corr_z` is specified as the identity matrix.
+
+    * **nsamples_per_level** (`int`):
+        Number of samples (model evaluations) in each level.
+
+        Default: 1000
+
+    * **cov_target** (`float`):
+        Target coefficient of variation of the weights used to select the smoothing parameter of each level and to stop
+        the adaptation.
+
+        Default: 1.5
+
+    * **proposal_type** (`str`):
+        Parametric family of the importance sampling density, 'Gaussian' (``MVNormalMixture``) or 'vMFN'
+        (``VonMisesFisherNakagami``).
+
+        Default: 'Gaussian'
+
+    * **ncomponents** (`int`):
+        Number of components of the Gaussian mixture (only for `proposal_type` 'Gaussian').
+
+        Default: 1
+
+    * **max_level** (`int`):
+        Maximum number of levels.
+
+        Default: 50
+
+    * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+        Random seed used to initialize the pseudo-random number generator. Default is None.
+
+        If an integer is provided, this sets the seed for an object of class ``numpy.random.RandomState``. Otherwise,
+        the object itself can be passed directly.
+
+    * **verbose** (`Boolean`):
+        A boolean declaring whether to write text to the terminal.
+
+    **Attributes:**
+
+    * **pf** (`float`):
+        Probability of failure estimate.
+
+    * **cov** (`float`):
+        Coefficient of variation of the probability of failure estimate (from the samples of the last level).
+
+    * **sigma** (`list`):
+        Smoothing parameter of the indicator function at each level.
+
+    * **proposals** (`list` of ``Distribution`` objects):
+        Importance sampling density used at each level.
+
+    * **samples_u** (`list` of `ndarrays`):
+        Samples of each level in the standard normal space **U**.
+
+    * **samples_x** (`list` of `ndarrays`):
+        Samples of each level in the parameter space **X**.
+
+    * **g** (`list` of `ndarrays`):
+        Performance function at the samples of each level.
+
+    * **log_weights** (`list` of `ndarrays`):
+        Log of the importance weights of the samples of each level.
+
+    **Methods:**
+
+    """
+
+    def __init__(self, dist_object, runmodel_object, corr_x=None, corr_z=None, nsamples_per_level=1000,
+                 cov_target=1.5, proposal_type='Gaussian', ncomponents=1, max_level=50, random_state=None,
+                 verbose=False):
+
+        if not isinstance(runmodel_object, RunModel):
+            raise ValueError('UQpy: A RunModel object is required for the model.')
+        self.runmodel_object = runmodel_object
+        self.nataf_object = Nataf(dist_object=dist_object, corr_z=corr_z, corr_x=corr_x)
+        self.dimension = self.nataf_object.corr_z.shape[0]
+
+        if not cov_target > 0:
+            raise ValueError('UQpy: cov_target must be positive.')
+        if proposal_type not in ['Gaussian', 'vMFN']:
+            raise NotImplementedError('UQpy: proposal_type must be "Gaussian" or "vMFN".')
+        self.nsamples_per_level = nsamples_per_level
+        self.cov_target = cov_target
+        self.proposal_type = proposal_type
+        self.ncomponents = ncomponents
+        self.max_level = max_level
+        self.verbose = verbose
+
+        self.random_state = random_state
+        if isinstance(self.random_state, int):
+            self.random_state = np.random.RandomState(self.random_state)
+        elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
+            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+
+        # Initialize the outputs
+        self.pf = None
+        self.cov = None
+        self.sigma = []
+        self.proposals = []
+        self.samples_u = []
+        self.samples_x = []
+        self.g = []
+        self.log_weights = []
+
+        self.run()
+
+    def run(self):
+        """
+        Run cross-entropy importance sampling.
+
+        This is an instance method that adapts the importance sampling density level by level and computes the
+        probability of failure. It is automatically called when the ``CrossEntropyIS`` class is instantiated.
+
+        **Output/Returns:**
+
+        The ``run`` method has no returns, although it creates the attributes of the ``CrossEntropyIS`` class.
+
+        """
+
+        from scipy.optimize import minimize_scalar
+
+        target = MVNormal(mean=np.zeros(self.dimension), cov=1.)
+        proposal = self._initial_proposal()
+        sigma = np.inf
+
+        for level in range(self.max_level):
+            # Sample the current density and evaluate the whole level with a single model call
+            is_object = IS(nsamples=self.nsamples_per_level, log_pdf_target=target.log_pdf, proposal=proposal,
+                           random_state=self.random_state)
+            u = is_object.samples
+            z = Correlate(u, self.nataf_object.corr_z).samples_z
+            self.nataf_object.run(samples_z=z, jacobian=False)
+            x = np.atleast_2d(self.nataf_object.samples_x).reshape(u.shape[0], -1)
+            self.runmodel_object.run(samples=x)
+            g = np.asarray(self.runmodel_object.qoi_list[-u.shape[0]:], dtype=float).reshape(-1)
+
+            self.proposals.append(proposal)
+            self.samples_u.append(u)
+            self.samples_x.append(x)
+            self.g.append(g)
+            self.log_weights.append(is_object.unnormalized_log_weights)
+
+            # Samples that could not be evaluated (e.g. transformed to infinite values in the far tails) are given
+            # a zero weight
+            g = np.where(np.isnan(g), np.inf, g)
+
+            # Stop when the smooth approximation of the indicator function is accurate enough for these samples
+            log_smooth = stats.norm.logcdf(-g / sigma) if np.isfinite(sigma) else np.zeros_like(g)
+            if np.any(g <= 0) and self._cov(np.where(g <= 0, -log_smooth, -np.inf)) <= self.cov_target:
+                break
+
+            # Smoothing parameter of the next level, such that the ratio of successive smoothed indicators has the
+            # target coefficient of variation
+            upper = sigma if np.isfinite(sigma) else 10 * np.max(np.abs(g))
+            sigma = minimize_scalar(lambda s: (self._cov(stats.norm.logcdf(-g / s) - log_smooth) -
+                                               self.cov_target) ** 2, bounds=(0., upper), method='bounded').x
+            self.sigma.append(sigma)
+
+            if self.verbose:
+                print('UQpy: CrossEntropyIS, level {0} smoothing parameter: {1}'.format(level, sigma))
+
+            # Cross-entropy update: weighted maximum likelihood with the smoothed indicator function
+            log_w = is_object.unnormalized_log_weights + stats.norm.logcdf(-g / sigma)
+            weights = np.exp(log_w - np.max(log_w))
+            proposal = self._update_proposal(proposal, u, weights / np.sum(weights))
+        else:
+            warnings.warn('UQpy: CrossEntropyIS reached the maximum number of levels before convergence.')
+
+        failed = self.g[-1] <= 0
+        weighted = np.where(failed, np.exp(self.log_weights[-1]), 0.)
+        self.pf = np.mean(weighted)
+        self.cov = np.std(weighted) / (np.sqrt(weighted.size) * self.pf) if self.pf > 0 else np.inf
+
+    @staticmethod
+    def _cov(log_w):
+        """
+        Coefficient of variation of weights given by their logarithm (weights equal to zero have log_w = -inf, and
+        undefined weights, log_w = nan, are ignored).
+        """
+
+        log_w = log_w[~np.isnan(log_w)]
+        if not np.any(np.isfinite(log_w)):
+            return np.inf
+        w = np.exp(log_w - np.max(log_w))
+        return np.std(w) / np.mean(w)
+
+    def _initial_proposal(self):
+        """
+        Importance sampling density of the first level, equal to the standard normal density (components of a
+        Gaussian mixture are centered at random points).
+        """
+
+        d = self.dimension
+        if self.proposal_type == 'vMFN':
+            return VonMisesFisherNakagami(mu=np.ones(d), kappa=0., m=d / 2, omega=float(d))
+
+        random = np.random if self.random_state is None else self.random_state
+        means = np.zeros((1, d)) if self.ncomponents == 1 else random.standard_normal((self.ncomponents, d))
+        return MVNormalMixture(weights=np.ones(self.ncomponents) / self.ncomponents, means=means,
+                               covs=np.tile(np.eye(d), (self.ncomponents, 1, 1)))
+
+    def _update_proposal(self, proposal, u, weights, n_em=10):
+        """
+        Weighted maximum likelihood update of the importance sampling density (cross-entropy step).
+
+        **Input:**
+
+        :param proposal: Current importance sampling density
+        :type proposal: Distribution object
+
+        :param u: All the samples of the current level, in the standard normal space
+        :type u: numpy array
+
+        :param weights: Normalized weights of the samples, i.e. importance weights multiplied by the smoothed indicator
+                        function of the failure domain
+        :type weights: numpy array
+
+        :param n_em: Number of expectation-maximization iterations for a Gaussian mixture
+        :type n_em: int
+
+        **Output/Returns:**
+
+        :param proposal: Updated importance sampling density
+        :type proposal: Distribution object
+        """
+
+        d = self.dimension
+        if self.proposal_type == 'vMFN':
+            r = np.linalg.norm(u, axis=1)
+            a = u / r[:, np.newaxis]
+            resultant = weights @ a
+            r_bar = min(np.linalg.norm(resultant), 1 - 1e-10)
+            kappa = r_bar * (d - r_bar ** 2) / (1 - r_bar ** 2)
+            omega = weights @ r ** 2
+            m = max(omega ** 2 / (weights @ (r ** 2 - omega) ** 2), 0.5)
+            return VonMisesFisherNakagami(mu=resultant, kappa=kappa, m=m, omega=omega)
+
+        params = proposal.get_params()
+        pi, means, covs = params['weights'], params['means'], params['covs']
+        # Expectation-maximization iterations on the weighted samples (a single Gaussian needs one M-step)
+        for _ in range(n_em if pi.size > 1 else 1):
+            if pi.size > 1:
+                log_resp = np.stack([np.log(pi[j]) + MVNormalMixture(weights=np.ones(1), means=means[j:j + 1],
+                                                                     covs=covs[j:j + 1]).log_pdf(u)
+                                     for j in range(pi.size)], axis=1)
+                resp = np.exp(log_resp - np.max(log_resp, axis=1)[:, np.newaxis])
+                resp = resp / np.sum(resp, axis=1)[:, np.newaxis]
+            else:
+                resp = np.ones((u.shape[0], 1))
+            w_resp = weights[:, np.newaxis] * resp
+            sum_w = np.maximum(np.sum(w_resp, axis=0), np.finfo(float).tiny)
+            pi = sum_w / np.sum(sum_w)
+            means = (w_resp.T @ u) / sum_w[:, np.newaxis]
+            diff = u[np.newaxis, :, :] - means[:, np.newaxis, :]
+            covs = np.einsum('nj,jni,jnk->jik', w_resp, diff, diff) / sum_w[:, np.newaxis, np.newaxis]
+            covs = covs + 1e-6 * np.eye(d)[np.newaxis, :, :]
+        return MVNormalMixture(weights=pi, means=means, covs=covs)
+
+
+########################################################################################################################
+########################################################################################################################
+#                                        Line Sampling and Directional Simulation
+########################################################################################################################
+
+class LineSampling:
+    """
+    Estimate the probability of failure with line sampling.
+
+    Line sampling [7]_ uses an important direction :math:`\\textbf{e}` in the uncorrelated standard normal space **U**,
+    pointing towards the failure domain (by default the direction of the ``FORM`` design point). Random points
+    :math:`\\textbf{u}^\\perp_i` are sampled on the hyperplane orthogonal to :math:`\\textbf{e}`, and on each line
+    :math:`\\textbf{u}^\\perp_i + c\\textbf{e}` the distance :math:`c_i` to the limit state is found with a
+    one-dimensional root search. The probability of failure is estimated without bias as the average of
+    :math:`\\Phi(-c_i)`.
+
+    The root searches of all lines are carried out together: the performance function is first evaluated on a grid of
+    distances, extended towards negative distances for the lines that already fail at the first grid point, then the
+    first bracketed root of each line is refined with the Illinois (regula falsi) method. Each
+    step evaluates all the lines with a single call to the ``RunModel`` object (which can run them in parallel, see
+    `ntasks`). The ``run`` method can be invoked many times; each time the new lines are appended to the existing ones.
+
+    **Input:**
+
+    * **form_object** (``FORM`` object):
+        A ``FORM`` object that has been run. Its ``Nataf`` and ``RunModel`` objects are used, and its last design point
+        (`DesignPoint_U`) defines the important direction.
+
+    * **dist_object**, **runmodel_object**, **corr_x**, **corr_z**:
+        Marginal distributions, model and correlation (see ``TaylorSeries``), used when `form_object` is not provided.
+
+    * **direction** (`ndarray`):
+        Important direction in the standard normal space **U**, pointing towards the failure domain. Must be provided
+        if `form_object` is not provided.
+
+        Default: Direction of the last design point of `form_object`.
+
+    * **nlines** (`int`):
+        Number of lines. If not `None`, the ``run`` method is called when the object is created.
+
+        Default: 100
+
+    * **grid** (`ndarray`):
+        Distances along each line at which the performance function is first evaluated to bracket the root. Lines
+        that fail at the first grid point are searched towards smaller (possibly negative) distances, down to
+        :math:`-\\Phi^{-1}(1 - 10^{-15})`.
+
+        Default: :math:`\\beta \\times [0.5, 1, 2, 3]`, where :math:`\\beta` is the reliability index of
+        `form_object` (or 3 if `form_object` is not provided).
+
+    * **tol** (`float`):
+        Tolerance on the distance to the limit state.
+
+        Default: 1.0e-3
+
+    * **max_iter** (`int`):
+        Maximum number of iterations of the root search.
+
+        Default: 20
+
+    * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+        Random seed used to initialize the pseudo-random number generator. Default is None.
+
+        If an integer is provided, this sets the seed for an object of class ``numpy.random.RandomState``. Otherwise,
+        the object itself can be passed directly.
+
+    * **verbose** (`Boolean`):
+        A boolean declaring whether to write text to the terminal.
+
+    **Attributes:**
+
+    * **pf** (`float`):
+        Probability of failure estimate.
+
+    * **cov** (`float`):
+        Coefficient of variation of the probability of failure estimate.
+
+    * **samples_u** (`ndarray`):
+        Points of the lines on the hyperplane orthogonal to the important direction.
+
+    * **roots** (`ndarray`):
+        Distance of each line to the limit state along the important direction, negative if the point of the line on
+        the hyperplane is in the failure domain (`inf` if the line does not cross the limit state in the searched
+        range).
+
+    * **pf_lines** (`ndarray`):
+        Probability of failure along each line, :math:`\\Phi(-c_i)`.
+
+    * **nevaluations** (`int`):
+        Total number of model evaluations.
+
+    **Methods:**
+
+    """
+
+    def __init__(self, form_object=None, dist_object=None, runmodel_object=None, corr_x=None, corr_z=None,
+                 direction=None, nlines=100, grid=None, tol=1e-3, max_iter=20, random_state=None, verbose=False):
+
+        beta = 3.
+        if form_object is not None:
+            if not isinstance(form_object, FORM) or form_object.DesignPoint_U is None:
+                raise TypeError('UQpy: form_object must be a FORM object that has been run.')
+            self.nataf_object = form_object.nataf_object
+            self.runmodel_object = form_object.runmodel_object
+            if direction is None:
+                direction = form_object.DesignPoint_U[-1]
+            beta = abs(form_object.beta_form[-1])
+        else:
+            if not isinstance(runmodel_object, RunModel):
+                raise ValueError('UQpy: A RunModel object is required for the model.')
+            if direction is None:
+                raise ValueError('UQpy: A direction must be provided if form_object is not provided.')
+            self.nataf_object = Nataf(dist_object=dist_object, corr_z=corr_z, corr_x=corr_x)
+            self.runmodel_object = runmodel_object
+
+        direction = np.asarray(direction, dtype=float).reshape(-1)
+        self.direction = direction / np.linalg.norm(direction)
+        self.dimension = self.direction.size
+        self.grid = beta * np.array([0.5, 1., 2., 3.]) if grid is None else np.sort(np.atleast_1d(grid))
+        self.tol = tol
+        self.max_iter = max_iter
+        self.verbose = verbose
+
+        self.random_state = random_state
+        if isinstance(self.random_state, int):
+            self.random_state = np.random.RandomState(self.random_state)
+        elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
+            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+
+        self.pf = None
+        self.cov = None
+        self.samples_u = np.zeros((0, self.dimension))
+        self.roots = np.zeros(0)
+        self.pf_lines = np.zeros(0)
+        self.nevaluations = 0
+
+        if nlines is not None:
+            self.run(nlines)
+
+    def run(self, nlines):
+        """
+        Sample new lines and update the probability of failure estimate.
+
+        **Inputs:**
+
+        * **nlines** (`int`):
+            Number of new lines.
+
+        **Output/Returns:**
+
+        The ``run`` method has no returns, although it creates and/or appends the attributes of the ``LineSampling``
+        class.
+
+        """
+
+        random = np.random if self.random_state is None else self.random_state
+        u = random.standard_normal((nlines, self.dimension))
+        u_perp = u - np.outer(u @ self.direction, self.direction)
+
+        roots, nevaluations = _find_roots(self.nataf_object, self.runmodel_object, u_perp,
+                                          np.tile(self.direction, (nlines, 1)), self.grid, self.tol, self.max_iter,
+                                          lower=-stats.norm.isf(1e-15))
+
+        self.samples_u = np.concatenate([self.samples_u, u_perp], axis=0)
+        self.roots = np.concatenate([self.roots, roots])
+        self.pf_lines = np.concatenate([self.pf_lines, stats.norm.cdf(-roots)])
+        self.nevaluations = self.nevaluations + nevaluations
+        self.pf = np.mean(self.pf_lines)
+        self.cov = np.std(self.pf_lines) / (np.sqrt(self.pf_lines.size) * self.pf) if self.pf > 0 else np.inf
+
+        if self.verbose:
+            print('UQpy: LineSampling, {0} lines, Pf: {1}, CoV: {2}'.format(self.pf_lines.size, self.pf, self.cov))
+
+
+class DirectionalSimulation:
+    """
+    Estimate the probability of failure with directional simulation.
+
+    Directional simulation [8]_ samples directions :math:`\\textbf{a}_i` uniformly on the unit hypersphere of the
+    uncorrelated standard normal space **U**, finds the distance :math:`r_i` from the origin to the limit state along
+    each direction, and estimates the probability of failure without bias as the average of
+    :math:`1 - \\chi^2_n(r_i^2)`, where :math:`\\chi^2_n` is the cumulative distribution function of the chi-square
+    distribution with :math:`n` degrees of freedom.
+
+    The root searches of all directions are carried out together as in ``LineSampling``, with a single call to the
+    ``RunModel`` object per step. The ``run`` method can be invoked many times; each time the new directions are
+    appended to the existing ones.
+
+    **Input:**
+
+    * **form_object** (``FORM`` object):
+        If provided, its ``Nataf`` and ``RunModel`` objects are used.
+
+    * **dist_object**, **runmodel_object**, **corr_x**, **corr_z**:
+        Marginal distributions, model and correlation (see ``TaylorSeries``), used when `form_object` is not provided.
+
+    * **ndirections** (`int`):
+        Number of directions. If not `None`, the ``run`` method is called when the object is created.
+
+        Default: 100
+
+    * **grid** (`ndarray`):
+        Radii at which the performance function is first evaluated to bracket the root. Directions that fail at the
+        first radius are searched towards the origin.
+
+        Default: 8 equally spaced radii up to :math:`r_{max}`, with :math:`1 - \\chi^2_n(r_{max}^2) = 10^{-15}`.
+
+    * **tol**, **max_iter**, **random_state**, **verbose**:
+        See ``LineSampling``.
+
+    **Attributes:**
+
+    * **pf** (`float`):
+        Probability of failure estimate.
+
+    * **cov** (`float`):
+        Coefficient of variation of the probability of failure estimate.
+
+    * **directions** (`ndarray`):
+        Sampled directions.
+
+    * **roots** (`ndarray`):
+        Distance to the limit state along each direction (`inf` if the direction does not cross the limit state in
+        the searched range).
+
+    * **pf_directions** (`ndarray`):
+        Probability of failure along each direction, :math:`1 - \\chi^2_n(r_i^2)`.
+
+    * **nevaluations** (`int`):
+        Total number of model evaluations.
+
+    **Methods:**
+
+    """
+
+    def __init__(self, form_object=None, dist_object=None, runmodel_object=None, corr_x=None, corr_z=None,
+                 ndirections=100, grid=None, tol=1e-3, max_iter=20, random_state=None, verbose=False):
+
+        if form_object is not None:
+            if not isinstance(form_object, FORM):
+                raise TypeError('UQpy: form_object must be a FORM object.')
+            self.nataf_object = form_object.nataf_object
+            self.runmodel_object = form_object.runmodel_object
+        else:
+            if not isinstance(runmodel_object, RunModel):
+                raise ValueError('UQpy: A RunModel object is required for the model.')
+            self.nataf_object = Nataf(dist_object=dist_object, corr_z=corr_z, corr_x=corr_x)
+            self.runmodel_object = runmodel_object
+
+        self.dimension = self.nataf_object.corr_z.shape[0]
+        if grid is None:
+            grid = np.linspace(0., np.sqrt(stats.chi2.isf(1e-15, self.dimension)), 9)[1:]
+        self.grid = np.sort(np.atleast_1d(grid))
+        self.tol = tol
+        self.max_iter = max_iter
+        self.verbose = verbose
+
+        self.random_state = random_state
+        if isinstance(self.random_state, int):
+            self.random_state = np.random.RandomState(self.random_state)
+        elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
+            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+
+        self.pf = None
+        self.cov = None
+        self.directions = np.zeros((0, self.dimension))
+        self.roots = np.zeros(0)
+        self.pf_directions = np.zeros(0)
+        self.nevaluations = 0
+
+        if ndirections is not None:
+            self.run(ndirections)
+
+    def run(self, ndirections):
+        """
+        Sample new directions and update the probability of failure estimate.
+
+        **Inputs:**
+
+        * **ndirections** (`int`):
+            Number of new directions.
+
+        **Output/Returns:**
+
+        The ``run`` method has no returns, although it creates and/or appends the attributes of the
+        ``DirectionalSimulation`` class.
+
+        """
+
+        random = np.random if self.random_state is None else self.random_state
+        a = random.standard_normal((ndirections, self.dimension))
+        a = a / np.linalg.norm(a, axis=1)[:, np.newaxis]
+
+        roots, nevaluations = _find_roots(self.nataf_object, self.runmodel_object, np.zeros_like(a), a, self.grid,
+                                          self.tol, self.max_iter, lower=0.)
+
+        self.directions = np.concatenate([self.directions, a], axis=0)
+        self.roots = np.concatenate([self.roots, roots])
+        self.pf_directions = np.concatenate([self.pf_directions, stats.chi2.sf(roots ** 2, self.dimension)])
+        self.nevaluations = self.nevaluations + nevaluations
+        self.pf = np.mean(self.pf_directions)
+        self.cov = np.std(self.pf_directions) / (np.sqrt(self.pf_directions.size) * self.pf) if self.pf > 0 else np.inf
+
+        if self.verbose:
+            print('UQpy: DirectionalSimulation, {0} directions, Pf: {1}, CoV: {2}'.format(self.pf_directions.size,
+                                                                                           self.pf, self.cov))
+
+
+def _find_roots(nataf_object, runmodel_object, origins, directions, grid, tol, max_iter, lower=0.):
+    """
+    Batched search of the first crossing of the limit state along lines in the standard normal space.
+
+    The performance function is evaluated on the grid of distances along all the lines with a single model call. The
+    lines that fail at the first grid point are then searched towards `lower` with steps doubling at each model call,
+    until the performance function is positive. For each line, the first interval in which the performance function
+    changes from positive to non-positive is refined with the Illinois (regula falsi) method, evaluating all the
+    unconverged lines with a single model call per iteration.
+
+    **Input:**
+
+    :param nataf_object: Nataf object defining the transformation from **U** to **X**
+    :type nataf_object: Nataf object
+
+    :param runmodel_object: Model evaluating the performance function
+    :type runmodel_object: RunModel object
+
+    :param origins: Origins of the lines in the standard normal space, of shape (nlines, dimension)
+    :type origins: numpy array
+
+    :param directions: Unit directions of the lines, of shape (nlines, dimension)
+    :type directions: numpy array
+
+    :param grid: Increasing distances along the lines used to bracket the roots
+    :type grid: numpy array
+
+    :param tol: Tolerance on the distance to the limit state
+    :type tol: float
+
+    :param max_iter: Maximum number of Illinois iterations
+    :type max_iter: int
+
+    :param lower: Smallest distance searched along the lines
+    :type lower: float
+
+    **Output/Returns:**
+
+    :param roots: Distance to the first crossing of each line, `inf` if the performance function is positive on the
+                  whole grid (and `lower` if it is non-positive from `lower` to the first grid point)
+    :type roots: numpy array
+
+    :param nevaluations: Number of model evaluations
+    :type nevaluations: int
+    """
+
+    def evaluate(t, lines):
+        points_u = origins[lines] + t[:, np.newaxis] * directions[lines]
+        points_z = Correlate(points_u, nataf_object.corr_z).samples_z
+        nataf_object.run(samples_z=points_z, jacobian=False)
+        runmodel_object.run(samples=np.atleast_2d(nataf_object.samples_x).reshape(t.size, -1))
+        return np.asarray(runmodel_object.qoi_list[-t.size:], dtype=float).reshape(-1)
+
+    nlines, ngrid = origins.shape[0], grid.size
+    lines = np.repeat(np.arange(nlines), ngrid)
+    g = evaluate(np.tile(grid, nlines), lines).reshape(nlines, ngrid)
+    nevaluations = nlines * ngrid
+
+    # First bracket of each line, from a safe grid point to the next failure grid point
+    failed = g <= 0
+    first = np.argmax(failed, axis=1)
+    has_root = np.any(failed, axis=1)
+    roots = np.full(nlines, np.inf)
+
+    active = np.nonzero(has_root & (first > 0))[0]
+    a, b = grid[first[active] - 1], grid[first[active]]
+    ga, gb = g[active, first[active] - 1], g[active, first[active]]
+
+    # Lines failing at the first grid point are searched towards lower distances until they are safe
+    below = np.nonzero(has_root & (first == 0))[0]
+    b_below, gb_below = np.full(below.size, float(grid[0])), g[below, 0]
+    step = (grid[-1] - grid[0]) / (ngrid - 1) if ngrid > 1 else 1.
+    step = step if step > 0 else 1.
+    while below.size > 0 and b_below[0] > lower:
+        t = np.maximum(b_below - step, lower)
+        gt = evaluate(t, below)
+        nevaluations = nevaluations + below.size
+
+        safe = gt > 0
+        active = np.concatenate([active, below[safe]])
+        a, b = np.concatenate([a, t[safe]]), np.concatenate([b, b_below[safe]])
+        ga, gb = np.concatenate([ga, gt[safe]]), np.concatenate([gb, gb_below[safe]])
+        below, b_below, gb_below = below[~safe], t[~safe], gt[~safe]
+        step = 2 * step
+    roots[below] = lower
+
+    side = np.zeros(active.size)
+    t = b
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        t = b - gb * (b - a) / (gb - ga)
+        gt = evaluate(t, active)
+        nevaluations = nevaluations + active.size
+
+        # Keep the bracket [a, b] with g(a) > 0 >= g(b), halving the weight of the retained end (Illinois)
+        safe = gt > 0
+        a, ga = np.where(safe, t, a), np.where(safe, gt, ga)
+        b, gb = np.where(safe, b, t), np.where(safe, gb, gt)
+        gb = np.where(safe & (side == 1), gb / 2, gb)
+        ga = np.where(~safe & (side == -1), ga / 2, ga)
+        side = np.where(safe, 1, -1)
+
+        converged = (b - a < tol) | (gt == 0)
+        roots[active[converged]] = t[converged]
+        keep = ~converged
+        active, a, b, ga, gb, side, t = active[keep], a[keep], b[keep], ga[keep], gb[keep], side[keep], t[keep]
+
+    # Lines that did not converge within max_iter use the last estimate
+    roots[active] = t
+
+    return roots, nevaluations
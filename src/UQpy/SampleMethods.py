@@ -23,6 +23,7 @@ The module currently contains the following classes:
 - ``LHS``: Class to perform Latin hypercube sampling.
 - ``MCMC``: Class to perform Markov Chain Monte Carlo sampling.
 - ``IS``: Class to perform Importance sampling.
+- ``TMCMC``: Class to perform transitional Markov Chain Monte Carlo sampling.
 - ``AKMCS``: Class to perform adaptive Kriging Monte Carlo sampling.
 - ``STS``: Class to perform stratified sampling.
 - ``RSS``: Class to perform refined stratified sampling.
@@ -32,7 +33,7 @@ The module currently contains the following classes:
 
 import copy
 
-from scipy.spatial.distance import pdist
+from scipy.spatial.distance import pdist, cdist
 
 from UQpy.Distributions import *
 from UQpy.Utilities import *
@@ -195,37 +196,26 @@ class MCS:
         if self.verbose:
             print('UQpy: Running Monte Carlo Sampling.')
 
-        if isinstance(self.dist_object, list):
+        if isinstance(self.dist_object, list) and self.array is True:
+            # One column per marginal, drawn with a single rvs call each
+            self.x = self._draw(nsamples, random_state)
+        elif isinstance(self.dist_object, list):
             temp_samples = list()
             for i in range(len(self.dist_object)):
                 if hasattr(self.dist_object[i], 'rvs'):
                     temp_samples.append(self.dist_object[i].rvs(nsamples=nsamples, random_state=random_state))
                 else:
-                    ValueError('UQpy: rvs method is missing.')
-            self.x = list()
-            for j in range(nsamples):
-                y = list()
-                for k in range(len(self.dist_object)):
-                    y.append(temp_samples[k][j])
-                self.x.append(np.array(y))
+                    raise ValueError('UQpy: rvs method is missing.')
+            self.x = [np.array(y) for y in zip(*temp_samples)]
         else:
             if hasattr(self.dist_object, 'rvs'):
-                temp_samples = self.dist_object.rvs(nsamples=nsamples, random_state=random_state)
-                self.x = temp_samples
+                self.x = self._draw(nsamples, random_state)
 
         if self.samples is None:
-            if isinstance(self.dist_object, list) and self.array is True:
-                self.samples = np.hstack(np.array(self.x)).T
-            else:
-                self.samples = np.array(self.x)
+            self.samples = np.array(self.x)
         else:
             # If self.samples already has existing samples, append the new samples to the existing attribute.
-            if isinstance(self.dist_object, list) and self.array is True:
-                self.samples = np.concatenate([self.samples, np.hstack(np.array(self.x)).T], axis=0)
-            elif isinstance(self.dist_object, Distribution):
-                self.samples = np.vstack([self.samples, self.x])
-            else:
-                self.samples = np.vstack([self.samples, self.x])
+            self.samples = np.concatenate([self.samples, np.array(self.x)], axis=0)
         self.nsamples = len(self.samples)
 
         if self.verbose:
@@ -247,40 +237,122 @@ class MCS:
 
         """
 
-        if isinstance(self.dist_object, list) and self.array is True:
-            zi = np.zeros_like(self.samples)
-            for i in range(self.nsamples):
-                z = self.samples[i, :]
-                for j in range(len(self.dist_object)):
-                    if hasattr(self.dist_object[j], 'cdf'):
-                        zi[i, j] = self.dist_object[j].cdf(z[j])
-                    else:
-                        raise ValueError('UQpy: All Distributions must have a cdf method.')
-            self.samplesU01 = zi
-
-        elif isinstance(self.dist_object, Distribution):
-            if hasattr(self.dist_object, 'cdf'):
-                zi = np.zeros_like(self.samples)
-                for i in range(self.nsamples):
-                    z = self.samples[i, :]
-                    zi[i, :] = self.dist_object.cdf(z)
-                self.samplesU01 = zi
-            else:
-                raise ValueError('UQpy: All Distributions must have a cdf method.')
-
-        elif isinstance(self.dist_object, list) and self.list is True:
-            temp_samples_u01 = list()
-            for i in range(self.nsamples):
-                z = self.samples[i][:]
-                y = [None] * len(self.dist_object)
-                for j in range(len(self.dist_object)):
-                    if hasattr(self.dist_object[j], 'cdf'):
-                        zi = self.dist_object[j].cdf(z[j])
-                    else:
-                        raise ValueError('UQpy: All Distributions must have a cdf method.')
-                    y[j] = zi
-                temp_samples_u01.append(np.array(y))
-            self.samplesU01 = temp_samples_u01
+        if isinstance(self.dist_object, list) and self.list is True:
+            # One cdf call per marginal over all the samples
+            columns = list()
+            for j in range(len(self.dist_object)):
+                if not hasattr(self.dist_object[j], 'cdf'):
+                    raise ValueError('UQpy: All Distributions must have a cdf method.')
+                columns.append(np.asarray(self.dist_object[j].cdf(np.array([z[j] for z in self.samples]))).reshape(-1))
+            self.samplesU01 = [np.array(y) for y in zip(*columns)]
+        else:
+            self.samplesU01 = self._cdf(self.samples)
+
+    def run_chunks(self, nsamples, chunk_size=100000, samples=None, samples_u01=None, transform_u01=False,
+                   random_state=None):
+        """
+        Generate Monte Carlo samples in chunks.
+
+        The ``run_chunks`` method is a generator that draws `nsamples` samples in consecutive blocks of at most
+        `chunk_size` samples, so that very large sample sets can be generated and processed without holding them in
+        memory. If `samples` (and `samples_u01`) are provided, each block is written in place into these preallocated
+        arrays, which may be memory-mapped (``numpy.memmap``). Unlike ``run``, this method does not store the samples
+        in the `samples` attribute.
+
+        This method is available when `dist_object` is a ``Distribution`` object or a list of
+        ``DistributionContinuous1D`` objects.
+
+        **Input:**
+
+        * **nsamples** (`int`):
+            Total number of samples to be drawn.
+
+        * **chunk_size** (`int`):
+            Maximum number of samples in each block.
+
+            Default: 100000
+
+        * **samples** (`ndarray`):
+            Preallocated array of shape `(nsamples, dimension)` in which the samples are written.
+
+        * **samples_u01** (`ndarray`):
+            Preallocated array of shape `(nsamples, dimension)` in which the samples transformed to the unit hypercube
+            are written. Providing `samples_u01` implies `transform_u01=True`.
+
+        * **transform_u01** (Boolean):
+            If True, the blocks are also transformed to the unit hypercube.
+
+        * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+            Random seed used to initialize the pseudo-random number generator. Default is the `random_state` of the
+            ``MCS`` object.
+
+        **Output/Returns:**
+
+        * (`tuple`):
+            For each block, a tuple `(start, block, block_u01)` with the index of the first sample of the block, the
+            samples of the block and their transformation to the unit hypercube (`None` if not requested). If
+            `samples` or `samples_u01` are provided, the blocks are views of these arrays.
+
+        """
+
+        if self.list is True:
+            raise ValueError('UQpy: run_chunks requires a Distribution object or a list of DistributionContinuous1D '
+                             'objects.')
+        if random_state is None:
+            random_state = self.random_state
+        elif isinstance(random_state, int):
+            random_state = np.random.RandomState(random_state)
+        elif not isinstance(random_state, np.random.RandomState):
+            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+        transform_u01 = transform_u01 or samples_u01 is not None
+
+        for start in range(0, nsamples, chunk_size):
+            stop = min(start + chunk_size, nsamples)
+            block = self._draw(stop - start, random_state)
+            if samples is not None:
+                samples[start:stop] = block
+                block = samples[start:stop]
+            block_u01 = None
+            if transform_u01:
+                block_u01 = self._cdf(block)
+                if samples_u01 is not None:
+                    samples_u01[start:stop] = block_u01
+                    block_u01 = samples_u01[start:stop]
+            yield start, block, block_u01
+
+    def _draw(self, nsamples, random_state):
+        """
+        Draw samples from a ``Distribution`` object or a list of ``DistributionContinuous1D`` objects as an array of
+        shape `(nsamples, dimension)`.
+        """
+
+        if isinstance(self.dist_object, list):
+            for dist in self.dist_object:
+                if not hasattr(dist, 'rvs'):
+                    raise ValueError('UQpy: rvs method is missing.')
+            return np.hstack([np.reshape(dist.rvs(nsamples=nsamples, random_state=random_state), (nsamples, -1))
+                              for dist in self.dist_object])
+        return np.asarray(self.dist_object.rvs(nsamples=nsamples, random_state=random_state))
+
+    def _cdf(self, samples):
+        """
+        Transform samples from a ``Distribution`` object or a list of ``DistributionContinuous1D`` objects to the unit
+        hypercube, with one cdf call per marginal.
+        """
+
+        if isinstance(self.dist_object, list):
+            u01 = np.zeros_like(samples, dtype=float)
+            for j in range(len(self.dist_object)):
+                if not hasattr(self.dist_object[j], 'cdf'):
+                    raise ValueError('UQpy: All Distributions must have a cdf method.')
+                u01[:, j] = self.dist_object[j].cdf(samples[:, j])
+            return u01
+        if not hasattr(self.dist_object, 'cdf'):
+            raise ValueError('UQpy: All Distributions must have a cdf method.')
+        # The cdf of each sample is assigned to all its coordinates
+        u01 = np.zeros_like(samples, dtype=float)
+        u01[:] = np.reshape(self.dist_object.cdf(samples), (-1, 1))
+        return u01
 
 ########################################################################################################################
 ########################################################################################################################
@@ -298,9 +370,10 @@ class LHS:
     * **dist_object** ((list of) ``Distribution`` object(s)):
         List of ``Distribution`` objects corresponding to each random variable.
 
-        All distributions in ``LHS`` must be independent. ``LHS`` does not generate correlated random variables.
-        Therefore, for multi-variate designs the `dist_object` must be a list of ``DistributionContinuous1D`` objects
-        or an object of the ``JointInd`` class.
+        All distributions in ``LHS`` must be independent. ``LHS`` does not generate correlated random variables, with
+        the exception of the rank correlation induced by the 'correlate' criterion. Therefore, for multi-variate
+        designs the `dist_object` must be a list of ``DistributionContinuous1D`` objects or an object of the
+        ``JointInd`` class.
 
     * **nsamples** (`int`):
         Number of samples to be drawn from each distribution.
@@ -311,7 +384,8 @@ class LHS:
                 1. 'random' - completely random. \n
                 2. 'centered' - points only at the centre. \n
                 3. 'maximin' - maximizing the minimum distance between points. \n
-                4. 'correlate' - minimizing the correlation between the points. \n
+                4. 'correlate' - minimizing the correlation between the variables, or imposing a target rank
+                correlation through the `corr_target` keyword argument. \n
                 5. `callable` - User-defined method.
 
     * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
@@ -323,6 +397,11 @@ class LHS:
     * **verbose** (`Boolean`):
         A boolean declaring whether to write text to the terminal.
 
+    * **dtype** (`str` or ``numpy.dtype``):
+        Floating point type of the `samples` and `samplesU01` arrays, e.g. 'float32' to halve the memory footprint of
+        large designs. The design itself is always constructed in double precision, but single precision cannot
+        resolve bins narrower than about 1e-7. Default: 'float64'
+
     * ****kwargs**
         Additional arguments to be passed to the method specified by `criterion`
 
@@ -338,7 +417,7 @@ class LHS:
 
     """
 
-    def __init__(self, dist_object, nsamples, criterion=None, random_state=None, verbose=False,
+    def __init__(self, dist_object, nsamples, criterion=None, random_state=None, verbose=False, dtype='float64',
                  **kwargs):
 
         # Check if a Distribution object is provided.
@@ -377,13 +456,16 @@ class LHS:
 
         # Set printing options
         self.verbose = verbose
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind != 'f':
+            raise ValueError('UQpy: dtype must be a floating point type.')
 
         if isinstance(self.dist_object, list):
-            self.samples = np.zeros([self.nsamples, len(self.dist_object)])
+            self.samples = np.zeros([self.nsamples, len(self.dist_object)], dtype=self.dtype)
         elif isinstance(self.dist_object, DistributionContinuous1D):
-            self.samples = np.zeros([self.nsamples, 1])
+            self.samples = np.zeros([self.nsamples, 1], dtype=self.dtype)
         elif isinstance(self.dist_object, JointInd):
-            self.samples = np.zeros([self.nsamples, len(self.dist_object.marginals)])
+            self.samples = np.zeros([self.nsamples, len(self.dist_object.marginals)], dtype=self.dtype)
 
         self.samplesU01 = np.zeros_like(self.samples)
 
@@ -398,7 +480,7 @@ class LHS:
         The ``run`` method is the function that performs random sampling in the ``LHS`` class. If `nsamples` is
         provided, the ``run`` method is automatically called when the ``LHS`` object is defined. The user may also call
         the ``run`` method directly to generate samples. The ``run`` method of the ``LHS`` class cannot be invoked
-        multiple times for sample size extension.
+        multiple times for sample size extension; use the ``extend`` method instead.
 
         **Input:**
 
@@ -425,11 +507,8 @@ class LHS:
         a = cut[:self.nsamples]
         b = cut[1:self.nsamples + 1]
 
-        u = np.zeros(shape=(self.samples.shape[0], self.samples.shape[1]))
-        samples = np.zeros_like(u)
-        for i in range(self.samples.shape[1]):
-            u[:, i] = stats.uniform.rvs(size=self.samples.shape[0], random_state=self.random_state)
-            samples[:, i] = u[:, i] * (b - a) + a
+        u = stats.uniform.rvs(size=self.samplesU01.shape, random_state=self.random_state)
+        samples = u * (b - a)[:, np.newaxis] + a[:, np.newaxis]
 
         if self.criterion == 'random' or self.criterion is None:
             u_lhs = self.random(samples, random_state=self.random_state)
@@ -444,21 +523,8 @@ class LHS:
         else:
             raise ValueError('UQpy: A valid criterion is required.')
 
-        self.samplesU01 = u_lhs
-
-        if isinstance(self.dist_object, list):
-            for j in range(len(self.dist_object)):
-                if hasattr(self.dist_object[j], 'icdf'):
-                    self.samples[:, j] = self.dist_object[j].icdf(u_lhs[:, j])
-
-        elif isinstance(self.dist_object, JointInd):
-            if all(hasattr(m, 'icdf') for m in self.dist_object.marginals):
-                for j in range(len(self.dist_object.marginals)):
-                    self.samples[:, j] = self.dist_object.marginals[j].icdf(u_lhs[:, j])
-
-        elif isinstance(self.dist_object, DistributionContinuous1D):
-            if hasattr(self.dist_object, 'icdf'):
-                self.samples = self.dist_object.icdf(u_lhs)
+        self.samplesU01 = np.asarray(u_lhs, dtype=self.dtype)
+        self.samples = self._icdf(u_lhs)
 
         if self.verbose:
             print('Successful execution of LHS design.')
@@ -485,21 +551,34 @@ class LHS:
             The randomly shuffled set of LHS samples.
         """
 
-        lhs_samples = np.zeros_like(samples)
-        nsamples = len(samples)
-        for j in range(samples.shape[1]):
-            if random_state is not None:
-                order = random_state.permutation(nsamples)
-            else:
-                order = np.random.permutation(nsamples)
-            lhs_samples[:, j] = samples[order, j]
+        if random_state is None:
+            random_state = np.random
+        # Sorting independent uniform keys gives an independent random permutation of every column at once. The
+        # permutations are applied to the transposed (contiguous) columns.
+        order = np.argsort(random_state.rand(samples.shape[1], samples.shape[0]), axis=1)
+        lhs_samples = np.take_along_axis(np.ascontiguousarray(samples.T), order, axis=1).T
 
         return lhs_samples
 
-    def max_min(self, samples, random_state=None, iterations=100, metric='euclidean'):
+    def max_min(self, samples, random_state=None, iterations=20, metric='euclidean', p=50, nrestarts=1,
+                nproposals=None, max_stall=3):
         """
         Method for generating a Latin hypercube design that aims to maximize the minimum sample distance.
 
+        The design is optimized with the enhanced stochastic evolutionary (ESE) algorithm of [12]_. At each step a
+        column of the design is selected, `nproposals` random exchanges of two entries of that column are evaluated, and
+        the best one is accepted if it does not deteriorate the design by more than a threshold. The threshold is
+        adapted after every outer iteration from the acceptance and improvement ratios. Designs are compared through
+        the :math:`\\phi_p` criterion [13]_
+
+        .. math:: \\phi_p = \\left(\\sum_{i<j} d_{ij}^{-p}\\right)^{1/p}
+
+        which tends to the inverse of the minimum distance as :math:`p \\to \\infty`. An exchange moves only two
+        points, so only their distances to the other points are recomputed and each candidate exchange costs O(N)
+        distance evaluations. Several independent restarts are advanced simultaneously and the best design is returned;
+        for the 'euclidean' and 'sqeuclidean' metrics the distances of all the restarts are computed with a single
+        batched matrix product.
+
         **Input:**
 
         * **samples** (`ndarray`):
@@ -509,14 +588,30 @@ class LHS:
             A ``numpy.RandomState`` object that fixes the seed of the pseudo random number generation.
 
         * **iterations** (`int`):
-            The number of iteration to run in the search for a maximin design.
+            Maximum number of outer iterations of the ESE algorithm (not the number of random designs tried). Each
+            outer iteration performs min(100, 10 `d`) column exchange steps, where `d` is the number of variables, and
+            updates the acceptance threshold. Default: 20
 
         * **metric** (`str` or `callable`):
             The distance metric to use.
                 Options:
                     1. `str` - Available options are those supported by ``scipy.spatial.distance``
                     2. User-defined function to compute the distance between samples. This function replaces the
-                       ``scipy.spatial.distance.pdist`` method.
+                       ``scipy.spatial.distance.pdist`` method. In this case (and for the 'mahalanobis' metric, which
+                       depends on the whole design) all pairwise distances are recomputed for every candidate exchange.
+
+        * **p** (`float`):
+            Exponent of the :math:`\\phi_p` criterion. Default: 50
+
+        * **nrestarts** (`int`):
+            Number of independent restarts of the optimization, run simultaneously. Default: 1
+
+        * **nproposals** (`int`):
+            Number of candidate exchanges evaluated at each step. Default: min(50, N(N-1)/10)
+
+        * **max_stall** (`int`):
+            The optimization stops when the best design of every restart has not improved for `max_stall` consecutive
+            outer iterations. If `None`, all the `iterations` are performed. Default: 3
 
         **Output/Returns:**
 
@@ -536,34 +631,174 @@ class LHS:
 
         if not isinstance(iterations, int):
             raise ValueError('UQpy: number of iterations must be an integer.')
+        if not isinstance(nrestarts, int) or nrestarts < 1:
+            raise ValueError('UQpy: nrestarts must be a positive integer.')
+        if max_stall is not None and (not isinstance(max_stall, int) or max_stall < 1):
+            raise ValueError('UQpy: max_stall must be None or a positive integer.')
+        if p <= 0:
+            raise ValueError('UQpy: The exponent p must be positive.')
+
+        nsamples, dimension = samples.shape
+        if nsamples < 2:
+            return LHS.random(samples, random_state)
+        if nproposals is None:
+            nproposals = max(1, min(50, nsamples * (nsamples - 1) // 10))
+        elif not isinstance(nproposals, int) or nproposals < 1:
+            raise ValueError('UQpy: nproposals must be a positive integer.')
+        ninner = min(100, 10 * dimension)
+
+        # The standardized Euclidean variances depend only on the column values, which exchanges do not modify.
+        metric_kwargs = {}
+        if metric == 'seuclidean':
+            metric_kwargs = {'V': np.var(samples, axis=0, ddof=1)}
 
         if isinstance(metric, str):
-            def d_func(x): return pdist(x, metric=metric)
+            def d_func(x): return pdist(x, metric=metric, **metric_kwargs)
         elif callable(metric):
             d_func = metric
         else:
             raise ValueError("UQpy: Please provide a valid metric.")
+        incremental = isinstance(metric, str) and metric != 'mahalanobis'
 
-        i = 0
-        lhs_samples = LHS.random(samples, random_state)
-        d = d_func(lhs_samples)
-        max_min_dist = np.min(d)
-        while i < iterations:
-            samples_try = LHS.random(samples, random_state)
-            d = d_func(samples_try)
-            if max_min_dist < np.min(d):
-                max_min_dist = np.min(d)
-                lhs_samples = copy.deepcopy(samples_try)
-            i = i + 1
+        designs = np.array([LHS.random(samples, random_state) for _ in range(nrestarts)])
+        if random_state is None:
+            random_state = np.random
+
+        # phi_p is accumulated on distances scaled by the minimum distance of each design, which keeps the terms
+        # d**(-p) representable for large p. The scale is refreshed whenever the running sum drifts away from O(1),
+        # since the incremental updates would otherwise lose their precision.
+        floor = 10. ** (-250. / p)
+        d0, s = np.ones(nrestarts), np.zeros(nrestarts)
+
+        def phi_terms(d, scale):
+            return np.maximum(d / scale, floor) ** (-p)
+
+        def rescale(r):
+            d = d_func(designs[r])
+            d0[r] = np.min(d[d > 0]) if np.any(d > 0) else 1.
+            s[r] = np.sum(phi_terms(d, d0[r]))
+
+        for r in range(nrestarts):
+            rescale(r)
+        phi = s ** (1. / p) / d0
+        threshold = 0.005 * phi
+        best, best_phi = designs.copy(), phi.copy()
+        restarts = np.arange(nrestarts)
+        stall = 0
+
+        for _ in range(iterations):
+            previous_best = best_phi.copy()
+            n_accept, n_improve = np.zeros(nrestarts), np.zeros(nrestarts)
+            for step in range(ninner):
+                k = step % dimension
+                i = random_state.randint(nsamples, size=(nrestarts, nproposals))
+                j = (i + random_state.randint(1, nsamples, size=(nrestarts, nproposals))) % nsamples
+
+                if incremental:
+                    delta = self._exchange_delta(designs, i, j, k, metric, metric_kwargs,
+                                                 lambda d: phi_terms(d, d0[:, np.newaxis, np.newaxis]))
+                else:
+                    delta = np.zeros((nrestarts, nproposals))
+                    for r in range(nrestarts):
+                        for c in range(nproposals):
+                            x = designs[r].copy()
+                            x[[i[r, c], j[r, c]], k] = x[[j[r, c], i[r, c]], k]
+                            delta[r, c] = np.sum(phi_terms(d_func(x), d0[r])) - s[r]
+
+                c = np.argmin(delta, axis=1)
+                s_new = np.maximum(s + delta[restarts, c], 0.)
+                phi_new = s_new ** (1. / p) / d0
+                accept = phi_new - phi <= threshold * random_state.rand(nrestarts)
+
+                ra = restarts[accept]
+                ia, ja = i[ra, c[ra]], j[ra, c[ra]]
+                temp = designs[ra, ia, k]
+                designs[ra, ia, k] = designs[ra, ja, k]
+                designs[ra, ja, k] = temp
+                s[accept] = s_new[accept]
+                for r in restarts[accept & ((s < 1e-6) | (s > 1e6))]:
+                    rescale(r)
+                phi = s ** (1. / p) / d0
+                n_accept += accept
+
+                improved = phi < best_phi
+                best[improved], best_phi[improved] = designs[improved], phi[improved]
+                n_improve += improved
+
+            # Re-synchronize the running sums to remove the round-off accumulated by the incremental updates.
+            for r in range(nrestarts):
+                rescale(r)
+            phi = s ** (1. / p) / d0
+
+            # Threshold update of the ESE algorithm: improvement process if the best design improved, exploration
+            # process otherwise.
+            accept_ratio, improve_ratio = n_accept / ninner, n_improve / ninner
+            improvement = best_phi < previous_best
+            threshold = np.where(improvement,
+                                 np.where(accept_ratio > 0.1,
+                                          np.where(improve_ratio < accept_ratio, 0.8 * threshold, threshold),
+                                          threshold / 0.8),
+                                 np.where(accept_ratio < 0.1, threshold / 0.7,
+                                          np.where(accept_ratio > 0.8, 0.9 * threshold, threshold)))
+
+            stall = 0 if np.any(improvement) else stall + 1
+            if max_stall is not None and stall >= max_stall:
+                break
+
+        lhs_samples = best[np.argmin(best_phi)]
 
         if self.verbose:
-            print('UQpy: Achieved maximum distance of ', max_min_dist)
+            print('UQpy: Achieved maximum distance of ', np.min(d_func(lhs_samples)))
 
         return lhs_samples
 
-    def correlate(self, samples, random_state=None, iterations=100):
+    @staticmethod
+    def _exchange_delta(x, i, j, k, metric, metric_kwargs, phi_terms):
+        """
+        Change of the sum of the phi_p terms caused by exchanging the entries of column `k` in rows `i` and `j` of the
+        designs `x` of shape (nrestarts, N, d), for every pair in `i` and `j` of shape (nrestarts, nproposals). Only
+        the distances of the two moved points are computed.
+        """
+        nrestarts, n = i.shape
+        restarts = np.arange(nrestarts)[:, np.newaxis]
+        old = np.concatenate([x[restarts, i], x[restarts, j]], axis=1)
+        new = old.copy()
+        new[:, :n, k], new[:, n:, k] = x[restarts, j, k], x[restarts, i, k]
+
+        if metric in ['euclidean', 'sqeuclidean']:
+            # Squared distances of all the restarts with batched matrix products
+            x_norm = np.sum(x ** 2, axis=2)[:, np.newaxis, :]
+
+            def distances(y):
+                d2 = np.matmul(y, np.swapaxes(x, 1, 2))
+                d2 *= -2
+                d2 += np.sum(y ** 2, axis=2)[:, :, np.newaxis] + x_norm
+                np.maximum(d2, 0., out=d2)
+                return d2 if metric == 'sqeuclidean' else np.sqrt(d2, out=d2)
+        else:
+            def distances(y):
+                return np.array([cdist(y[r], x[r], metric=metric, **metric_kwargs) for r in range(nrestarts)])
+
+        terms = phi_terms(distances(new)) - phi_terms(distances(old))
+        # The distance between the two moved points is unchanged, and their distances to their own previous positions
+        # are not pairwise distances of the design.
+        pairs = np.arange(2 * n)[np.newaxis, :]
+        terms[restarts, pairs, np.tile(i, 2)] = 0.
+        terms[restarts, pairs, np.tile(j, 2)] = 0.
+        return terms[:, :n].sum(axis=2) + terms[:, n:].sum(axis=2)
+
+    def correlate(self, samples, random_state=None, iterations=100, corr_target=None):
         """
-        Method for generating a Latin hypercube design that aims to minimize spurious correlations.
+        Method for generating a Latin hypercube design that aims to minimize spurious correlations, or to impose a
+        target rank correlation between the variables.
+
+        The samples are paired with the rank-based reordering of Iman and Conover [14]_. Van der Waerden scores
+        :math:`\\Phi^{-1}(i/(N+1))` are arranged with the ranks of the current design, decorrelated with the Cholesky
+        factor :math:`Q` of their sample correlation matrix, correlated with the Cholesky factor :math:`P` of the
+        target (mapped to the equivalent Pearson correlation of normal scores), and each column of the design is then
+        reordered to follow the ranks of the transformed scores. The reordering is repeated, starting each time from
+        the achieved pairing, as long as it reduces the largest deviation of the rank correlation matrix from the
+        target by more than 1%. Each pass costs O(N d^2 + d N log(N)) operations.
 
         **Input:**
 
@@ -574,35 +809,70 @@ class LHS:
             A ``numpy.RandomState`` object that fixes the seed of the pseudo random number generation.
 
         * **iterations** (`int`):
-            The number of iteration to run in the search for a maximin design.
+            The maximum number of reordering passes.
+
+        * **corr_target** (`ndarray`):
+            Target rank correlation matrix of shape ``(dimension, dimension)``. It must be symmetric and positive
+            definite with unit diagonal. Default: identity matrix (uncorrelated design).
 
         **Output/Returns:**
 
         * **lhs_samples** (`ndarray`)
-            The minimum correlation set of LHS samples.
+            The minimum correlation set of LHS samples, or the set of LHS samples with rank correlation closest to
+            `corr_target`.
 
         """
 
         if not isinstance(iterations, int):
             raise ValueError('UQpy: number of iterations must be an integer.')
 
-        i = 0
+        nsamples, dimension = samples.shape
+        if corr_target is None:
+            corr_target = np.eye(dimension)
+        else:
+            corr_target = np.atleast_2d(np.asarray(corr_target, dtype=float))
+            if corr_target.shape != (dimension, dimension):
+                raise ValueError('UQpy: corr_target must be a matrix of shape (dimension, dimension).')
+            if not np.allclose(corr_target, corr_target.T) or not np.allclose(np.diag(corr_target), 1.):
+                raise ValueError('UQpy: corr_target must be symmetric with unit diagonal.')
+        # The scores are normal, so the rank correlation is imposed through the equivalent Pearson correlation.
+        try:
+            p = np.linalg.cholesky(2 * np.sin(np.pi / 6 * corr_target))
+        except np.linalg.LinAlgError:
+            raise ValueError('UQpy: corr_target must be positive definite.')
+
         lhs_samples = LHS.random(samples, random_state)
-        r = np.corrcoef(np.transpose(lhs_samples))
-        np.fill_diagonal(r, 1)
-        r1 = r[r != 1]
-        min_corr = np.max(np.abs(r1))
-        while i < iterations:
-            samples_try = LHS.random(samples, random_state)
-            r = np.corrcoef(np.transpose(samples_try))
-            np.fill_diagonal(r, 1)
-            r1 = r[r != 1]
-            if np.max(np.abs(r1)) < min_corr:
-                min_corr = np.max(np.abs(r1))
-                lhs_samples = copy.deepcopy(samples_try)
-            i = i + 1
+        if dimension == 1 or nsamples <= dimension:
+            return lhs_samples
+
+        sorted_samples = np.sort(samples, axis=0)
+        scores = stats.norm.ppf(np.arange(1, nsamples + 1) / (nsamples + 1))
+        ranks = np.argsort(np.argsort(lhs_samples, axis=0), axis=0)
+
+        def rank_corr_error(r):
+            return np.max(np.abs(np.corrcoef(r, rowvar=False) - corr_target))
+
+        min_error = rank_corr_error(ranks)
+        for _ in range(iterations):
+            x = scores[ranks]
+            try:
+                q = np.linalg.cholesky(np.corrcoef(x, rowvar=False))
+            except np.linalg.LinAlgError:
+                break
+            t = np.linalg.solve(q, x.T).T @ p.T
+            ranks_try = np.argsort(np.argsort(t, axis=0), axis=0)
+            error = rank_corr_error(ranks_try)
+            if error < min_error:
+                ranks, min_error, improvement = ranks_try, error, min_error - error
+            else:
+                improvement = 0.
+            if improvement <= 0.01 * min_error:
+                break
+
+        lhs_samples = np.take_along_axis(sorted_samples, ranks, axis=0)
+
         if self.verbose:
-            print('UQpy: Achieved minimum correlation of ', min_corr)
+            print('UQpy: Achieved maximum deviation from the target rank correlation of ', min_error)
 
         return lhs_samples
 
@@ -632,15 +902,92 @@ class LHS:
         """
 
         u_temp = (a + b) / 2
-        lhs_samples = np.zeros([samples.shape[0], samples.shape[1]])
-        for i in range(samples.shape[1]):
-            if random_state is not None:
-                lhs_samples[:, i] = random_state.permutation(u_temp)
-            else:
-                lhs_samples[:, i] = np.random.permutation(u_temp)
+        lhs_samples = LHS.random(np.tile(u_temp[:, np.newaxis], (1, samples.shape[1])), random_state)
 
         return lhs_samples
 
+    def extend(self, nsamples):
+        """
+        Extend the Latin hypercube design with additional samples, without regenerating the existing ones.
+
+        The range of each variable is divided into `N` + `nsamples` bins of equal probability, where `N` is the current
+        number of samples. The new samples are placed in bins that do not contain an existing sample (at the centre of
+        the bin for the 'centered' criterion, randomly inside it otherwise) and randomly paired [15]_. If `N` +
+        `nsamples` is a multiple of `N`, every existing sample lies in its own bin and the extended design is a Latin
+        hypercube design. Otherwise two existing samples may share a bin, in which case the new samples are placed in a
+        random subset of the empty bins and the extended design is only approximately Latin.
+
+        **Input:**
+
+        * **nsamples** (`int`):
+            Number of samples to add to the design.
+
+        **Output/Returns:**
+
+        The ``extend`` method has no returns, although it appends the new samples to the `samples` and `samplesU01`
+        attributes of the ``LHS`` object.
+
+        """
+
+        if not isinstance(nsamples, int) or nsamples < 1:
+            raise ValueError('UQpy: nsamples must be a positive integer.')
+
+        random_state = np.random if self.random_state is None else self.random_state
+        u01 = np.reshape(self.samplesU01, (self.nsamples, -1)).astype(float)
+        ntotal = self.nsamples + nsamples
+
+        occupied = np.zeros((ntotal, u01.shape[1]), dtype=bool)
+        occupied[np.minimum(np.floor(u01 * ntotal).astype(int), ntotal - 1), np.arange(u01.shape[1])] = True
+        # Empty bins are visited in a random order in every column, which also pairs the new samples randomly.
+        keys = np.where(occupied, np.inf, random_state.rand(ntotal, u01.shape[1]))
+        bins = np.argsort(keys, axis=0)[:nsamples]
+        if self.criterion == 'centered':
+            u_new = (bins + 0.5) / ntotal
+        else:
+            u_new = (bins + random_state.rand(nsamples, u01.shape[1])) / ntotal
+
+        samples_new = self._icdf(u_new)
+        self.samplesU01 = np.concatenate([np.reshape(self.samplesU01, u01.shape), u_new.astype(self.dtype)])
+        self.samples = np.concatenate([self.samples, np.reshape(samples_new, (nsamples,) + self.samples.shape[1:])])
+        self.nsamples = ntotal
+
+        if self.verbose:
+            print('UQpy: Extended the LHS design to ', ntotal, ' samples.')
+
+    def _icdf(self, u01):
+        """
+        Transform samples from the unit hypercube with the inverse cdf of the marginals, with one icdf call per
+        distinct ``Distribution`` object.
+        """
+
+        from UQpy.Distributions import DistributionContinuous1D, JointInd
+
+        samples = np.zeros(u01.shape, dtype=self.dtype)
+        if isinstance(self.dist_object, list):
+            marginals = self.dist_object
+        elif isinstance(self.dist_object, JointInd):
+            marginals = self.dist_object.marginals
+            if not all(hasattr(m, 'icdf') for m in marginals):
+                return samples
+        else:
+            marginals = [self.dist_object]
+
+        # Variables sharing the same Distribution object are transformed together.
+        columns = {}
+        for j, dist in enumerate(marginals):
+            if hasattr(dist, 'icdf'):
+                columns.setdefault(id(dist), []).append(j)
+        for cols in columns.values():
+            if len(cols) == u01.shape[1]:
+                samples[:] = np.reshape(marginals[cols[0]].icdf(np.ravel(u01)), u01.shape)
+            else:
+                x = marginals[cols[0]].icdf(np.ravel(u01[:, cols]))
+                samples[:, cols] = np.reshape(x, (u01.shape[0], len(cols)))
+
+        if isinstance(self.dist_object, DistributionContinuous1D) and hasattr(self.dist_object, 'icdf'):
+            samples = samples[:, 0]
+        return samples
+
 ########################################################################################################################
 ########################################################################################################################
 #                                         Class Strata
@@ -1104,20 +1451,15 @@ class VoronoiStrata(Strata):
             Volume of the Voronoi cell.
         """
 
-        from scipy.spatial import Delaunay, ConvexHull
+        from scipy.spatial import Delaunay
 
         tess = Delaunay(vertices)
-        dimension = np.shape(vertices)[1]
 
-        w = np.zeros((tess.nsimplex, 1))
-        cent = np.zeros((tess.nsimplex, dimension))
-        for i in range(tess.nsimplex):
-            ch = ConvexHull(tess.points[tess.simplices[i]])
-            w[i] = ch.volume
-            cent[i, :] = np.mean(tess.points[tess.simplices[i]], axis=0)
+        # Centroids and volumes of all simplices of the triangulation of the cell at once
+        cent, w = DelaunayStrata.compute_delaunay_centroid_volume(tess.points[tess.simplices])
 
         volume = np.sum(w)
-        centroid = np.matmul(np.divide(w, volume).T, cent)
+        centroid = np.matmul(np.divide(w, volume).reshape((1, -1)), cent)
 
         return centroid, volume
 
@@ -1210,14 +1552,9 @@ class DelaunayStrata(Strata):
         initial_seeds = np.unique([tuple(row) for row in initial_seeds], axis=0)
 
         self.delaunay = Delaunay(initial_seeds)
-        self.centroids = np.zeros([0, self.dimension])
-        self.volume = np.zeros([0])
-        count = 0
-        for sim in self.delaunay.simplices:  # extract simplices from Delaunay triangulation
-            cent, vol = self.compute_delaunay_centroid_volume(self.delaunay.points[sim])
-            self.centroids = np.vstack([self.centroids, cent])
-            self.volume = np.hstack([self.volume, np.array([vol])])
-            count = count + 1
+        # extract simplices from Delaunay triangulation, and compute their centroids and volumes at once
+        self.centroids, self.volume = self.compute_delaunay_centroid_volume(
+            self.delaunay.points[self.delaunay.simplices])
 
         if self.verbose:
             print('UQpy: Delaunay stratification created.')
@@ -1227,26 +1564,32 @@ class DelaunayStrata(Strata):
         """
         This function computes the centroid and volume of a Delaunay simplex from its vertices.
 
+        The volume is computed in closed form as :math:`|det(v_1 - v_0, ..., v_n - v_0)| / n!`. Several simplices can be
+        processed at once, in which case the determinants are computed in a single batched call. Degenerate simplices
+        have zero volume.
+
         **Inputs:**
 
         * **vertices** (`ndarray`):
-            Coordinates of the vertices of the simplex.
+            Coordinates of the vertices of the simplex, `ndarray` of shape (dimension + 1, dimension), or of the
+            simplices, `ndarray` of shape (nsimplex, dimension + 1, dimension).
 
         **Output/Returns:**
 
         * **centroid** (`numpy.ndarray`):
-            Centroid of the Delaunay simplex.
+            Centroid of the Delaunay simplex, `ndarray` of shape (dimension, ) (or (nsimplex, dimension)).
 
         * **volume** (`numpy.ndarray`):
-            Volume of the Delaunay simplex.
+            Volume of the Delaunay simplex, `float` (or `ndarray` of shape (nsimplex, )).
         """
+        vertices = np.asarray(vertices, dtype=float)
+        dimension = vertices.shape[-1]
+        if vertices.shape[-2] != dimension + 1:
+            raise NotImplementedError("UQpy: Size of simplex (vertices) is not consistent.")
 
-        from scipy.spatial import ConvexHull
-
-        ch = ConvexHull(vertices)
-        volume = ch.volume
-        # ch.volume: float = ch.volume
-        centroid = np.mean(vertices, axis=0)
+        edges = vertices[..., 1:, :] - vertices[..., :1, :]
+        volume = np.abs(np.linalg.det(edges)) / np.prod(np.arange(1, dimension + 1, dtype=float))
+        centroid = np.mean(vertices, axis=-2)
 
         return centroid, volume
 
@@ -1588,9 +1931,9 @@ class VoronoiSTS(STS):
         unit hypercube. It has the same inputs and outputs as the ``create_samplesu01`` method in the parent class. See
         the ``STS`` class for additional details.
         """
-        from scipy.spatial import Delaunay, ConvexHull
+        from scipy.spatial import Delaunay
 
-        samples_in_strata, weights = list(), list()
+        nodes_of_samples, weights = list(), list()
         for j in range(len(self.strata_object.vertices)):  # For each bounded region (Voronoi stratification)
             vertices = self.strata_object.vertices[j][:-1, :]
             seed = self.strata_object.seeds[j, :].reshape(1, -1)
@@ -1600,30 +1943,20 @@ class VoronoiSTS(STS):
             delaunay_obj = Delaunay(seed_and_vertices)
 
             # Compute volume of each delaunay
-            volume = list()
-            for i in range(len(delaunay_obj.vertices)):
-                vert = delaunay_obj.vertices[i]
-                ch = ConvexHull(seed_and_vertices[vert])
-                volume.append(ch.volume)
+            _, volume = DelaunayStrata.compute_delaunay_centroid_volume(seed_and_vertices[delaunay_obj.simplices])
 
+            # Choose the simplex of all samples of the stratum at once, samples are drawn below for all strata
             temp_prob = np.array(volume) / sum(volume)
-            a = list(range(len(delaunay_obj.vertices)))
-            for k in range(int(self.nsamples_per_stratum[j])):
-                simplex = self.random_state.choice(a, p=temp_prob)
+            nsamples_j = int(self.nsamples_per_stratum[j])
+            simplices = self.random_state.choice(len(delaunay_obj.simplices), size=nsamples_j, p=temp_prob)
+            nodes_of_samples.append(seed_and_vertices[delaunay_obj.simplices[simplices]])
 
-                new_samples = Simplex(nodes=seed_and_vertices[delaunay_obj.vertices[simplex]], nsamples=1,
-                                      random_state=self.random_state).samples
-
-                samples_in_strata.append(new_samples)
-
-            if int(self.nsamples_per_stratum[j]) != 0:
-                weights.extend(
-                    [self.strata_object.volume[j] / self.nsamples_per_stratum[j]] * int(self.nsamples_per_stratum[j]))
-            else:
-                weights.extend([0] * int(self.nsamples_per_stratum[j]))
+            if nsamples_j != 0:
+                weights.extend([self.strata_object.volume[j] / self.nsamples_per_stratum[j]] * nsamples_j)
 
         self.weights = weights
-        self.samplesU01 = np.concatenate(samples_in_strata, axis=0)
+        self.samplesU01 = Simplex.sample_simplices(np.concatenate(nodes_of_samples, axis=0),
+                                                   random_state=self.random_state)
 
 
 class DelaunaySTS(STS):
@@ -1659,23 +1992,16 @@ class DelaunaySTS(STS):
         the ``STS`` class for additional details.
         """
 
-        samples_in_strata, weights = [], []
-        count = 0
-        for simplex in self.strata_object.delaunay.simplices:  # extract simplices from Delaunay triangulation
-            samples_temp = Simplex(nodes=self.strata_object.delaunay.points[simplex],
-                                   nsamples=int(self.nsamples_per_stratum[count]), random_state=self.random_state)
-            samples_in_strata.append(samples_temp.samples)
-            if int(self.nsamples_per_stratum[count]) != 0:
-                weights.extend(
-                    [self.strata_object.volume[count] / self.nsamples_per_stratum[count]] * int(
-                        self.nsamples_per_stratum[
-                            count]))
-            else:
-                weights.extend([0] * int(self.nsamples_per_stratum[count]))
-            count = count + 1
-
-        self.weights = np.array(weights)
-        self.samplesU01 = np.concatenate(samples_in_strata, axis=0)
+        delaunay = self.strata_object.delaunay
+        nsamples_per_stratum = np.asarray(self.nsamples_per_stratum).astype(int)
+        # extract simplices from Delaunay triangulation and sample all of them at once
+        self.samplesU01 = Simplex.sample_simplices(delaunay.points[delaunay.simplices],
+                                                   nsamples_per_simplex=nsamples_per_stratum,
+                                                   random_state=self.random_state)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weights_per_stratum = np.where(nsamples_per_stratum != 0,
+                                           np.asarray(self.strata_object.volume) / nsamples_per_stratum, 0.)
+        self.weights = np.repeat(weights_per_stratum, nsamples_per_stratum)
 
 
 ########################################################################################################################
@@ -2191,23 +2517,14 @@ class VoronoiRSS(RSS):
         self._add_boundary_points_and_construct_delaunay()
 
         dy_dx_old = 0
-        self.mesh.old_vertices = self.mesh.vertices
+        self.mesh.old_vertices = self.mesh.simplices
 
         # Primary loop for adding samples and performing refinement.
         for i in range(self.samples.shape[0], self.nsamples, self.n_add):
             p = min(self.n_add, self.nsamples - i)  # Number of points to add in this iteration
 
             # Compute the centroids and the volumes of each simplex cell in the mesh
-            self.mesh.centroids = np.zeros([self.mesh.nsimplex, self.dimension])
-            self.mesh.volumes = np.zeros([self.mesh.nsimplex, 1])
-            from scipy.spatial import qhull, ConvexHull
-            for j in range(self.mesh.nsimplex):
-                try:
-                    ConvexHull(self.points[self.mesh.vertices[j]])
-                    self.mesh.centroids[j, :], self.mesh.volumes[j] = \
-                        DelaunayStrata.compute_delaunay_centroid_volume(self.points[self.mesh.vertices[j]])
-                except qhull.QhullError:
-                    self.mesh.centroids[j, :], self.mesh.volumes[j] = np.mean(self.points[self.mesh.vertices[j]]), 0
+            new_to_old = self._update_mesh_centroids_volumes()
 
             # If the quantity of interest is a dictionary, convert it to a list
             qoi = [None] * len(self.runmodel_object.qoi_list)
@@ -2230,22 +2547,9 @@ class VoronoiRSS(RSS):
             else:
                 # Use only max_train_size points to train the surrogate model (more economical option)
                 # Build a mapping from the new vertex indices to the old vertex indices.
-                self.mesh.new_vertices, self.mesh.new_indices = [], []
-                self.mesh.new_to_old = np.zeros([self.mesh.vertices.shape[0], ]) * np.nan
-                j, k = 0, 0
-                while j < self.mesh.vertices.shape[0] and k < self.mesh.old_vertices.shape[0]:
-
-                    if np.all(self.mesh.vertices[j, :] == self.mesh.old_vertices[k, :]):
-                        self.mesh.new_to_old[j] = int(k)
-                        j += 1
-                        k = 0
-                    else:
-                        k += 1
-                        if k == self.mesh.old_vertices.shape[0]:
-                            self.mesh.new_vertices.append(self.mesh.vertices[j])
-                            self.mesh.new_indices.append(j)
-                            j += 1
-                            k = 0
+                self.mesh.new_to_old = np.where(new_to_old >= 0, new_to_old, np.nan)
+                self.mesh.new_indices = list(np.nonzero(new_to_old < 0)[0])
+                self.mesh.new_vertices = list(self.mesh.simplices[self.mesh.new_indices])
 
                 # Find the nearest neighbors to the most recently added point
                 from sklearn.neighbors import NearestNeighbors
@@ -2256,8 +2560,8 @@ class VoronoiRSS(RSS):
                 # For every simplex, check if at least dimension-1 vertices are in the neighbor set.
                 # Only update the gradient in simplices that meet this criterion.
                 update_list = []
-                for j in range(self.mesh.vertices.shape[0]):
-                    self.vertices_in_U01 = self.points_to_samplesU01[self.mesh.vertices[j]]
+                for j in range(self.mesh.simplices.shape[0]):
+                    self.vertices_in_U01 = self.points_to_samplesU01[self.mesh.simplices[j]]
                     self.vertices_in_U01[np.isnan(self.vertices_in_U01)] = 10 ** 18
                     v_set = set(self.vertices_in_U01)
                     v_list = list(self.vertices_in_U01)
@@ -2290,14 +2594,10 @@ class VoronoiRSS(RSS):
             # Eq. (19) from the following reference:
             # Good, I.J. and Gaskins, R.A. (1971). The Centroid Method of Numerical Integration. Numerische
             #       Mathematik. 16: 343--359.
-            var = np.zeros((self.mesh.nsimplex, self.dimension))
-            s = np.zeros(self.mesh.nsimplex)
-            for j in range(self.mesh.nsimplex):
-                for k in range(self.dimension):
-                    std = np.std(self.points[self.mesh.vertices[j]][:, k])
-                    var[j, k] = (self.mesh.volumes[j] * math.factorial(self.dimension) /
-                                 math.factorial(self.dimension + 2)) * (self.dimension * std ** 2)
-                s[j] = np.sum(dy_dx[j, :] * var[j, :] * dy_dx[j, :]) * (self.mesh.volumes[j] ** 2)
+            std = np.std(self.points[self.mesh.simplices], axis=1)
+            var = (self.mesh.volumes * math.factorial(self.dimension) /
+                   math.factorial(self.dimension + 2)) * (self.dimension * std ** 2)
+            s = np.sum(dy_dx * var * dy_dx, axis=1) * (self.mesh.volumes[:, 0] ** 2)
             dy_dx_old = dy_dx
 
             # 'p' is number of samples to be added in the current iteration
@@ -2347,21 +2647,10 @@ class VoronoiRSS(RSS):
             # --------------------------------
 
             # Compute the centroids and the volumes of each simplex cell in the mesh
-            self.mesh.centroids = np.zeros([self.mesh.nsimplex, self.dimension])
-            self.mesh.volumes = np.zeros([self.mesh.nsimplex, 1])
-            from scipy.spatial import qhull, ConvexHull
-            for j in range(self.mesh.nsimplex):
-                try:
-                    ConvexHull(self.points[self.mesh.vertices[j]])
-                    self.mesh.centroids[j, :], self.mesh.volumes[j] = \
-                        DelaunayStrata.compute_delaunay_centroid_volume(self.points[self.mesh.vertices[j]])
-                except qhull.QhullError:
-                    self.mesh.centroids[j, :], self.mesh.volumes[j] = np.mean(self.points[self.mesh.vertices[j]]), 0
+            self._update_mesh_centroids_volumes()
 
             # Determine the simplex to break and draw a new sample
-            s = np.zeros(self.mesh.nsimplex)
-            for j in range(self.mesh.nsimplex):
-                s[j] = self.mesh.volumes[j] ** 2
+            s = self.mesh.volumes[:, 0] ** 2
 
             # 'p' is number of samples to be added in the current iteration
             bin2add = self.identify_bins(strata_metric=s, p_=p)
@@ -2386,6 +2675,43 @@ class VoronoiRSS(RSS):
             if self.verbose:
                 print("Iteration:", i)
 
+    def _update_mesh_centroids_volumes(self):
+        """
+        This method computes the centroids and volumes of the simplices of the mesh, in the attributes `centroids` and
+        `volumes` of the `mesh`.
+
+        Simplices that were not modified by the last refinement are identified by their (sorted) vertex indices, and
+        their centroids and volumes are copied from the previous iteration. Only the new simplices are computed, with
+        batched determinants (see ``DelaunayStrata.compute_delaunay_centroid_volume``).
+
+        **Output/Returns:**
+
+        * **new_to_old** (`ndarray`):
+            Index of each simplex in the previous mesh, -1 for the new simplices.
+        """
+        simplices = np.sort(self.mesh.simplices, axis=1)
+        nsimplex = simplices.shape[0]
+        new_to_old = -np.ones((nsimplex, ), dtype=int)
+        centroids, volumes = np.zeros([nsimplex, self.dimension]), np.zeros([nsimplex, 1])
+        if getattr(self.mesh, 'sorted_simplices', None) is not None:
+            old_simplices = self.mesh.sorted_simplices
+            _, inverse = np.unique(np.concatenate([old_simplices, simplices]), axis=0, return_inverse=True)
+            inverse = inverse.reshape((-1, ))
+            position = -np.ones((np.max(inverse) + 1, ), dtype=int)
+            position[inverse[:old_simplices.shape[0]]] = np.arange(old_simplices.shape[0])
+            new_to_old = position[inverse[old_simplices.shape[0]:]]
+            kept = new_to_old >= 0
+            centroids[kept] = self.mesh.centroids[new_to_old[kept]]
+            volumes[kept] = self.mesh.volumes[new_to_old[kept]]
+
+        kept = new_to_old >= 0
+        if np.any(~kept):
+            centroids[~kept], volumes[~kept, 0] = DelaunayStrata.compute_delaunay_centroid_volume(
+                self.points[self.mesh.simplices[~kept]])
+
+        self.mesh.centroids, self.mesh.volumes, self.mesh.sorted_simplices = centroids, volumes, simplices
+        return new_to_old
+
     def _generate_sample(self, bin_):
         """
         This method create a subsimplex inside a Dealaunay Triangle and generate a random sample inside it using
@@ -2429,7 +2755,7 @@ class VoronoiRSS(RSS):
         p_ = new_point.shape[0]
         # Update the matrices to have recognize the new point
         self.points_to_samplesU01 = np.hstack([self.points_to_samplesU01, np.arange(i_, i_ + p_)])
-        self.mesh.old_vertices = self.mesh.vertices
+        self.mesh.old_vertices = self.mesh.simplices
 
         # Update the Delaunay triangulation mesh to include the new point.
         self.mesh.add_points(new_point)
@@ -2550,27 +2876,45 @@ class Simplex:
 
         """
         self.nsamples = nsamples
-        dimension = self.nodes.shape[1]
-        if dimension > 1:
-            sample = np.zeros([self.nsamples, dimension])
-            for i in range(self.nsamples):
-                r = np.zeros([dimension])
-                ad = np.zeros(shape=(dimension, len(self.nodes)))
-                for j in range(dimension):
-                    b_ = list()
-                    for k in range(1, len(self.nodes)):
-                        ai = self.nodes[k, j] - self.nodes[k - 1, j]
-                        b_.append(ai)
-                    ad[j] = np.hstack((self.nodes[0, j], b_))
-                    r[j] = stats.uniform.rvs(loc=0, scale=1, random_state=self.random_state) ** (1 / (dimension - j))
-                d = np.cumprod(r)
-                r_ = np.hstack((1, d))
-                sample[i, :] = np.dot(ad, r_)
-        else:
-            a = min(self.nodes)
-            b = max(self.nodes)
-            sample = a + (b - a) * stats.uniform.rvs(size=[self.nsamples, dimension], random_state=self.random_state)
-        return sample
+        return self.sample_simplices(self.nodes[np.newaxis, :, :], nsamples_per_simplex=nsamples,
+                                     random_state=self.random_state)
+
+    @staticmethod
+    def sample_simplices(nodes, nsamples_per_simplex=1, random_state=None):
+        """
+        Generate uniform random samples inside several simplices at once.
+
+        The barycentric coordinates of the samples are drawn from a flat Dirichlet distribution, i.e., as normalized
+        exponential random variables, and mapped to the simplices in a single batched product with their vertices.
+
+        **Inputs:**
+
+        * **nodes** (`ndarray`):
+            Vertices of the simplices, `ndarray` of shape (nsimplex, dimension + 1, dimension).
+
+        * **nsamples_per_simplex** (`int` or `ndarray`):
+            Number of samples to generate inside each simplex, either a single value or one value per simplex.
+            Default: 1
+
+        * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+            Random seed used to initialize the pseudo-random number generator. Default is None.
+
+        **Output/Returns:**
+
+        * **samples** (`ndarray`):
+            Samples, `ndarray` of shape (sum(nsamples_per_simplex), dimension), ordered by simplex.
+
+        """
+        nodes = np.asarray(nodes, dtype=float)
+        if nodes.ndim != 3 or nodes.shape[1] != nodes.shape[2] + 1:
+            raise NotImplementedError("UQpy: Size of simplices (nodes) is not consistent.")
+        nsamples_per_simplex = np.broadcast_to(np.asarray(nsamples_per_simplex, dtype=int), (nodes.shape[0], ))
+        simplex_index = np.repeat(np.arange(nodes.shape[0]), nsamples_per_simplex)
+
+        unif_rvs = stats.uniform.rvs(size=(simplex_index.size, nodes.shape[1]), random_state=random_state)
+        barycentric = -np.log(1. - unif_rvs)
+        barycentric /= np.sum(barycentric, axis=1, keepdims=True)
+        return np.einsum('nk,nkd->nd', barycentric, nodes[simplex_index])
 
 
 ########################################################################################################################
@@ -3337,6 +3681,15 @@ class MCMC:
         If an integer is provided, this sets the seed for an object of ``numpy.random.RandomState``. Otherwise, the
         object itself can be passed directly.
 
+    * **save_samples** (`bool`):
+        Boolean that indicates whether to save the full chains. If False, only the last state of each chain is kept in
+        `samples` (and `log_pdf_values`), and the chains are summarized by the running statistics `running_mean` and
+        `running_variance`. Default: True
+
+    * **memmap_file** (`str`):
+        Path of a file in which the samples are stored as a ``numpy.memmap``, for runs that do not fit in memory. The
+        file is overwritten. Default: None, samples are stored in memory.
+
 
     **Attributes:**
 
@@ -3344,6 +3697,9 @@ class MCMC:
         Set of MCMC samples following the target distribution, `ndarray` of shape (`nsamples` * `nchains`, `dimension`)
         or (nsamples, nchains, dimension) (see input `concat_chains`).
 
+        The samples are stored in a buffer that grows geometrically across calls to ``run``, and `samples` is a view of
+        this buffer. It should be copied if it must not change when the chains are run further.
+
     * **log_pdf_values** (`ndarray`)
         Values of the log pdf for the accepted samples, `ndarray` of shape (nchains * nsamples,) or (nsamples, nchains)
 
@@ -3363,12 +3719,34 @@ class MCMC:
     * **acceptance_rate** (`list`)
         Acceptance ratio of the MCMC chains, computed separately for each chain.
 
+    * **running_mean** (`ndarray`)
+        Mean of the saved samples of each chain, `ndarray` of shape (nchains, dimension). Only computed if
+        `save_samples` is False.
+
+    * **running_variance** (`ndarray`)
+        Variance of the saved samples of each chain, `ndarray` of shape (nchains, dimension). Only computed if
+        `save_samples` is False.
+
+    * **rhat** (`ndarray`)
+        Split R-hat of each dimension, `ndarray` of shape (dimension, ), see method ``diagnostics``.
+
+    * **ess** (`ndarray`)
+        Effective sample size of each dimension, `ndarray` of shape (dimension, ), see method ``diagnostics``.
+
+    * **geweke** (`ndarray`)
+        Geweke z-scores of each chain and dimension, `ndarray` of shape (nchains, dimension), see method
+        ``diagnostics``.
+
+    * **diagnostics_history** (`list` of `dict`)
+        Diagnostics computed during the runs, with keys 'nsamples_per_chain', 'rhat', 'ess' and 'geweke'.
+
     **Methods:**
     """
     # Last Modified: 10/05/20 by Audrey Olivier
 
     def __init__(self, dimension=None, pdf_target=None, log_pdf_target=None, args_target=None, seed=None, nburn=0,
-                 jump=1, nchains=None, save_log_pdf=False, verbose=False, concat_chains=True, random_state=None):
+                 jump=1, nchains=None, save_log_pdf=False, verbose=False, concat_chains=True, random_state=None,
+                 save_samples=True, memmap_file=None):
 
         if not (isinstance(nburn, int) and nburn >= 0):
             raise TypeError('UQpy: nburn should be an integer >= 0')
@@ -3383,6 +3761,8 @@ class MCMC:
             pdf_=pdf_target, log_pdf_=log_pdf_target, args=args_target)
         self.save_log_pdf = save_log_pdf
         self.concat_chains = concat_chains
+        self.save_samples = save_samples
+        self.memmap_file = memmap_file
         self.random_state = random_state
         if isinstance(self.random_state, int):
             self.random_state = np.random.RandomState(self.random_state)
@@ -3400,8 +3780,13 @@ class MCMC:
         self.acceptance_rate = [0.] * self.nchains
         self.nsamples, self.nsamples_per_chain = 0, 0
         self.niterations = 0  # total nb of iterations, grows if you call run several times
+        self.running_mean, self.running_variance = None, None
+        self.rhat, self.ess, self.geweke = None, None, None
+        self.diagnostics_history = []
+        # Preallocated storage, self.samples and self.log_pdf_values are views of these buffers
+        self._samples_buffer, self._log_pdf_buffer, self._running_m2 = None, None, None
 
-    def run(self, nsamples=None, nsamples_per_chain=None):
+    def run(self, nsamples=None, nsamples_per_chain=None, diagnostics_interval=None):
         """
         Run the MCMC algorithm.
 
@@ -3416,6 +3801,10 @@ class MCMC:
         * **nsamples_per_chain** (`int`)
             Number of samples to generate per chain.
 
+        * **diagnostics_interval** (`int`)
+            If provided, the convergence diagnostics are computed (see method ``diagnostics``) every time the number of
+            samples per chain is a multiple of `diagnostics_interval`. Default: None, no diagnostics are computed.
+
         Either `nsamples` or `nsamples_per_chain` must be provided (not both). Not that if `nsamples` is not a multiple
         of `nchains`, `nsamples` is set to the next largest integer that is a multiple of `nchains`.
 
@@ -3423,7 +3812,85 @@ class MCMC:
         # Initialize the runs: allocate space for the new samples and log pdf values
         final_nsamples, final_nsamples_per_chain, current_state, current_log_pdf = self._initialize_samples(
             nsamples=nsamples, nsamples_per_chain=nsamples_per_chain)
+        self._run_chains(final_nsamples_per_chain, current_state, current_log_pdf,
+                         diagnostics_interval=diagnostics_interval)
+
+    def run_until(self, target_ess=None, target_rhat=None, max_samples=None, max_samples_per_chain=None,
+                  diagnostics_interval=100):
+        """
+        Run the MCMC algorithm until convergence targets are met.
+
+        The chains are run forward as in method ``run``, and the convergence diagnostics are computed every
+        `diagnostics_interval` samples per chain (see method ``diagnostics``). The run stops as soon as all the targets
+        are met, for all dimensions, or when the maximum number of samples is reached. The maximum number of samples is
+        only a stopping condition: the sample buffers grow by chunks of `diagnostics_interval` samples per chain (with
+        the geometric growth of method ``run``), so memory is used only for the samples actually generated.
+
+        Each evaluation of the diagnostics recomputes the autocorrelations of the full chains with the FFT, i.e., costs
+        O(N log N) operations for N samples per chain, so that the diagnostics cost
+        O(N^2 log N / `diagnostics_interval`) operations over a run. For long runs of cheap targets,
+        `diagnostics_interval` should be increased accordingly.
+
+        **Inputs:**
+
+        * **target_ess** (`float`):
+            Target effective sample size (over all the chains).
+
+        * **target_rhat** (`float`):
+            Target split R-hat, e.g. 1.01.
+
+        * **max_samples** (`int`):
+            Maximum number of samples to generate.
+
+        * **max_samples_per_chain** (`int`)
+            Maximum number of samples to generate per chain.
+
+        * **diagnostics_interval** (`int`)
+            Number of samples per chain between two evaluations of the diagnostics. Default: 100
+
+        At least one of `target_ess` and `target_rhat` must be provided, and either `max_samples` or
+        `max_samples_per_chain` (not both).
 
+        **Output/Returns:**
+
+        * **converged** (`bool`):
+            Whether the targets were met before the maximum number of samples was reached.
+
+        """
+        if target_ess is None and target_rhat is None:
+            raise ValueError('UQpy: At least one of target_ess and target_rhat must be provided.')
+        if not (isinstance(diagnostics_interval, int) and diagnostics_interval >= 1):
+            raise TypeError('UQpy: diagnostics_interval must be an integer >= 1.')
+        if not self.save_samples:
+            raise ValueError('UQpy: Input save_samples must be True in order to compute the diagnostics.')
+        final_nsamples, final_nsamples_per_chain, current_state, current_log_pdf = self._initialize_samples(
+            nsamples=max_samples, nsamples_per_chain=max_samples_per_chain, preallocate=False)
+        return self._run_chains(final_nsamples_per_chain, current_state, current_log_pdf,
+                                diagnostics_interval=diagnostics_interval, target_ess=target_ess,
+                                target_rhat=target_rhat)
+
+    def _run_chains(self, final_nsamples_per_chain, current_state, current_log_pdf, diagnostics_interval=None,
+                    target_ess=None, target_rhat=None):
+        """
+        Run the chains forward until they hold `final_nsamples_per_chain` samples, or until the convergence targets
+        are met (if any). If the sample buffers were not preallocated for `final_nsamples_per_chain` samples, they are
+        grown by chunks of `diagnostics_interval` samples per chain.
+
+        **Inputs:**
+
+        * final_nsamples_per_chain (int): number of samples per chain at the end of the run
+        * current_state (ndarray of shape (nchains, dim)): current state of the chains
+        * current_log_pdf (ndarray of shape (nchains, )): log pdf of the current state of the chains
+        * diagnostics_interval (int): number of samples per chain between two evaluations of the diagnostics
+        * target_ess, target_rhat (floats): convergence targets
+
+        **Output/Returns:**
+
+        * converged (bool): whether the convergence targets were met
+
+        """
+        check_targets = (target_ess is not None) or (target_rhat is not None)
+        converged = False
         if self.verbose:
             print('UQpy: Running MCMC...')
 
@@ -3436,18 +3903,102 @@ class MCMC:
             # Update the chain, only if burn-in is over and the sample is not being jumped over
             # also increase the current number of samples and samples_per_chain
             if self.niterations > self.nburn and (self.niterations - self.nburn) % self.jump == 0:
-                self.samples[self.nsamples_per_chain, :, :] = current_state.copy()
-                if self.save_log_pdf:
-                    self.log_pdf_values[self.nsamples_per_chain, :] = current_log_pdf.copy()
-                self.nsamples_per_chain += 1
-                self.nsamples += self.nchains
+                if self.save_samples and self.nsamples_per_chain == self.samples.shape[0]:
+                    self._allocate(min(self.nsamples_per_chain + (diagnostics_interval or 1),
+                                       final_nsamples_per_chain))
+                self._save_state(current_state, current_log_pdf)
+                if diagnostics_interval is not None and self.nsamples_per_chain % diagnostics_interval == 0 \
+                        and self.nsamples_per_chain >= 4:
+                    rhat, ess, _ = self.diagnostics()
+                    if check_targets and (target_ess is None or np.all(ess >= target_ess)) and \
+                            (target_rhat is None or np.all(rhat <= target_rhat)):
+                        converged = True
+                        break
 
         if self.verbose:
             print('UQpy: MCMC run successfully !')
 
+        # Views of the samples that were actually generated (the run may have stopped early)
+        self._allocate(self.nsamples_per_chain)
         # Concatenate chains maybe
         if self.concat_chains:
             self._concatenate_chains()
+        return converged
+
+    def diagnostics(self, first=0.1, last=0.5):
+        """
+        Compute convergence diagnostics of the chains.
+
+        The diagnostics are computed from the saved samples, which must contain at least 4 samples per chain. The
+        autocorrelations of the full chains are computed with the FFT, i.e., in O(N log N) operations for N samples per
+        chain, at every call: the diagnostics are not updated incrementally. The results are stored in the attributes
+        `rhat`, `ess` and `geweke`, and appended to the attribute `diagnostics_history`.
+
+        * The split R-hat compares the variances within and between the two halves of all the chains, values close to
+          1 (e.g. < 1.01) indicate convergence.
+        * The effective sample size is computed from the multi-chain autocorrelation, truncated with Geyer's initial
+          monotone sequence estimator.
+        * The Geweke z-scores compare the means of the first and last parts of each chain, standardized by their
+          spectral variances at frequency zero.
+
+        **Inputs:**
+
+        * **first** (`float`):
+            Fraction of each chain used as first part for the Geweke diagnostic. Default: 0.1
+
+        * **last** (`float`):
+            Fraction of each chain used as last part for the Geweke diagnostic. Default: 0.5
+
+        **Output/Returns:**
+
+        * **rhat** (`ndarray`):
+            Split R-hat of each dimension, `ndarray` of shape (dimension, ).
+
+        * **ess** (`ndarray`):
+            Effective sample size of each dimension, `ndarray` of shape (dimension, ).
+
+        * **geweke** (`ndarray`):
+            Geweke z-scores of each chain and dimension, `ndarray` of shape (nchains, dimension).
+
+        """
+        if not self.save_samples:
+            raise ValueError('UQpy: Input save_samples must be True in order to compute the diagnostics.')
+        nsamples_per_chain = self.nsamples_per_chain
+        if nsamples_per_chain < 4:
+            raise ValueError('UQpy: At least 4 samples per chain are required to compute the diagnostics.')
+        if not (0. < first < 1. and 0. < last < 1. and first + last <= 1.):
+            raise ValueError('UQpy: first and last must be in (0, 1), with first + last <= 1.')
+        chains = self._samples_buffer[:nsamples_per_chain]
+
+        # Split R-hat and effective sample size, with the two halves of each chain treated as separate chains
+        n = nsamples_per_chain // 2
+        split = np.concatenate([chains[:n], chains[nsamples_per_chain - n:]], axis=1)
+        acov = self._autocovariance(split)
+        within = np.mean(acov[0], axis=0) * n / (n - 1)
+        between = n * np.var(np.mean(split, axis=0), axis=0, ddof=1)
+        var_plus = (n - 1) / n * within + between / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rhat = np.sqrt(var_plus / within)
+            rho = 1. - (within - np.mean(acov, axis=1)) / var_plus
+            ess = split.shape[1] * n / self._autocorrelation_time(rho)
+
+        # Geweke z-scores of each chain
+        n_first, n_last = max(int(first * nsamples_per_chain), 2), max(int(last * nsamples_per_chain), 2)
+        variances_of_means = []
+        means = []
+        for part in (chains[:n_first], chains[nsamples_per_chain - n_last:]):
+            acov = self._autocovariance(part)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                tau = self._autocorrelation_time(acov / acov[0])
+            variances_of_means.append(acov[0] * tau / part.shape[0])
+            means.append(np.mean(part, axis=0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            geweke = (means[0] - means[1]) / np.sqrt(variances_of_means[0] + variances_of_means[1])
+
+        self.rhat, self.ess, self.geweke = rhat, ess, geweke
+        self.diagnostics_history.append({'nsamples_per_chain': nsamples_per_chain, 'rhat': rhat, 'ess': ess,
+                                         'geweke': geweke})
+        return rhat, ess, geweke
 
     def run_one_iteration(self, current_state, current_log_pdf):
         """
@@ -3485,7 +4036,8 @@ class MCMC:
         Concatenate chains.
 
         Utility function that reshapes (in place) attribute samples from (nsamples, nchains, dimension) to
-        (nsamples * nchains, dimension), and log_pdf_values from (nsamples, nchains) to (nsamples * nchains, ).
+        (nsamples * nchains, dimension), and log_pdf_values from (nsamples, nchains) to (nsamples * nchains, ). The
+        reshaped attributes are views of the sample buffers, no data is copied.
 
         No input / output.
 
@@ -3510,7 +4062,7 @@ class MCMC:
             self.log_pdf_values = self.log_pdf_values.reshape((-1, self.nchains), order='C')
         return None
 
-    def _initialize_samples(self, nsamples, nsamples_per_chain):
+    def _initialize_samples(self, nsamples, nsamples_per_chain, preallocate=True):
         """
         Initialize necessary attributes and variables before running the chain forward.
 
@@ -3523,6 +4075,8 @@ class MCMC:
         * nchains (int): number of chains run in parallel
         * nsamples (int): number of samples to be generated
         * nsamples_per_chain (int): number of samples to be generated per chain
+        * preallocate (bool): whether to allocate space for all the samples to be generated, or only for the existing
+          samples (the buffers are then grown during the run)
 
         **Output/Returns:**
 
@@ -3544,35 +4098,97 @@ class MCMC:
             nsamples = int(nsamples_per_chain * self.nchains)
 
         if self.samples is None:    # very first call of run, set current_state as the seed and initialize self.samples
-            self.samples = np.zeros((nsamples_per_chain, self.nchains, self.dimension))
-            if self.save_log_pdf:
-                self.log_pdf_values = np.zeros((nsamples_per_chain, self.nchains))
+            self._allocate(nsamples_per_chain if preallocate else 1)
             current_state = np.zeros_like(self.seed)
             np.copyto(current_state, self.seed)
             current_log_pdf = self.evaluate_log_target(current_state)
-            if self.nburn == 0:    # if nburn is 0, save the seed, run one iteration less 
-                self.samples[0, :, :] = current_state
-                if self.save_log_pdf:
-                    self.log_pdf_values[0, :] = current_log_pdf
-                self.nsamples_per_chain += 1
-                self.nsamples += self.nchains
+            if self.nburn == 0:    # if nburn is 0, save the seed, run one iteration less
+                self._save_state(current_state, current_log_pdf)
             final_nsamples, final_nsamples_per_chain = nsamples, nsamples_per_chain
 
         else:    # fetch previous samples to start the new run, current state is last saved sample
             if len(self.samples.shape) == 2:   # the chains were previously concatenated
                 self._unconcatenate_chains()
-            current_state = self.samples[-1]
+            # the last sample is copied, as it would otherwise be modified in place by the algorithm
+            current_state = self.samples[-1].copy()
             current_log_pdf = self.evaluate_log_target(current_state)
-            self.samples = np.concatenate(
-                [self.samples, np.zeros((nsamples_per_chain, self.nchains, self.dimension))], axis=0)
-            if self.save_log_pdf:
-                self.log_pdf_values = np.concatenate(
-                    [self.log_pdf_values, np.zeros((nsamples_per_chain, self.nchains))], axis=0)
             final_nsamples = nsamples + self.nsamples
             final_nsamples_per_chain = nsamples_per_chain + self.nsamples_per_chain
+            self._allocate(final_nsamples_per_chain if preallocate else self.nsamples_per_chain)
 
         return final_nsamples, final_nsamples_per_chain, current_state, current_log_pdf
 
+    def _allocate(self, nsamples_per_chain):
+        """
+        Make sure that the sample buffers can hold `nsamples_per_chain` samples per chain.
+
+        Utility function that grows the buffers geometrically (at least doubling their capacity), so that calling
+        ``run`` many times costs amortized O(1) copies per sample. If `memmap_file` is provided the file is extended in
+        place and remapped, and the existing samples are not copied. The attributes samples and log_pdf_values are
+        reset to views of the first `nsamples_per_chain` rows of the buffers.
+
+        **Inputs:**
+
+        * nsamples_per_chain (int): number of samples per chain that the buffers must hold
+
+        """
+        if not self.save_samples:
+            nsamples_per_chain = 1
+        capacity = 0 if self._samples_buffer is None else self._samples_buffer.shape[0]
+        if nsamples_per_chain > capacity:
+            new_capacity = max(nsamples_per_chain, 2 * capacity)
+            shape = (new_capacity, self.nchains, self.dimension)
+            if self.memmap_file is None:
+                buffer = np.zeros(shape)
+                if capacity > 0:
+                    buffer[:capacity] = self._samples_buffer
+            else:
+                if capacity == 0:
+                    buffer = np.memmap(self.memmap_file, dtype=float, mode='w+', shape=shape)
+                else:
+                    self._samples_buffer.flush()
+                    with open(self.memmap_file, 'r+b') as f:
+                        f.truncate(int(np.prod(shape)) * np.dtype(float).itemsize)
+                    buffer = np.memmap(self.memmap_file, dtype=float, mode='r+', shape=shape)
+            self._samples_buffer = buffer
+            if self.save_log_pdf:
+                buffer = np.zeros((new_capacity, self.nchains))
+                if capacity > 0:
+                    buffer[:capacity] = self._log_pdf_buffer
+                self._log_pdf_buffer = buffer
+        self.samples = self._samples_buffer[:nsamples_per_chain]
+        if self.save_log_pdf:
+            self.log_pdf_values = self._log_pdf_buffer[:nsamples_per_chain]
+
+    def _save_state(self, current_state, current_log_pdf):
+        """
+        Save the current state of the chains.
+
+        Utility function that writes the current state (and log pdf) in the sample buffers, or updates the running
+        statistics of the chains if the full chains are not saved, and increases the sample counters.
+
+        **Inputs:**
+
+        * current_state (ndarray of shape (nchains, dim)): current state of the chains
+        * current_log_pdf (ndarray of shape (nchains, )): log pdf of the current state of the chains
+
+        """
+        index = self.nsamples_per_chain if self.save_samples else 0
+        self.samples[index] = current_state
+        if self.save_log_pdf:
+            self.log_pdf_values[index] = current_log_pdf
+        self.nsamples_per_chain += 1
+        self.nsamples += self.nchains
+        if not self.save_samples:
+            # Welford's update of the mean and sum of squared deviations of each chain
+            if self.running_mean is None:
+                self.running_mean = np.zeros((self.nchains, self.dimension))
+                self._running_m2 = np.zeros((self.nchains, self.dimension))
+            delta = current_state - self.running_mean
+            self.running_mean = self.running_mean + delta / self.nsamples_per_chain
+            self._running_m2 = self._running_m2 + delta * (current_state - self.running_mean)
+            self.running_variance = self._running_m2 / max(self.nsamples_per_chain - 1, 1)
+
     def _update_acceptance_rate(self, new_accept=None):
         """
         Update acceptance rate of the chains.
@@ -3585,8 +4201,50 @@ class MCMC:
           separately).
 
         """
-        self.acceptance_rate = [na / self.niterations + (self.niterations - 1) / self.niterations * a
-                                for (na, a) in zip(new_accept, self.acceptance_rate)]
+        self.acceptance_rate = list(np.asarray(new_accept) / self.niterations +
+                                    (self.niterations - 1) / self.niterations * np.asarray(self.acceptance_rate))
+
+    @staticmethod
+    def _autocovariance(chains):
+        """
+        Autocovariance of each chain and dimension, computed with the FFT.
+
+        **Inputs:**
+
+        * chains (ndarray of shape (nsamples, nchains, dim)): samples of the chains
+
+        **Output/Returns:**
+
+        * acov (ndarray of shape (nsamples, nchains, dim)): autocovariance at lags 0 to nsamples - 1 (biased estimate)
+
+        """
+        n = chains.shape[0]
+        nfft = 2 ** int(np.ceil(np.log2(2 * n)))
+        centered = chains - np.mean(chains, axis=0)
+        spectrum = np.fft.rfft(centered, n=nfft, axis=0)
+        return np.fft.irfft(spectrum * np.conj(spectrum), n=nfft, axis=0)[:n] / n
+
+    @staticmethod
+    def _autocorrelation_time(rho):
+        """
+        Integrated autocorrelation time, truncated with Geyer's initial monotone sequence estimator.
+
+        **Inputs:**
+
+        * rho (ndarray of shape (nsamples, ...)): autocorrelation at lags 0 to nsamples - 1
+
+        **Output/Returns:**
+
+        * tau (ndarray of shape (...)): integrated autocorrelation time
+
+        """
+        npairs = rho.shape[0] // 2
+        pairs = rho[:2 * npairs:2] + rho[1:2 * npairs:2]
+        # Sum the pairs while they are positive, and force the sequence to be monotone
+        positive = np.cumprod(pairs > 0., axis=0).astype(bool)
+        pairs = np.minimum.accumulate(np.where(positive, pairs, 0.), axis=0)
+        tau = -1. + 2. * np.sum(pairs, axis=0)
+        return np.maximum(tau, 1. / np.log10(max(rho.shape[0], 10)))
 
     @staticmethod
     def _preprocess_target(log_pdf_, pdf_, args):
@@ -3742,11 +4400,13 @@ class MH(MCMC):
     """
     def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
                  seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
-                 nchains=None, proposal=None, proposal_is_symmetric=False, verbose=False, random_state=None):
+                 nchains=None, proposal=None, proposal_is_symmetric=False, verbose=False, random_state=None,
+                 save_samples=True, memmap_file=None):
 
         super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
                          dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
-                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains)
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
 
         # Initialize algorithm specific inputs
         self.proposal = proposal
@@ -3786,17 +4446,13 @@ class MH(MCMC):
                                  self.proposal.log_pdf(current_state - candidate)
             log_ratios = log_p_candidate - current_log_pdf - log_proposal_ratio
 
-        # Compare candidate with current sample and decide or not to keep the candidate (loop over nc chains)
-        accept_vec = np.zeros((self.nchains,))  # this vector will be used to compute accept_ratio of each chain
+        # Compare candidate with current sample and decide or not to keep the candidate (all chains at once)
         unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1,))
-        for nc, (cand, log_p_cand, r_) in enumerate(zip(candidate, log_p_candidate, log_ratios)):
-            accept = np.log(unif_rvs[nc]) < r_
-            if accept:
-                current_state[nc, :] = cand
-                current_log_pdf[nc] = log_p_cand
-                accept_vec[nc] = 1.
+        accept = np.log(unif_rvs) < log_ratios
+        current_state[accept] = candidate[accept]
+        current_log_pdf[accept] = log_p_candidate[accept]
         # Update the acceptance rate
-        self._update_acceptance_rate(accept_vec)
+        self._update_acceptance_rate(accept.astype(float))
 
         return current_state, current_log_pdf
 
@@ -3834,11 +4490,13 @@ class MMH(MCMC):
     """
     def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
                  seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
-                 proposal=None, proposal_is_symmetric=False, verbose=False, random_state=None, nchains=None):
+                 proposal=None, proposal_is_symmetric=False, verbose=False, random_state=None, nchains=None,
+                 save_samples=True, memmap_file=None):
 
         super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
                          dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
-                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains)
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
 
         # If proposal is not provided: set it as a list of standard gaussians
         from UQpy.Distributions import Normal
@@ -3895,8 +4553,9 @@ class MMH(MCMC):
         if self.target_type == 'marginals':
             # Evaluate the current log_pdf
             if self.current_log_pdf_marginals is None:
-                self.current_log_pdf_marginals = [self.evaluate_log_target_marginals[j](current_state[:, j, np.newaxis])
-                                                  for j in range(self.dimension)]
+                self.current_log_pdf_marginals = np.array(
+                    [np.reshape(self.evaluate_log_target_marginals[j](current_state[:, j, np.newaxis]), (-1,))
+                     for j in range(self.dimension)])
 
             # Sample candidate (independently in each dimension)
             for j in range(self.dimension):
@@ -3904,7 +4563,7 @@ class MMH(MCMC):
                     nsamples=self.nchains, random_state=self.random_state)
 
                 # Compute log_pdf_target of candidate sample
-                log_p_candidate_j = self.evaluate_log_target_marginals[j](candidate_j)
+                log_p_candidate_j = np.reshape(self.evaluate_log_target_marginals[j](candidate_j), (-1,))
 
                 # Compute acceptance ratio
                 if self.proposal_is_symmetric[j]:  # proposal is symmetric
@@ -3917,14 +4576,11 @@ class MMH(MCMC):
 
                 # Compare candidate with current sample and decide or not to keep the candidate
                 unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1,))
-                for nc, (cand, log_p_cand, r_) in enumerate(
-                        zip(candidate_j, log_p_candidate_j, log_ratios)):
-                    accept = np.log(unif_rvs[nc]) < r_
-                    if accept:
-                        current_state[nc, j] = cand
-                        self.current_log_pdf_marginals[j][nc] = log_p_cand
-                        current_log_pdf = np.sum(self.current_log_pdf_marginals)
-                        accept_vec[nc] += 1. / self.dimension
+                accept = np.log(unif_rvs) < log_ratios
+                current_state[accept, j] = candidate_j[accept, 0]
+                self.current_log_pdf_marginals[j, accept] = log_p_candidate_j[accept]
+                accept_vec[accept] += 1. / self.dimension
+            current_log_pdf = np.sum(self.current_log_pdf_marginals, axis=0)
 
         # The target pdf is provided as a joint pdf
         else:
@@ -3946,14 +4602,11 @@ class MMH(MCMC):
                                           log_prop_j(current_state[:, j, np.newaxis] - candidate_j))
                     log_ratios = log_p_candidate - current_log_pdf - log_proposal_ratio
                 unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1,))
-                for nc, (cand, log_p_cand, r_) in enumerate(zip(candidate_j, log_p_candidate, log_ratios)):
-                    accept = np.log(unif_rvs[nc]) < r_
-                    if accept:
-                        current_state[nc, j] = cand
-                        current_log_pdf[nc] = log_p_cand
-                        accept_vec[nc] += 1. / self.dimension
-                    else:
-                        candidate[:, j] = current_state[:, j]
+                accept = np.log(unif_rvs) < log_ratios
+                current_state[accept, j] = candidate_j[accept, 0]
+                current_log_pdf[accept] = log_p_candidate[accept]
+                accept_vec[accept] += 1. / self.dimension
+                candidate[~accept, j] = current_state[~accept, j]
         # Update the acceptance rate
         self._update_acceptance_rate(accept_vec)
         return current_state, current_log_pdf
@@ -3982,7 +4635,7 @@ class Stretch(MCMC):
     """
     def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
                  seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
-                 scale=2., verbose=False, random_state=None, nchains=None):
+                 scale=2., verbose=False, random_state=None, nchains=None, save_samples=True, memmap_file=None):
 
         flag_seed = False
         if seed is None:
@@ -3992,7 +4645,8 @@ class Stretch(MCMC):
 
         super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
                          dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
-                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains)
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
 
         # Check nchains = ensemble size for the Stretch algorithm
         if flag_seed:
@@ -4020,38 +4674,32 @@ class Stretch(MCMC):
         """
         # Start the loop over nsamples - this code uses the parallel version of the stretch algorithm
         all_inds = np.arange(self.nchains)
-        inds = all_inds % 2
         accept_vec = np.zeros((self.nchains, ))
         # Separate the full ensemble into two sets, use one as a complementary ensemble to the other and vice-versa
         for split in range(2):
-            set1 = (inds == split)
-
-            # Get current and complementary sets
-            sets = [current_state[inds == j01, :] for j01 in range(2)]
-            curr_set, comp_set = sets[split], sets[1 - split]  # current and complementary sets respectively
-            ns, nc = len(curr_set), len(comp_set)
+            # Indices of the current and complementary sets respectively
+            curr_inds, comp_inds = all_inds[split::2], all_inds[1 - split::2]
+            ns, nc = len(curr_inds), len(comp_inds)
 
             # Sample new state for S1 based on S0
-            unif_rvs = Uniform().rvs(nsamples=ns, random_state=self.random_state)
+            unif_rvs = Uniform().rvs(nsamples=ns, random_state=self.random_state).reshape((-1,))
             zz = ((self.scale - 1.) * unif_rvs + 1.) ** 2. / self.scale  # sample Z
             factors = (self.dimension - 1.) * np.log(zz)  # compute log(Z ** (d - 1))
-            multi_rvs = Multinomial(n=1, p=[1. / nc, ] * nc).rvs(nsamples=ns, random_state=self.random_state)
-            rint = np.nonzero(multi_rvs)[1]    # sample X_{j} from complementary set
-            candidates = comp_set[rint, :] - (comp_set[rint, :] - curr_set) * np.tile(
-                zz, [1, self.dimension])  # new candidates
+            unif_rvs = Uniform().rvs(nsamples=ns, random_state=self.random_state).reshape((-1,))
+            rint = comp_inds[np.minimum((unif_rvs * nc).astype(int), nc - 1)]    # sample X_{j} from complementary set
+            comp_walkers = current_state[rint]
+            candidates = comp_walkers + zz[:, np.newaxis] * (current_state[curr_inds] - comp_walkers)  # new candidates
 
             # Compute new likelihood, can be done in parallel :)
             logp_candidates = self.evaluate_log_target(candidates)
 
             # Compute acceptance rate
-            unif_rvs = Uniform().rvs(nsamples=len(all_inds[set1]), random_state=self.random_state).reshape((-1,))
-            for j, f, lpc, candidate, u_rv in zip(
-                    all_inds[set1], factors, logp_candidates, candidates, unif_rvs):
-                accept = np.log(u_rv) < f + lpc - current_log_pdf[j]
-                if accept:
-                    current_state[j] = candidate
-                    current_log_pdf[j] = lpc
-                    accept_vec[j] += 1.
+            unif_rvs = Uniform().rvs(nsamples=ns, random_state=self.random_state).reshape((-1,))
+            accept = np.log(unif_rvs) < factors + logp_candidates - current_log_pdf[curr_inds]
+            inds_accept = curr_inds[accept]
+            current_state[inds_accept] = candidates[accept]
+            current_log_pdf[inds_accept] = logp_candidates[accept]
+            accept_vec[inds_accept] += 1.
 
         # Update the acceptance rate
         self._update_acceptance_rate(accept_vec)
@@ -4099,11 +4747,12 @@ class DRAM(MCMC):
     def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
                  seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
                  initial_covariance=None, k0=100, sp=None, gamma_2=1/5, save_covariance=False, verbose=False,
-                 random_state=None, nchains=None):
+                 random_state=None, nchains=None, save_samples=True, memmap_file=None):
 
         super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
                          dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
-                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains)
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
 
         # Check the initial covariance
         self.initial_covariance = initial_covariance
@@ -4141,71 +4790,60 @@ class DRAM(MCMC):
         """
         Run one iteration of the MCMC chain for DRAM algorithm, starting at current state - see ``MCMC`` class.
         """
-        from UQpy.Distributions import MVNormal
-        mvp = MVNormal(mean=np.zeros(self.dimension, ), cov=1.)
-
-        # Sample candidate
-        candidate = np.zeros_like(current_state)
-        for nc, current_cov in enumerate(self.current_covariance):
-            mvp.update_params(cov=current_cov)
-            candidate[nc, :] = current_state[nc, :] + mvp.rvs(
-                nsamples=1, random_state=self.random_state).reshape((self.dimension, ))
+        # Sample candidates for all chains from their own gaussian proposal, using batched Cholesky factors
+        chol = np.linalg.cholesky(self.current_covariance)
+        std_normal = Normal().rvs(nsamples=self.nchains * self.dimension,
+                                  random_state=self.random_state).reshape((self.nchains, self.dimension))
+        candidate = current_state + np.einsum('nij,nj->ni', chol, std_normal)
 
         # Compute log_pdf_target of candidate sample
         log_p_candidate = self.evaluate_log_target(candidate)
 
-        # Compare candidate with current sample and decide or not to keep the candidate (loop over nc chains)
-        accept_vec = np.zeros((self.nchains, ))
-        inds_delayed = []   # indices of chains that will undergo delayed rejection
+        # Compare candidate with current sample and decide or not to keep the candidate (all chains at once)
         unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1,))
-        for nc, (cand, log_p_cand, log_p_curr) in enumerate(zip(candidate, log_p_candidate, current_log_pdf)):
-            accept = np.log(unif_rvs[nc]) < log_p_cand - log_p_curr
-            if accept:
-                current_state[nc, :] = cand
-                current_log_pdf[nc] = log_p_cand
-                accept_vec[nc] += 1.
-            else:    # enter delayed rejection
-                inds_delayed.append(nc)    # these indices will enter the delayed rejection part
+        accept = np.log(unif_rvs) < log_p_candidate - current_log_pdf
+        inds_delayed = np.nonzero(~accept)[0]   # indices of chains that will undergo delayed rejection
+        current_state[accept] = candidate[accept]
+        current_log_pdf[accept] = log_p_candidate[accept]
+        accept_vec = accept.astype(float)
 
         # Delayed rejection
-        if len(inds_delayed) > 0:   # performed delayed rejection for some chains
-            current_states_delayed = np.zeros((len(inds_delayed), self.dimension))
-            candidates_delayed = np.zeros((len(inds_delayed), self.dimension))
-            candidate2 = np.zeros((len(inds_delayed), self.dimension))
+        if inds_delayed.size > 0:   # performed delayed rejection for some chains
+            current_states_delayed = current_state[inds_delayed]
+            candidates_delayed = candidate[inds_delayed]
+            chol_delayed = chol[inds_delayed]
             # Sample other candidates closer to the current one
-            for i, nc in enumerate(inds_delayed):
-                current_states_delayed[i, :] = current_state[nc, :]
-                candidates_delayed[i, :] = candidate[nc, :]
-                mvp.update_params(cov=self.gamma_2 ** 2 * self.current_covariance[nc])
-                candidate2[i, :] = current_states_delayed[i, :] + mvp.rvs(
-                    nsamples=1, random_state=self.random_state).reshape((self.dimension, ))
+            std_normal = Normal().rvs(nsamples=inds_delayed.size * self.dimension,
+                                      random_state=self.random_state).reshape((inds_delayed.size, self.dimension))
+            candidate2 = current_states_delayed + self.gamma_2 * np.einsum('nij,nj->ni', chol_delayed, std_normal)
             # Evaluate their log_target
             log_p_candidate2 = self.evaluate_log_target(candidate2)
-            log_prop_cand_cand2 = mvp.log_pdf(candidates_delayed - candidate2)
-            log_prop_cand_curr = mvp.log_pdf(candidates_delayed - current_states_delayed)
+            # Log of the first stage proposal densities, q1(cand2, cand) and q1(curr, cand), up to the same constant
+            log_prop_cand_cand2 = -0.5 * np.sum(np.linalg.solve(
+                chol_delayed, (candidates_delayed - candidate2)[..., np.newaxis])[..., 0] ** 2, axis=1)
+            log_prop_cand_curr = -0.5 * np.sum(np.linalg.solve(
+                chol_delayed, (candidates_delayed - current_states_delayed)[..., np.newaxis])[..., 0] ** 2, axis=1)
             # Accept or reject
-            unif_rvs = Uniform().rvs(nsamples=len(inds_delayed), random_state=self.random_state).reshape((-1,))
-            for (nc, cand2, log_p_cand2, j1, j2, u_rv) in zip(inds_delayed, candidate2, log_p_candidate2,
-                                                              log_prop_cand_cand2, log_prop_cand_curr, unif_rvs):
-                alpha_cand_cand2 = min(1., np.exp(log_p_candidate[nc] - log_p_cand2))
-                alpha_cand_curr = min(1., np.exp(log_p_candidate[nc] - current_log_pdf[nc]))
-                log_alpha2 = (log_p_cand2 - current_log_pdf[nc] + j1 - j2 +
-                              np.log(max(1. - alpha_cand_cand2, 10 ** (-320))) -
-                              np.log(max(1. - alpha_cand_curr, 10 ** (-320))))
-                accept = np.log(u_rv) < min(0., log_alpha2)
-                if accept:
-                    current_state[nc, :] = cand2
-                    current_log_pdf[nc] = log_p_cand2
-                    accept_vec[nc] += 1.
+            unif_rvs = Uniform().rvs(nsamples=inds_delayed.size, random_state=self.random_state).reshape((-1,))
+            log_p_cand = log_p_candidate[inds_delayed]
+            log_p_curr = current_log_pdf[inds_delayed]
+            alpha_cand_cand2 = np.exp(np.minimum(0., log_p_cand - log_p_candidate2))
+            alpha_cand_curr = np.exp(np.minimum(0., log_p_cand - log_p_curr))
+            log_alpha2 = (log_p_candidate2 - log_p_curr + log_prop_cand_cand2 - log_prop_cand_curr +
+                          np.log(np.maximum(1. - alpha_cand_cand2, 10 ** (-320))) -
+                          np.log(np.maximum(1. - alpha_cand_curr, 10 ** (-320))))
+            accept2 = np.log(unif_rvs) < np.minimum(0., log_alpha2)
+            inds_accept = inds_delayed[accept2]
+            current_state[inds_accept] = candidate2[accept2]
+            current_log_pdf[inds_accept] = log_p_candidate2[accept2]
+            accept_vec[inds_accept] += 1.
 
         # Adaptive part: update the covariance
-        for nc in range(self.nchains):
-            # update covariance
-            self.sample_mean[nc], self.sample_covariance[nc] = self._recursive_update_mean_covariance(
-                n=self.niterations, new_sample=current_state[nc, :], previous_mean=self.sample_mean[nc],
-                previous_covariance=self.sample_covariance[nc])
-            if (self.niterations > 1) and (self.niterations % self.k0 == 0):
-                self.current_covariance[nc] = self.sp * self.sample_covariance[nc] + 1e-6 * np.eye(self.dimension)
+        self.sample_mean, self.sample_covariance = self._recursive_update_mean_covariance(
+            n=self.niterations, new_sample=current_state, previous_mean=self.sample_mean,
+            previous_covariance=self.sample_covariance)
+        if (self.niterations > 1) and (self.niterations % self.k0 == 0):
+            self.current_covariance = self.sp * self.sample_covariance + 1e-6 * np.eye(self.dimension)
         if self.save_covariance and ((self.niterations > 1) and (self.niterations % self.k0 == 0)):
             self.adaptive_covariance.append(self.current_covariance.copy())
 
@@ -4218,30 +4856,32 @@ class DRAM(MCMC):
         """
         Iterative formula to compute a new sample mean and covariance based on previous ones and new sample.
 
-        New covariance is computed only of previous_covariance is provided.
+        New covariance is computed only of previous_covariance is provided. Leading dimensions (e.g., chains) are
+        broadcast.
 
         **Inputs:**
 
         * n (int): Number of samples used to compute the new mean
-        * new_sample (ndarray (dim, )): new sample
-        * previous_mean (ndarray (dim, )): Previous sample mean, to be updated with new sample value
-        * previous_covariance (ndarray (dim, dim)): Previous sample covariance, to be updated with new sample value
+        * new_sample (ndarray (..., dim)): new sample
+        * previous_mean (ndarray (..., dim)): Previous sample mean, to be updated with new sample value
+        * previous_covariance (ndarray (..., dim, dim)): Previous sample covariance, to be updated with new sample value
 
         **Output/Returns:**
 
-        * new_mean (ndarray (dim, )): Updated sample mean
-        * new_covariance (ndarray (dim, dim)): Updated sample covariance
+        * new_mean (ndarray (..., dim)): Updated sample mean
+        * new_covariance (ndarray (..., dim, dim)): Updated sample covariance
 
         """
         new_mean = (n - 1) / n * previous_mean + 1 / n * new_sample
         if previous_covariance is None:
             return new_mean
-        dim = new_sample.size
+        dim = new_sample.shape[-1]
         if n == 1:
-            new_covariance = np.zeros((dim, dim))
+            new_covariance = np.zeros(new_sample.shape + (dim, ))
         else:
-            delta_n = (new_sample - previous_mean).reshape((dim, 1))
-            new_covariance = (n - 2) / (n - 1) * previous_covariance + 1 / n * np.matmul(delta_n, delta_n.T)
+            delta_n = new_sample - previous_mean
+            new_covariance = (n - 2) / (n - 1) * previous_covariance + 1 / n * (
+                    delta_n[..., :, np.newaxis] * delta_n[..., np.newaxis, :])
         return new_mean, new_covariance
 
 ####################################################################################################################
@@ -4291,11 +4931,12 @@ class DREAM(MCMC):
     def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
                  seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
                  delta=3, c=0.1, c_star=1e-6, n_cr=3, p_g=0.2, adapt_cr=(-1, 1), check_chains=(-1, 1), verbose=False,
-                 random_state=None, nchains=None):
+                 random_state=None, nchains=None, save_samples=True, memmap_file=None):
 
         super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
                          dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
-                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains)
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
 
         # Check nb of chains
         if self.nchains < 2:
@@ -4337,63 +4978,51 @@ class DREAM(MCMC):
         """
         Run one iteration of the MCMC chain for DREAM algorithm, starting at current state - see ``MCMC`` class.
         """
-        r_diff = np.array([np.setdiff1d(np.arange(self.nchains), j) for j in range(self.nchains)])
         cross = np.arange(1, self.n_cr + 1) / self.n_cr
+        std_x_tmp = np.std(current_state, axis=0)
 
         # Dynamic part: evolution of chains
-        unif_rvs = Uniform().rvs(nsamples=self.nchains * (self.nchains-1),
-                                 random_state=self.random_state).reshape((self.nchains - 1, self.nchains))
-        draw = np.argsort(unif_rvs, axis=0)
-        dx = np.zeros_like(current_state)
-        lmda = Uniform(scale=2 * self.c).rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
-        std_x_tmp = np.std(current_state, axis=0)
+        # Number of pairs of chains used for each chain, and distinct chains a_j, b_j different from chain j
+        max_pairs = min(self.delta, (self.nchains - 1) // 2)
+        unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
+        npairs = np.minimum((unif_rvs * self.delta).astype(int) + 1, max_pairs)
+        others = self._sample_other_chains(2 * max_pairs)
+        as_, bs_ = others[:, :max_pairs], others[:, max_pairs:]
+        pair_mask = np.arange(max_pairs)[np.newaxis, :] < npairs[:, np.newaxis]
+        diff_sum = np.einsum('jp,jpi->ji', pair_mask.astype(float), current_state[as_] - current_state[bs_])
 
-        multi_rvs = Multinomial(n=1, p=[1./self.delta, ] * self.delta).rvs(
-            nsamples=self.nchains, random_state=self.random_state)
-        d_ind = np.nonzero(multi_rvs)[1]
-        as_ = [r_diff[j, draw[slice(d_ind[j]), j]] for j in range(self.nchains)]
-        bs_ = [r_diff[j, draw[slice(d_ind[j], 2 * d_ind[j], 1), j]] for j in range(self.nchains)]
-        multi_rvs = Multinomial(n=1, p=self.cross_prob).rvs(nsamples=self.nchains, random_state=self.random_state)
-        id_ = np.nonzero(multi_rvs)[1]
-        # id = np.random.choice(self.n_CR, size=(self.nchains, ), replace=True, p=self.pCR)
+        # Crossover: subset A of selected dimensions (at least one per chain)
+        unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
+        id_ = np.minimum(np.searchsorted(np.cumsum(self.cross_prob), unif_rvs, side='right'), self.n_cr - 1)
         z = Uniform().rvs(nsamples=self.nchains * self.dimension,
                           random_state=self.random_state).reshape((self.nchains, self.dimension))
-        subset_a = [np.where(z_j < cross[id_j])[0] for (z_j, id_j) in zip(z, id_)]  # subset A of selected dimensions
-        d_star = np.array([len(a_j) for a_j in subset_a])
-        for j in range(self.nchains):
-            if d_star[j] == 0:
-                subset_a[j] = np.array([np.argmin(z[j])])
-                d_star[j] = 1
-        gamma_d = 2.38 / np.sqrt(2 * (d_ind + 1) * d_star)
-        g = Binomial(n=1, p=self.p_g).rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
-        g[g == 0] = gamma_d[g == 0]
-        norm_vars = Normal(loc=0., scale=1.).rvs(nsamples=self.nchains ** 2,
-                                                 random_state=self.random_state).reshape((self.nchains, self.nchains))
-        for j in range(self.nchains):
-            for i in subset_a[j]:
-                dx[j, i] = self.c_star * norm_vars[j, i] + \
-                           (1 + lmda[j]) * g[j] * np.sum(current_state[as_[j], i] - current_state[bs_[j], i])
+        subset_a = z < cross[id_, np.newaxis]
+        subset_a[np.arange(self.nchains), np.argmin(z, axis=1)] |= ~np.any(subset_a, axis=1)
+        d_star = np.sum(subset_a, axis=1)
+
+        lmda = Uniform(scale=2 * self.c).rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
+        gamma_d = 2.38 / np.sqrt(2 * np.maximum(npairs, 1) * d_star)
+        unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
+        g = np.where(unif_rvs < self.p_g, 1., gamma_d)
+        norm_vars = Normal(loc=0., scale=1.).rvs(nsamples=self.nchains * self.dimension,
+                                                 random_state=self.random_state).reshape((self.nchains, self.dimension))
+        dx = subset_a * (self.c_star * norm_vars + ((1 + lmda) * g)[:, np.newaxis] * diff_sum)
         candidates = current_state + dx
 
         # Evaluate log likelihood of candidates
         logp_candidates = self.evaluate_log_target(candidates)
 
         # Accept or reject
-        accept_vec = np.zeros((self.nchains, ))
         unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
-        for nc, (lpc, candidate, log_p_curr) in enumerate(zip(logp_candidates, candidates, current_log_pdf)):
-            accept = np.log(unif_rvs[nc]) < lpc - log_p_curr
-            if accept:
-                current_state[nc, :] = candidate
-                current_log_pdf[nc] = lpc
-                accept_vec[nc] = 1.
-            else:
-                dx[nc, :] = 0
-            self.j_ind[id_[nc]] = self.j_ind[id_[nc]] + np.sum((dx[nc, :] / std_x_tmp) ** 2)
-            self.n_id[id_[nc]] += 1
+        accept = np.log(unif_rvs) < logp_candidates - current_log_pdf
+        current_state[accept] = candidates[accept]
+        current_log_pdf[accept] = logp_candidates[accept]
+        dx[~accept] = 0
+        np.add.at(self.j_ind, id_, np.sum((dx / std_x_tmp) ** 2, axis=1))
+        np.add.at(self.n_id, id_, 1)
 
         # Save the acceptance rate
-        self._update_acceptance_rate(accept_vec)
+        self._update_acceptance_rate(accept.astype(float))
 
         # update selection cross prob
         if self.niterations < self.adapt_cr[0] and self.niterations % self.adapt_cr[1] == 0:
@@ -4406,6 +5035,35 @@ class DREAM(MCMC):
 
         return current_state, current_log_pdf
 
+    def _sample_other_chains(self, nsamples_per_chain):
+        """
+        Sample, for each chain j, `nsamples_per_chain` distinct chains different from chain j, in random order.
+
+        Utility function that uses Floyd's algorithm vectorized over the chains, i.e., O(nchains * nsamples_per_chain^2)
+        operations instead of a permutation of all the chains for each chain.
+
+        **Inputs:**
+
+        * nsamples_per_chain (int): number of chains to sample for each chain, must be < nchains
+
+        **Output/Returns:**
+
+        * others (ndarray of shape (nchains, nsamples_per_chain)): indices of the sampled chains
+
+        """
+        nothers = self.nchains - 1
+        selected = np.zeros((self.nchains, nsamples_per_chain), dtype=int)
+        for k, top in enumerate(range(nothers - nsamples_per_chain, nothers)):
+            unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1, ))
+            new = np.minimum((unif_rvs * (top + 1)).astype(int), top)
+            new[np.any(selected[:, :k] == new[:, np.newaxis], axis=1)] = top
+            selected[:, k] = new
+        # Random order, then skip chain j itself
+        unif_rvs = Uniform().rvs(nsamples=self.nchains * nsamples_per_chain,
+                                 random_state=self.random_state).reshape((self.nchains, nsamples_per_chain))
+        selected = np.take_along_axis(selected, np.argsort(unif_rvs, axis=1), axis=1)
+        return selected + (selected >= np.arange(self.nchains)[:, np.newaxis])
+
     def check_outlier_chains(self, replace_with_best=False):
         """
         Check outlier chains in DREAM algorithm.
@@ -4422,6 +5080,8 @@ class DREAM(MCMC):
         """
         if not self.save_log_pdf:
             raise ValueError('UQpy: Input save_log_pdf must be True in order to check outlier chains')
+        if not self.save_samples:
+            raise ValueError('UQpy: Input save_samples must be True in order to check outlier chains')
         start_ = self.nsamples_per_chain // 2
         avgs_logpdf = np.mean(self.log_pdf_values[start_:self.nsamples_per_chain], axis=0)
         best_ = np.argmax(avgs_logpdf)
@@ -4442,6 +5102,543 @@ class DREAM(MCMC):
         if self.verbose and outlier_num > 0:
             print('UQpy: Detected {} outlier chains'.format(outlier_num))
 
+####################################################################################################################
+
+
+class ParallelTempering(MCMC):
+    """
+    Parallel tempering (replica exchange) algorithm.
+
+    Replicas of the chains sample the tempered targets :math:`p(x)^{1/T_k}` for a ladder of temperatures
+    :math:`1 = T_0 < T_1 < ... < T_{K-1}`. At each iteration, all the replicas perform one Metropolis-Hastings step,
+    with a proposal scaled by :math:`\\sqrt{T_k}`, and the target is evaluated once for all replicas and chains, i.e.,
+    with an input of shape ``(ntemperatures * nchains, dimension)``. A target that runs a model through ``RunModel``
+    therefore runs all the replicas in parallel. Swaps of the states of adjacent temperatures are then proposed,
+    alternately between even and odd pairs of temperatures, for all chains at once. Only the samples of the replicas
+    at temperature 1 are stored, in the `samples` attribute, as they follow the target distribution.
+
+    **References:**
+
+    1. C.J. Geyer, "Markov chain Monte Carlo maximum likelihood", Computing Science and Statistics: Proceedings of the
+       23rd Symposium on the Interface, 156–163, 1991.
+    2. D.J. Earl and M.W. Deem, "Parallel tempering: Theory, applications, and new perspectives", Physical Chemistry
+       Chemical Physics, 7(23):3910–3916, 2005.
+
+    **Algorithm-specific inputs:**
+
+    * **temperatures** (`list` or `ndarray`):
+        Increasing temperatures of the replicas, the first one must be 1. Default: [1., 2., 4., 8.]
+
+    * **proposal** (``Distribution`` object):
+        Proposal distribution at temperature 1, must have a log_pdf/pdf and rvs method. The increments drawn from the
+        proposal are multiplied by :math:`\\sqrt{T_k}` for replica `k`. Default: standard multivariate normal
+
+    * **proposal_is_symmetric** (`bool`):
+        Indicates whether the proposal distribution is symmetric, affects computation of acceptance probability alpha
+        Default: False, set to True if default proposal is used
+
+    **Attributes:**
+
+    * **acceptance_rate_temperatures** (`ndarray`)
+        Acceptance rate of the Metropolis-Hastings steps of the replicas, `ndarray` of shape
+        ``(ntemperatures, nchains)``. The first row is equal to attribute `acceptance_rate`.
+
+    * **swap_rate** (`ndarray`)
+        Acceptance rate of the swaps between temperatures `k` and `k+1`, averaged over the chains, `ndarray` of shape
+        ``(ntemperatures - 1, )``.
+
+    **Methods:**
+
+    """
+    def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
+                 seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
+                 nchains=None, temperatures=None, proposal=None, proposal_is_symmetric=False, verbose=False,
+                 random_state=None, save_samples=True, memmap_file=None):
+
+        super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
+                         dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
+
+        # Check the temperature ladder
+        if temperatures is None:
+            temperatures = [1., 2., 4., 8.]
+        self.temperatures = np.array(temperatures, dtype=float).reshape((-1,))
+        if self.temperatures[0] != 1. or np.any(np.diff(self.temperatures) <= 0.):
+            raise ValueError('UQpy: Input temperatures must be increasing and start at 1.')
+        self.ntemperatures = self.temperatures.size
+        self.betas = 1. / self.temperatures
+
+        # Initialize algorithm specific inputs
+        self.proposal = proposal
+        self.proposal_is_symmetric = proposal_is_symmetric
+        if self.proposal is None:
+            from UQpy.Distributions import JointInd, Normal
+            self.proposal = JointInd([Normal()] * self.dimension)
+            self.proposal_is_symmetric = True
+        else:
+            self._check_methods_proposal(self.proposal)
+
+        # States and (untempered) log-pdf values of all the replicas, initialized at the first iteration
+        self.replica_states, self.replica_log_pdf = None, None
+        self.acceptance_rate_temperatures = np.zeros((self.ntemperatures, self.nchains))
+        self.swap_rate = np.zeros((self.ntemperatures - 1, ))
+        self._nswaps_accepted, self._nswaps_proposed = np.zeros((self.ntemperatures - 1, )), \
+            np.zeros((self.ntemperatures - 1, ))
+
+        if self.verbose:
+            print('\nUQpy: Initialization of ' + self.__class__.__name__ + ' algorithm complete.')
+
+        # If nsamples is provided, run the algorithm
+        if (nsamples is not None) or (nsamples_per_chain is not None):
+            self.run(nsamples=nsamples, nsamples_per_chain=nsamples_per_chain)
+
+    def run_one_iteration(self, current_state, current_log_pdf):
+        """
+        Run one iteration of the parallel tempering algorithm, starting at current state - see ``MCMC`` class.
+        """
+        ntemps, nchains, dim = self.ntemperatures, self.nchains, self.dimension
+        # All replicas start from the seed; later, the replicas at temperature 1 follow the stored chains
+        if self.replica_states is None:
+            self.replica_states = np.tile(current_state[np.newaxis], (ntemps, 1, 1))
+            self.replica_log_pdf = np.tile(current_log_pdf[np.newaxis], (ntemps, 1))
+        self.replica_states[0], self.replica_log_pdf[0] = current_state, current_log_pdf
+        states, log_pdf = self.replica_states.reshape((-1, dim)), self.replica_log_pdf.reshape((-1, ))
+
+        # Metropolis-Hastings step of all replicas, with a single evaluation of the target
+        scales = np.repeat(np.sqrt(self.temperatures), nchains)[:, np.newaxis]
+        increments = self.proposal.rvs(nsamples=ntemps * nchains, random_state=self.random_state)
+        candidate = states + scales * increments
+        log_p_candidate = self.evaluate_log_target(candidate)
+
+        betas = np.repeat(self.betas, nchains)
+        log_ratios = betas * (log_p_candidate - log_pdf)
+        if not self.proposal_is_symmetric:
+            log_ratios -= self.proposal.log_pdf(increments) - self.proposal.log_pdf(-increments)
+        unif_rvs = Uniform().rvs(nsamples=ntemps * nchains, random_state=self.random_state).reshape((-1,))
+        accept = np.log(unif_rvs) < log_ratios
+        states[accept] = candidate[accept]
+        log_pdf[accept] = log_p_candidate[accept]
+        accept = accept.reshape((ntemps, nchains))
+
+        # Swaps between adjacent temperatures (k, k+1), with k even or odd at alternate iterations
+        lower = np.arange(self.niterations % 2, ntemps - 1, 2)
+        if lower.size > 0:
+            upper = lower + 1
+            log_pdf = self.replica_log_pdf
+            log_alpha = (self.betas[lower] - self.betas[upper])[:, np.newaxis] * (log_pdf[upper] - log_pdf[lower])
+            unif_rvs = Uniform().rvs(nsamples=lower.size * nchains, random_state=self.random_state).reshape(
+                (lower.size, nchains))
+            swap = np.log(unif_rvs) < log_alpha
+            k, c = np.nonzero(swap)
+            self.replica_states[lower[k], c], self.replica_states[upper[k], c] = \
+                self.replica_states[upper[k], c], self.replica_states[lower[k], c]
+            log_pdf[lower[k], c], log_pdf[upper[k], c] = log_pdf[upper[k], c], log_pdf[lower[k], c]
+            self._nswaps_accepted[lower] += np.sum(swap, axis=1)
+            self._nswaps_proposed[lower] += nchains
+            self.swap_rate = self._nswaps_accepted / np.maximum(self._nswaps_proposed, 1)
+
+        # Update the acceptance rates
+        self.acceptance_rate_temperatures = accept / self.niterations + (
+                self.niterations - 1) / self.niterations * self.acceptance_rate_temperatures
+        self._update_acceptance_rate(accept[0].astype(float))
+
+        return self.replica_states[0].copy(), self.replica_log_pdf[0].copy()
+
+####################################################################################################################
+
+
+class HMC(MCMC):
+    """
+    Hamiltonian Monte Carlo algorithm.
+
+    The chains are augmented with gaussian momenta :math:`r \\sim N(0, M)` and candidates are obtained by integrating
+    the Hamiltonian dynamics of :math:`H(x, r) = -\\log p(x) + r^T M^{-1} r / 2` with `nsteps` leapfrog steps of size
+    :math:`\\epsilon`. All chains are integrated in lock-step, so that the target and its gradient are evaluated once
+    per leapfrog step for all chains. If the gradient of the log target is not provided, it is approximated with
+    central finite differences computed with a single batched call (see ``Utilities.gradient``), i.e., with
+    ``2 * dimension * nchains`` evaluations of the target per leapfrog step.
+
+    During burn-in, the step size is adapted with the dual averaging scheme of Hoffman and Gelman to reach the
+    acceptance rate `target_acceptance`, and the diagonal mass matrix :math:`M` is set to the inverse of the variance of
+    the burn-in samples (pooled over the chains) estimated in two windows covering 15-50% and 50-85% of the burn-in
+    period. Adaptation is performed only if `nburn` > 0.
+
+    **References:**
+
+    1. R.M. Neal, "MCMC using Hamiltonian dynamics", Handbook of Markov Chain Monte Carlo, 2(11):2, 2011.
+    2. M.D. Hoffman and A. Gelman, "The No-U-Turn sampler: adaptively setting path lengths in Hamiltonian Monte
+       Carlo", Journal of Machine Learning Research, 15(1):1593–1623, 2014.
+
+    **Algorithm-specific inputs:**
+
+    * **gradient_log_pdf_target** (callable):
+        Gradient of the log target, evaluated as ``gradient_log_pdf_target(x, *args_target)`` for `x` of shape
+        ``(n, dimension)``, must return an `ndarray` of shape ``(n, dimension)``. If the target is given as a list of
+        marginals, `args_target` is not passed. Default: None, finite differences are used.
+
+    * **df_step** (`float` or `list`):
+        Finite difference step used to approximate the gradient if `gradient_log_pdf_target` is not provided.
+        Default: 0.001
+
+    * **step_size** (`float`):
+        (Initial) leapfrog step size. Default: None, the initial step size is found with the heuristic of Hoffman and
+        Gelman.
+
+    * **nsteps** (`int`):
+        Number of leapfrog steps per iteration. Default: 10
+
+    * **target_acceptance** (`float`):
+        Target acceptance rate for the adaptation of the step size. Default: 0.65
+
+    * **adapt_mass** (`bool`):
+        Whether to adapt the diagonal mass matrix during burn-in. Default: True
+
+    **Attributes:**
+
+    * **step_size** (`float`)
+        Current step size.
+
+    * **inverse_mass** (`ndarray`)
+        Diagonal of the inverse mass matrix, `ndarray` of shape ``(dimension, )``.
+
+    * **ndivergences** (`int`)
+        Number of divergent trajectories, i.e., for which the Hamiltonian increased by more than 1000.
+
+    **Methods:**
+
+    """
+    def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
+                 seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
+                 nchains=None, gradient_log_pdf_target=None, df_step=None, step_size=None, nsteps=10,
+                 target_acceptance=0.65, adapt_mass=True, verbose=False, random_state=None, save_samples=True,
+                 memmap_file=None):
+
+        super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
+                         dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
+                         concat_chains=concat_chains, verbose=verbose, random_state=random_state, nchains=nchains,
+                         save_samples=save_samples, memmap_file=memmap_file)
+
+        # The target must be evaluated for each chain separately: sum the log marginals if they are provided
+        if self.evaluate_log_target_marginals is not None:
+            marginals = self.evaluate_log_target_marginals
+            self.evaluate_log_target = (lambda x: np.sum(
+                [np.reshape(marginals[j](x[:, j, np.newaxis]), (-1,)) for j in range(len(marginals))], axis=0))
+
+        if gradient_log_pdf_target is not None and not callable(gradient_log_pdf_target):
+            raise TypeError('UQpy: gradient_log_pdf_target must be a callable.')
+        self.gradient_log_pdf_target = gradient_log_pdf_target
+        self._args_gradient = args_target if isinstance(args_target, tuple) else ()
+        self.df_step = df_step
+
+        self.step_size = step_size
+        if self.step_size is not None and not (isinstance(self.step_size, (int, float)) and self.step_size > 0):
+            raise TypeError('UQpy: Input step_size must be a positive float.')
+        self.nsteps = nsteps
+        if not (isinstance(self.nsteps, int) and self.nsteps >= 1):
+            raise TypeError('UQpy: Input nsteps must be an integer >= 1.')
+        self.target_acceptance = target_acceptance
+        if not 0. < self.target_acceptance < 1.:
+            raise ValueError('UQpy: Input target_acceptance must be in (0, 1).')
+        self.adapt_mass = adapt_mass
+
+        self.inverse_mass = np.ones((self.dimension, ))
+        self.ndivergences = 0
+        # Gradient at the current state, dual averaging and mass matrix adaptation variables
+        self._current_gradient = None
+        self._dual_averaging = None
+        self._mass_window = None
+
+        if self.verbose:
+            print('\nUQpy: Initialization of ' + self.__class__.__name__ + ' algorithm complete.')
+
+        # If nsamples is provided, run the algorithm
+        if (nsamples is not None) or (nsamples_per_chain is not None):
+            self.run(nsamples=nsamples, nsamples_per_chain=nsamples_per_chain)
+
+    def run_one_iteration(self, current_state, current_log_pdf):
+        """
+        Run one iteration of the MCMC chain for HMC algorithm, starting at current state - see ``MCMC`` class.
+        """
+        # Gradient at the current state (recomputed if the chains were restarted from stored samples)
+        if self._current_gradient is None or not np.array_equal(self._current_gradient[0], current_state):
+            self._current_gradient = (current_state.copy(), self._evaluate_gradient(current_state))
+        current_gradient = self._current_gradient[1]
+        if self.step_size is None:
+            self.step_size = self._find_step_size(current_state, current_log_pdf, current_gradient)
+
+        # Sample the momenta and build the trajectories of all chains
+        std_normal = Normal().rvs(nsamples=self.nchains * self.dimension,
+                                  random_state=self.random_state).reshape((self.nchains, self.dimension))
+        momentum = std_normal / np.sqrt(self.inverse_mass)
+        new_state, new_log_pdf, new_gradient, accept, accept_stat = self._trajectory(
+            current_state, current_log_pdf, current_gradient, momentum)
+
+        current_state[accept] = new_state[accept]
+        current_log_pdf[accept] = new_log_pdf[accept]
+        current_gradient[accept] = new_gradient[accept]
+        self._current_gradient = (current_state.copy(), current_gradient)
+
+        self._adapt(current_state, current_log_pdf, current_gradient, accept_stat)
+        self._update_acceptance_rate(accept.astype(float))
+        return current_state, current_log_pdf
+
+    def _trajectory(self, state, log_pdf, grad, momentum):
+        """
+        Leapfrog integration of the trajectories of all chains, followed by the Metropolis acceptance step.
+
+        **Inputs:**
+
+        * state, log_pdf, grad (ndarrays): current state of the chains, its log target and gradient
+        * momentum (ndarray of shape (nchains, dimension)): initial momenta
+
+        **Output/Returns:**
+
+        * new_state, new_log_pdf, new_grad (ndarrays): proposed states, their log target and gradient
+        * accept (ndarray of bool): whether the proposed states are accepted
+        * accept_stat (ndarray): acceptance probability of each chain, used for the adaptation of the step size
+
+        """
+        h0 = -log_pdf + self._kinetic_energy(momentum)
+        x, r, g = state.copy(), momentum.copy(), grad.copy()
+        for _ in range(self.nsteps):
+            r = r + 0.5 * self.step_size * g
+            x = x + self.step_size * self.inverse_mass * r
+            g = self._evaluate_gradient(x)
+            r = r + 0.5 * self.step_size * g
+        new_log_pdf = self.evaluate_log_target(x)
+
+        delta_h = -new_log_pdf + self._kinetic_energy(r) - h0
+        delta_h[np.isnan(delta_h)] = np.inf
+        self.ndivergences += int(np.sum(delta_h > 1000.))
+        unif_rvs = Uniform().rvs(nsamples=self.nchains, random_state=self.random_state).reshape((-1,))
+        accept = np.log(unif_rvs) < -delta_h
+        return x, new_log_pdf, g, accept, np.exp(-np.maximum(delta_h, 0.))
+
+    def _kinetic_energy(self, momentum):
+        return 0.5 * np.sum(self.inverse_mass * momentum ** 2, axis=-1)
+
+    def _evaluate_gradient(self, x):
+        """
+        Gradient of the log target at points `x` of shape (n, dimension), for all points at once.
+        """
+        if self.gradient_log_pdf_target is not None:
+            return np.reshape(self.gradient_log_pdf_target(x, *self._args_gradient), x.shape)
+        return gradient(runmodel_object=self.evaluate_log_target, point=x, order='first', df_step=self.df_step,
+                        scheme='central')
+
+    def _find_step_size(self, state, log_pdf, grad):
+        """
+        Heuristic of Hoffman and Gelman for the initial step size: the step size is doubled (halved) until the average
+        acceptance probability of one leapfrog step from the current states crosses 0.5.
+        """
+        std_normal = Normal().rvs(nsamples=self.nchains * self.dimension,
+                                  random_state=self.random_state).reshape((self.nchains, self.dimension))
+        r0 = std_normal / np.sqrt(self.inverse_mass)
+        h0 = -log_pdf + self._kinetic_energy(r0)
+
+        def log_accept(eps):
+            r = r0 + 0.5 * eps * grad
+            x = state + eps * self.inverse_mass * r
+            g = self._evaluate_gradient(x)
+            r = r + 0.5 * eps * g
+            delta_h = -self.evaluate_log_target(x) + self._kinetic_energy(r) - h0
+            return np.log(np.mean(np.exp(-np.maximum(np.nan_to_num(delta_h, nan=np.inf), 0.))) + 1e-300)
+
+        eps = 1.
+        direction = 1. if log_accept(eps) > np.log(0.5) else -1.
+        for _ in range(50):
+            eps_new = eps * 2. ** direction
+            if (direction * log_accept(eps_new)) <= direction * np.log(0.5):
+                break
+            eps = eps_new
+        return eps
+
+    def _adapt(self, state, log_pdf, grad, accept_stat):
+        """
+        Adaptation of the step size (dual averaging) and of the diagonal mass matrix during burn-in.
+        """
+        if self.niterations > self.nburn:
+            return
+        if self._dual_averaging is None:
+            self._dual_averaging = {'mu': np.log(10. * self.step_size), 'h_bar': 0., 'log_eps_bar': 0., 'm': 0}
+        da = self._dual_averaging
+        da['m'] += 1
+        eta = 1. / (da['m'] + 10.)
+        da['h_bar'] = (1. - eta) * da['h_bar'] + eta * (self.target_acceptance - np.mean(accept_stat))
+        log_eps = da['mu'] - np.sqrt(da['m']) / 0.05 * da['h_bar']
+        weight = da['m'] ** (-0.75)
+        da['log_eps_bar'] = weight * log_eps + (1. - weight) * da['log_eps_bar']
+        self.step_size = np.exp(log_eps)
+
+        if self.adapt_mass:
+            start, middle, end = int(0.15 * self.nburn), int(0.5 * self.nburn), int(0.85 * self.nburn)
+            if start < self.niterations <= end:
+                # Pooled mean and sum of squared deviations of the chains in the current window (Chan's update)
+                if self._mass_window is None:
+                    self._mass_window = [0, np.zeros((self.dimension, )), np.zeros((self.dimension, ))]
+                n, mean, m2 = self._mass_window
+                batch_mean = np.mean(state, axis=0)
+                delta = batch_mean - mean
+                n_new = n + self.nchains
+                mean = mean + delta * self.nchains / n_new
+                m2 = m2 + np.sum((state - batch_mean) ** 2, axis=0) + delta ** 2 * n * self.nchains / n_new
+                self._mass_window = [n_new, mean, m2]
+                if self.niterations in (middle, end) and n_new > 1:
+                    variance = m2 / (n_new - 1)
+                    self.inverse_mass = n_new / (n_new + 5.) * variance + 1e-3 * 5. / (n_new + 5.)
+                    self._mass_window = None
+                    self.step_size = self._find_step_size(state, log_pdf, grad)
+                    self._dual_averaging = None
+
+        if self.niterations == self.nburn and self._dual_averaging is not None:
+            self.step_size = np.exp(self._dual_averaging['log_eps_bar'])
+
+####################################################################################################################
+
+
+class NUTS(HMC):
+    """
+    No-U-Turn sampler.
+
+    Extension of the ``HMC`` algorithm where the number of leapfrog steps is chosen automatically: the trajectory of
+    each chain is extended forward or backward in time by repeated doubling, until it makes a U-turn or reaches
+    2 ** `max_depth` steps, and the new state is sampled from the trajectory with multinomial (biased progressive)
+    sampling. The trajectories of all chains are built in lock-step: at each leapfrog step, the target and its gradient
+    are evaluated once for all the chains whose trajectory is still being extended. See ``HMC`` for the adaptation of
+    the step size and mass matrix.
+
+    **References:**
+
+    1. M.D. Hoffman and A. Gelman, "The No-U-Turn sampler: adaptively setting path lengths in Hamiltonian Monte
+       Carlo", Journal of Machine Learning Research, 15(1):1593–1623, 2014.
+    2. M. Betancourt, "A conceptual introduction to Hamiltonian Monte Carlo", arXiv:1701.02434, 2017.
+
+    **Algorithm-specific inputs:**
+
+    * **max_depth** (`int`):
+        Maximum depth of the trajectory tree. Default: 10
+
+    * **target_acceptance** (`float`):
+        Target acceptance statistic for the adaptation of the step size. Default: 0.8
+
+    See ``HMC`` for the other inputs and attributes.
+
+    **Methods:**
+
+    """
+    def __init__(self, pdf_target=None, log_pdf_target=None, args_target=None, nburn=0, jump=1, dimension=None,
+                 seed=None, save_log_pdf=False, concat_chains=True, nsamples=None, nsamples_per_chain=None,
+                 nchains=None, gradient_log_pdf_target=None, df_step=None, step_size=None, max_depth=10,
+                 target_acceptance=0.8, adapt_mass=True, verbose=False, random_state=None, save_samples=True,
+                 memmap_file=None):
+
+        self.max_depth = max_depth
+        if not (isinstance(self.max_depth, int) and self.max_depth >= 1):
+            raise TypeError('UQpy: Input max_depth must be an integer >= 1.')
+
+        super().__init__(pdf_target=pdf_target, log_pdf_target=log_pdf_target, args_target=args_target,
+                         dimension=dimension, seed=seed, nburn=nburn, jump=jump, save_log_pdf=save_log_pdf,
+                         concat_chains=concat_chains, nsamples=nsamples, nsamples_per_chain=nsamples_per_chain,
+                         nchains=nchains, gradient_log_pdf_target=gradient_log_pdf_target, df_step=df_step,
+                         step_size=step_size, target_acceptance=target_acceptance, adapt_mass=adapt_mass,
+                         verbose=verbose, random_state=random_state, save_samples=save_samples,
+                         memmap_file=memmap_file)
+
+    def _trajectory(self, state, log_pdf, grad, momentum):
+        """
+        Build the trajectories of all chains by repeated doubling and sample the new states - see ``HMC._trajectory``.
+
+        Each subtree is built leapfrog step by leapfrog step; the U-turn criterion of all its sub-trees is checked as
+        soon as their last leaf is computed, using the first leaf of each sub-tree stored at the corresponding level.
+        """
+        nchains = self.nchains
+        h0 = -log_pdf + self._kinetic_energy(momentum)
+        # Ends of the trajectories (index 0: backward end, index 1: forward end) and current candidates
+        ends_x = np.stack([state, state]).copy()
+        ends_r = np.stack([momentum, momentum]).copy()
+        ends_g = np.stack([grad, grad]).copy()
+        cand_x, cand_lp, cand_g = state.copy(), log_pdf.copy(), grad.copy()
+        log_w = np.zeros((nchains, ))
+        active = np.ones((nchains, ), dtype=bool)
+        sum_stat, nleaves = np.zeros((nchains, )), np.zeros((nchains, ))
+
+        for depth in range(self.max_depth):
+            if not np.any(active):
+                break
+            direction = (Uniform().rvs(nsamples=nchains, random_state=self.random_state).reshape((-1,)) < 0.5)
+            side = direction.astype(int)
+            rows = np.arange(nchains)
+            x, r, g = ends_x[side, rows].copy(), ends_r[side, rows].copy(), ends_g[side, rows].copy()
+            sign = np.where(direction, 1., -1.)[:, np.newaxis]
+            sub_ok = active.copy()
+            sub_log_w = np.full((nchains, ), -np.inf)
+            sub_x, sub_lp, sub_g = x.copy(), np.zeros((nchains, )), g.copy()
+            checkpoints_x, checkpoints_r = [None] * (depth + 1), [None] * (depth + 1)
+
+            for k in range(2 ** depth):
+                idx = np.nonzero(sub_ok)[0]
+                if idx.size == 0:
+                    break
+                eps = self.step_size * sign[idx]
+                r[idx] = r[idx] + 0.5 * eps * g[idx]
+                x[idx] = x[idx] + eps * self.inverse_mass * r[idx]
+                lp_leaf = self.evaluate_log_target(x[idx])
+                g[idx] = self._evaluate_gradient(x[idx])
+                r[idx] = r[idx] + 0.5 * eps * g[idx]
+
+                delta_h = -lp_leaf + self._kinetic_energy(r[idx]) - h0[idx]
+                delta_h[np.isnan(delta_h)] = np.inf
+                sum_stat[idx] += np.exp(-np.maximum(delta_h, 0.))
+                nleaves[idx] += 1
+                divergent = delta_h > 1000.
+                self.ndivergences += int(np.sum(divergent))
+
+                # Multinomial sampling of the candidate within the subtree
+                leaf_log_w = -delta_h
+                new_sub_log_w = np.logaddexp(sub_log_w[idx], leaf_log_w)
+                unif_rvs = Uniform().rvs(nsamples=idx.size, random_state=self.random_state).reshape((-1,))
+                take = np.log(unif_rvs) < leaf_log_w - new_sub_log_w
+                sub_x[idx[take]], sub_lp[idx[take]], sub_g[idx[take]] = x[idx[take]], lp_leaf[take], g[idx[take]]
+                sub_log_w[idx] = new_sub_log_w
+
+                # U-turn checks of the sub-trees of size 2 ** m starting at (k + 1 - 2 ** m) and ending at leaf k
+                uturn = np.zeros((idx.size, ), dtype=bool)
+                for m in range(1, depth + 1):
+                    if k % 2 ** m == 0:
+                        checkpoints_x[m], checkpoints_r[m] = x.copy(), r.copy()
+                    elif (k + 1) % 2 ** m == 0:
+                        uturn |= self._uturn(checkpoints_x[m][idx], checkpoints_r[m][idx], x[idx], r[idx],
+                                             direction[idx])
+                sub_ok[idx[divergent | uturn]] = False
+
+            # Merge the valid subtrees in the trajectories, with biased progressive sampling of the candidate
+            valid = active & sub_ok
+            active &= valid
+            if np.any(valid):
+                ends_x[side[valid], rows[valid]] = x[valid]
+                ends_r[side[valid], rows[valid]] = r[valid]
+                ends_g[side[valid], rows[valid]] = g[valid]
+                unif_rvs = Uniform().rvs(nsamples=nchains, random_state=self.random_state).reshape((-1,))
+                take = valid & (np.log(unif_rvs) < sub_log_w - log_w)
+                cand_x[take], cand_lp[take], cand_g[take] = sub_x[take], sub_lp[take], sub_g[take]
+                log_w[valid] = np.logaddexp(log_w[valid], sub_log_w[valid])
+                active[valid] = ~self._uturn(ends_x[0, valid], ends_r[0, valid], ends_x[1, valid], ends_r[1, valid],
+                                             np.ones((int(np.sum(valid)), ), dtype=bool))
+
+        accept = np.any(cand_x != state, axis=1)
+        return cand_x, cand_lp, cand_g, accept, sum_stat / np.maximum(nleaves, 1)
+
+    def _uturn(self, x_start, r_start, x_end, r_end, forward):
+        """
+        U-turn criterion between the first and last leaves of (sub-)trajectories built forward or backward in time.
+        """
+        dx = np.where(forward[:, np.newaxis], x_end - x_start, x_start - x_end)
+        r_minus = np.where(forward[:, np.newaxis], r_start, r_end)
+        r_plus = np.where(forward[:, np.newaxis], r_end, r_start)
+        return (np.sum(dx * self.inverse_mass * r_minus, axis=1) < 0.) | \
+               (np.sum(dx * self.inverse_mass * r_plus, axis=1) < 0.)
+
 
 ########################################################################################################################
 ########################################################################################################################
@@ -4483,6 +5680,12 @@ class IS:
         If an integer is provided, this sets the seed for an object of ``numpy.random.RandomState``. Otherwise, the
         object itself can be passed directly.
 
+    * **save_samples** (`bool`):
+        Boolean that indicates whether to save all the samples and weights. If False, only the samples of the last
+        chunk are kept (see ``run`` method), and the samples are summarized by the running statistics `ess`,
+        `log_evidence`, `running_mean` and `running_variance`, so that very large numbers of samples can be processed
+        in bounded memory. Default: True
+
 
     **Attributes:**
 
@@ -4498,11 +5701,27 @@ class IS:
     * **unweighted_samples** (`ndarray`):
         Set of un-weighted samples (useful for instance for plotting), computed by calling the `resample` method
 
+    * **nsamples** (`int`):
+        Total number of samples generated.
+
+    * **ess** (`float`):
+        Effective sample size of the weighted samples, (sum of weights) ** 2 / (sum of squared weights).
+
+    * **log_evidence** (`float`):
+        Logarithm of the average unnormalized weight, i.e., estimate of the log of the normalizing constant of the
+        target (the model evidence if the target is an unnormalized posterior).
+
+    * **running_mean** (`ndarray`):
+        Weighted mean of the samples, `ndarray` of shape (dim, ).
+
+    * **running_variance** (`ndarray`):
+        Weighted variance of the samples, `ndarray` of shape (dim, ).
+
     **Methods:**
     """
     # Last Modified: 10/05/2020 by Audrey Olivier
     def __init__(self, nsamples=None, pdf_target=None, log_pdf_target=None, args_target=None,
-                 proposal=None, verbose=False, random_state=None):
+                 proposal=None, verbose=False, random_state=None, save_samples=True):
         # Initialize proposal: it should have an rvs and log pdf or pdf method
         self.proposal = proposal
         if not isinstance(self.proposal, Distribution):
@@ -4525,54 +5744,86 @@ class IS:
         elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
             raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
 
+        self.save_samples = save_samples
+
         # Initialize the samples and weights
         self.samples = None
         self.unnormalized_log_weights = None
         self.weights = None
         self.unweighted_samples = None
+        self.nsamples = 0
+        self.ess, self.log_evidence = None, None
+        self.running_mean, self.running_variance = None, None
+        # Running sums of the weights, squared weights and weighted samples, all scaled by exp(-_log_weight_shift)
+        self._log_weight_shift = -np.inf
+        self._sum_weights, self._sum_squared_weights = 0., 0.
+        self._sum_weighted_samples, self._sum_weighted_squares = 0., 0.
 
         # Run IS if nsamples is provided
         if nsamples is not None and nsamples != 0:
             self.run(nsamples)
 
-    def run(self, nsamples):
+    def run(self, nsamples, nsamples_per_chunk=None):
         """
         Generate and weight samples.
 
         This function samples from the proposal and appends samples to existing ones (if any). It then weights the
         samples as log_w_unnormalized) = log(target)-log(proposal).
 
+        The samples are generated and weighted by chunks of `nsamples_per_chunk` samples (one call to the target per
+        chunk). The normalization of the weights, the effective sample size and the weighted moments of the samples are
+        updated incrementally after each chunk, using running sums shifted by the largest log weight (log-sum-exp), so
+        that the weights of existing samples are never recomputed from scratch.
+
         **Inputs:**
 
         * **nsamples** (`int`)
             Number of weighted samples to generate.
 
+        * **nsamples_per_chunk** (`int`)
+            Number of samples generated and weighted at once. Default: None, all samples are generated at once.
+
         * **Output/Returns:**
 
-        This function has no returns, but it updates the output attributes `samples`, `unnormalized_log_weights` and
-        `weights` of the ``IS`` object.
+        This function has no returns, but it updates the output attributes `samples`, `unnormalized_log_weights`,
+        `weights`, `nsamples`, `ess`, `log_evidence`, `running_mean` and `running_variance` of the ``IS`` object.
         """
+        if not (isinstance(nsamples, int) and nsamples >= 0):
+            raise TypeError('UQpy: nsamples must be an integer >= 0.')
+        if nsamples_per_chunk is None:
+            nsamples_per_chunk = max(nsamples, 1)
+        if not (isinstance(nsamples_per_chunk, int) and nsamples_per_chunk >= 1):
+            raise TypeError('UQpy: nsamples_per_chunk must be an integer >= 1.')
 
         if self.verbose:
             print('UQpy: Running Importance Sampling...')
-        # Sample from proposal
-        new_samples = self.proposal.rvs(nsamples=nsamples, random_state=self.random_state)
-        # Compute un-scaled weights of new samples
-        new_log_weights = self.evaluate_log_target(x=new_samples) - self.proposal.log_pdf(x=new_samples)
+        new_samples, new_log_weights = [], []
+        for start in range(0, nsamples, nsamples_per_chunk):
+            # Sample from proposal and compute un-scaled weights of new samples
+            chunk_samples = self.proposal.rvs(nsamples=min(nsamples_per_chunk, nsamples - start),
+                                              random_state=self.random_state)
+            chunk_log_weights = np.reshape(
+                self.evaluate_log_target(x=chunk_samples) - self.proposal.log_pdf(x=chunk_samples), (-1, ))
+            self._update_running_sums(chunk_samples, chunk_log_weights)
+            if self.save_samples:
+                new_samples.append(chunk_samples)
+                new_log_weights.append(chunk_log_weights)
+            else:
+                new_samples, new_log_weights = [chunk_samples], [chunk_log_weights]
 
         # Save samples and weights (append to existing if necessary)
-        if self.samples is None:
-            self.samples = new_samples
-            self.unnormalized_log_weights = new_log_weights
-        else:
-            self.samples = np.concatenate([self.samples, new_samples], axis=0)
-            self.unnormalized_log_weights = np.concatenate([self.unnormalized_log_weights, new_log_weights], axis=0)
-
-        # Take the exponential and normalize the weights
-        weights = np.exp(self.unnormalized_log_weights - max(self.unnormalized_log_weights))
-        # note: scaling with max avoids having NaN of Inf when taking the exp
-        sum_w = np.sum(weights, axis=0)
-        self.weights = weights / sum_w
+        if len(new_samples) > 0:
+            if self.samples is None or not self.save_samples:
+                self.samples = np.concatenate(new_samples, axis=0)
+                self.unnormalized_log_weights = np.concatenate(new_log_weights, axis=0)
+            else:
+                self.samples = np.concatenate([self.samples] + new_samples, axis=0)
+                self.unnormalized_log_weights = np.concatenate([self.unnormalized_log_weights] + new_log_weights,
+                                                               axis=0)
+
+            # Normalize the weights with the running sum of weights
+            # note: scaling with the largest log weight avoids having NaN of Inf when taking the exp
+            self.weights = np.exp(self.unnormalized_log_weights - self._log_weight_shift) / self._sum_weights
         if self.verbose:
             print('UQpy: Importance Sampling performed successfully')
 
@@ -4582,29 +5833,45 @@ class IS:
                 print('UQpy: unweighted samples are being deleted, call the resample method to regenerate them')
             self.unweighted_samples = None
 
-    # def resample(self, method='multinomial', nsamples=None):
-    #     """
-    #     Resample to get a set of un-weighted samples that represent the target pdf.
-    #
-    #     Utility function that creates a set of un-weighted samples from a set of weighted samples. Can be useful for
-    #     plotting for instance.
-    #
-    #     **Inputs:**
-    #
-    #     * **method** (`str`)
-    #         Resampling method, as of V3 only multinomial resampling is supported. Default: 'multinomial'.
-    #     * **nsamples** (`int`)
-    #         Number of un-weighted samples to generate. Default: None (same number of samples is generated as number of
-    #         existing samples).
-    #
-    #     **Output/Returns:**
-    #
-    #     * (`ndarray`)
-    #         Un-weighted samples that represent the target pdf, `ndarray` of shape (nsamples, dimension)
-    #
-    #     """
-    #     from .Utilities import resample
-    #     return resample(self.samples, self.weights, method=method, size=nsamples)
+    def _update_running_sums(self, samples, log_weights):
+        """
+        Update the running sums of weights, squared weights and weighted samples with a new chunk of samples, and the
+        attributes computed from them (nsamples, ess, log_evidence, running_mean and running_variance).
+
+        The sums are stored scaled by exp(-shift), where shift is the largest log weight seen so far, and are rescaled
+        whenever a larger log weight appears.
+
+        **Inputs:**
+
+        * samples (ndarray of shape (n, dim)): new samples
+        * log_weights (ndarray of shape (n, )): unnormalized log weights of the new samples
+
+        """
+        samples = np.reshape(samples, (log_weights.shape[0], -1))
+        new_shift = max(self._log_weight_shift, np.max(log_weights))
+        if np.isfinite(new_shift):
+            if new_shift > self._log_weight_shift:
+                rescale = np.exp(self._log_weight_shift - new_shift)
+                self._sum_weights *= rescale
+                self._sum_squared_weights *= rescale ** 2
+                self._sum_weighted_samples = self._sum_weighted_samples * rescale
+                self._sum_weighted_squares = self._sum_weighted_squares * rescale
+                self._log_weight_shift = new_shift
+            weights = np.exp(log_weights - new_shift)
+            self._sum_weights += np.sum(weights)
+            self._sum_squared_weights += np.sum(weights ** 2)
+            self._sum_weighted_samples = self._sum_weighted_samples + np.dot(weights, samples)
+            self._sum_weighted_squares = self._sum_weighted_squares + np.dot(weights, samples ** 2)
+        self.nsamples += log_weights.shape[0]
+
+        if self._sum_weights > 0.:
+            self.ess = self._sum_weights ** 2 / self._sum_squared_weights
+            self.log_evidence = self._log_weight_shift + np.log(self._sum_weights / self.nsamples)
+            self.running_mean = self._sum_weighted_samples / self._sum_weights
+            self.running_variance = np.maximum(self._sum_weighted_squares / self._sum_weights -
+                                               self.running_mean ** 2, 0.)
+        else:
+            self.ess, self.log_evidence = 0., -np.inf
 
     def resample(self, method='multinomial', nsamples=None):
         """
@@ -4619,7 +5886,9 @@ class IS:
         **Inputs:**
 
         * **method** (`str`)
-            Resampling method, as of V3 only multinomial resampling is supported. Default: 'multinomial'.
+            Resampling method, either 'multinomial', 'systematic', 'stratified' or 'residual'. The systematic,
+            stratified and residual schemes yield resampled sets with lower variance than the multinomial scheme.
+            Default: 'multinomial'.
         * **nsamples** (`int`)
             Number of un-weighted samples to generate. Default: None (sets `nsamples` equal to the number of
             existing weighted samples).
@@ -4632,18 +5901,51 @@ class IS:
             Un-weighted samples that represent the target pdf, `ndarray` of shape (nsamples, dimension)
 
         """
-
+        if not self.save_samples:
+            raise ValueError('UQpy: Input save_samples must be True in order to resample.')
         if nsamples is None:
             nsamples = self.samples.shape[0]
+        counts = self._resampling_counts(self.weights, nsamples, method, self.random_state)
+        self.unweighted_samples = np.repeat(self.samples, counts, axis=0)
+
+    @staticmethod
+    def _resampling_counts(weights, nsamples, method, random_state=None):
+        """
+        Number of copies of each weighted sample in a resampled set.
+
+        **Inputs:**
+
+        * weights (ndarray of shape (n, )): normalized weights
+        * nsamples (int): number of resampled samples
+        * method (str): resampling method, 'multinomial', 'systematic', 'stratified' or 'residual'
+        * random_state (None or RandomState): random state
+
+        **Output/Returns:**
+
+        * counts (ndarray of int of shape (n, )): number of copies of each sample, summing up to nsamples
+
+        """
+        rng = np.random if random_state is None else random_state
+        nweights = weights.shape[0]
         if method == 'multinomial':
-            multinomial_run = np.random.multinomial(nsamples, self.weights, size=1)[0]
-            idx = list()
-            for j in range(self.samples.shape[0]):
-                if multinomial_run[j] > 0:
-                    idx.extend([j for _ in range(multinomial_run[j])])
-            self.unweighted_samples = self.samples[idx, :]
+            return rng.multinomial(nsamples, weights)
+        if method == 'residual':
+            counts = np.floor(nsamples * weights).astype(int)
+            nresidual = nsamples - int(np.sum(counts))
+            if nresidual > 0:
+                residual_weights = nsamples * weights - counts
+                counts += rng.multinomial(nresidual, residual_weights / np.sum(residual_weights))
+            return counts
+        if method == 'systematic':
+            positions = (rng.uniform() + np.arange(nsamples)) / nsamples
+        elif method == 'stratified':
+            positions = (rng.uniform(size=nsamples) + np.arange(nsamples)) / nsamples
         else:
-            raise ValueError('Exit code: Current available method: multinomial')
+            raise ValueError('UQpy: Resampling method must be multinomial, systematic, stratified or residual.')
+        cumulative_weights = np.cumsum(weights)
+        cumulative_weights[-1] = 1.
+        indices = np.minimum(np.searchsorted(cumulative_weights, positions, side='right'), nweights - 1)
+        return np.bincount(indices, minlength=nweights)
 
     @staticmethod
     def _preprocess_target(log_pdf_, pdf_, args):
@@ -4684,3 +5986,254 @@ class IS:
         else:
             raise ValueError('UQpy: log_pdf_target or pdf_target should be provided.')
         return evaluate_log_pdf
+
+
+########################################################################################################################
+########################################################################################################################
+#                                         Transitional Markov Chain Monte Carlo
+########################################################################################################################
+
+class TMCMC:
+    """
+    Sample from a posterior density using transitional Markov Chain Monte Carlo (sequential Monte Carlo).
+
+    The samples are moved from the prior :math:`p(x)` to the posterior :math:`p(x \\vert data) \\propto p(x) L(x)`
+    through the sequence of tempered densities :math:`p_j(x) \\propto p(x) L(x)^{\\beta_j}`, with
+    :math:`0 = \\beta_0 < \\beta_1 < ... < \\beta_m = 1`. At each stage, :math:`\\beta_{j+1}` is chosen so that the
+    coefficient of variation of the weights :math:`L(x)^{\\beta_{j+1} - \\beta_j}` of the current samples is equal to
+    `cov_weights`. The samples are then resampled according to these weights and moved with `nsteps`
+    Metropolis-Hastings steps targeting :math:`p_{j+1}`, using a gaussian proposal whose covariance is the weighted
+    sample covariance scaled by `scale` ** 2. The scale is adapted after each stage, towards an acceptance rate of 0.23.
+
+    All the samples are moved in lock-step, so that each Metropolis-Hastings step requires a single call to the log
+    likelihood for the whole population (e.g., a single call to ``InferenceModel.evaluate_log_likelihood``, and thus a
+    single, possibly parallel, call to ``RunModel.run``). Candidates outside the support of the prior are rejected
+    without evaluating the likelihood. The model evidence :math:`p(data)` is obtained as a by-product, as the product
+    over all stages of the average weights.
+
+    **References:**
+
+    1. J. Ching and Y.-C. Chen, "Transitional Markov chain Monte Carlo method for Bayesian model updating, model class
+       selection, and model averaging", Journal of Engineering Mechanics, 133(7):816–832, 2007.
+    2. W. Betz, I. Papaioannou and D. Straub, "Transitional Markov chain Monte Carlo: observations and improvements",
+       Journal of Engineering Mechanics, 142(5):04016016, 2016.
+
+    **Inputs:**
+
+    * **nsamples** (`int`):
+        Number of samples to generate - see ``run`` method. If not `None`, the `run` method is called when the object is
+        created. Default is None.
+
+    * **log_likelihood** (callable):
+        Callable that evaluates the log likelihood, as ``log_likelihood(x, *args_likelihood)`` where `x` is an
+        `ndarray` of shape (nsamples, dimension). It must return an `ndarray` of shape (nsamples, ).
+
+    * **args_likelihood** (`tuple`):
+        Positional arguments of the log likelihood callable.
+
+    * **prior** (``Distribution`` object):
+        Prior distribution. This ``UQpy.Distributions`` object must have an rvs method and a log_pdf (or pdf) method.
+
+    * **cov_weights** (`float`):
+        Target coefficient of variation of the weights at each stage, which governs the number of stages. Default: 1.0
+
+    * **nsteps** (`int`):
+        Number of Metropolis-Hastings steps per stage. Default: 5
+
+    * **scale** (`float`):
+        Initial scale factor of the proposal covariance. Default: 0.2
+
+    * **verbose** (`boolean`)
+        Set ``verbose = True`` to print status messages to the terminal during execution.
+
+    * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+        Random seed used to initialize the pseudo-random number generator. Default is None.
+
+        If an integer is provided, this sets the seed for an object of ``numpy.random.RandomState``. Otherwise, the
+        object itself can be passed directly.
+
+    **Attributes:**
+
+    * **samples** (`ndarray`):
+        Set of samples following the posterior density, `ndarray` of shape (nsamples, dimension)
+
+    * **log_likelihood_values** (`ndarray`):
+        Log likelihood of the samples, `ndarray` of shape (nsamples, )
+
+    * **betas** (`list`):
+        Tempering exponents of all stages.
+
+    * **acceptance_rate** (`list`):
+        Acceptance rate of the Metropolis-Hastings steps at each stage.
+
+    * **log_evidence** (`float`):
+        Logarithm of the model evidence.
+
+    * **evidence** (`float`):
+        Model evidence.
+
+    **Methods:**
+    """
+    def __init__(self, nsamples=None, log_likelihood=None, args_likelihood=None, prior=None, cov_weights=1.,
+                 nsteps=5, scale=0.2, verbose=False, random_state=None):
+        if not callable(log_likelihood):
+            raise TypeError('UQpy: log_likelihood must be a callable.')
+        if args_likelihood is None:
+            args_likelihood = ()
+        self.evaluate_log_likelihood = (lambda x: np.reshape(log_likelihood(x, *args_likelihood), (-1, )))
+        self.log_likelihood = log_likelihood
+        self.args_likelihood = args_likelihood
+
+        # Initialize prior: it should have an rvs and log pdf or pdf method
+        self.prior = prior
+        if not isinstance(self.prior, Distribution):
+            raise TypeError('UQpy: The prior should be of type Distribution.')
+        if not hasattr(self.prior, 'rvs'):
+            raise AttributeError('UQpy: The prior should have an rvs method')
+        if not hasattr(self.prior, 'log_pdf'):
+            if not hasattr(self.prior, 'pdf'):
+                raise AttributeError('UQpy: The prior should have a log_pdf or pdf method')
+            self.prior.log_pdf = lambda x: np.log(self.prior.pdf(x))
+
+        self.cov_weights = cov_weights
+        if not (isinstance(self.cov_weights, (int, float)) and self.cov_weights > 0):
+            raise TypeError('UQpy: Input cov_weights must be a positive float.')
+        self.nsteps = nsteps
+        if not (isinstance(self.nsteps, int) and self.nsteps >= 1):
+            raise TypeError('UQpy: Input nsteps must be an integer >= 1.')
+        self.scale = scale
+        self.verbose = verbose
+        self.random_state = random_state
+        if isinstance(self.random_state, int):
+            self.random_state = np.random.RandomState(self.random_state)
+        elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
+            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+
+        # Initialize the outputs
+        self.samples = None
+        self.log_likelihood_values = None
+        self.betas = []
+        self.acceptance_rate = []
+        self.log_evidence, self.evidence = None, None
+
+        if nsamples is not None and nsamples != 0:
+            self.run(nsamples)
+
+    def run(self, nsamples):
+        """
+        Run the TMCMC algorithm.
+
+        This function runs all the stages of the algorithm, from the prior to the posterior. Existing samples (if any)
+        are discarded.
+
+        **Inputs:**
+
+        * **nsamples** (`int`)
+            Number of samples to generate.
+
+        * **Output/Returns:**
+
+        This function has no returns, but it updates the output attributes `samples`, `log_likelihood_values`, `betas`,
+        `acceptance_rate`, `log_evidence` and `evidence` of the ``TMCMC`` object.
+        """
+        if not (isinstance(nsamples, int) and nsamples >= 2):
+            raise TypeError('UQpy: nsamples must be an integer >= 2.')
+        if self.verbose:
+            print('UQpy: Running TMCMC...')
+
+        # Stage 0: samples from the prior
+        samples = np.reshape(self.prior.rvs(nsamples=nsamples, random_state=self.random_state), (nsamples, -1))
+        dimension = samples.shape[1]
+        log_prior = np.reshape(self.prior.log_pdf(samples), (-1, ))
+        log_like = self.evaluate_log_likelihood(samples)
+        beta, self.betas, self.acceptance_rate, log_evidence = 0., [0.], [], 0.
+        scale = self.scale
+
+        while beta < 1.:
+            # Next tempering exponent, weights and contribution to the evidence
+            beta_new = self._next_beta(beta, log_like)
+            log_weights = (beta_new - beta) * log_like
+            max_log_weight = np.max(log_weights)
+            weights = np.exp(log_weights - max_log_weight)
+            log_evidence += max_log_weight + np.log(np.mean(weights))
+            weights /= np.sum(weights)
+
+            # Proposal covariance from the weighted samples
+            centered = samples - np.dot(weights, samples)
+            cov = scale ** 2 * np.dot(centered.T, centered * weights[:, np.newaxis])
+            cov += 1e-12 * np.max(np.abs(np.diag(cov))) * np.eye(dimension)
+            chol = np.linalg.cholesky(cov)
+
+            # Resampling
+            unif_rvs = Uniform().rvs(nsamples=nsamples, random_state=self.random_state).reshape((-1, ))
+            idx = np.minimum(np.searchsorted(np.cumsum(weights), unif_rvs, side='right'), nsamples - 1)
+            samples, log_prior, log_like = samples[idx], log_prior[idx], log_like[idx]
+
+            # Metropolis-Hastings steps, all samples at once
+            naccepted = 0
+            for _ in range(self.nsteps):
+                std_normal = Normal().rvs(nsamples=nsamples * dimension,
+                                          random_state=self.random_state).reshape((nsamples, dimension))
+                candidates = samples + np.dot(std_normal, chol.T)
+                log_prior_candidates = np.reshape(self.prior.log_pdf(candidates), (-1, ))
+                log_like_candidates = np.full((nsamples, ), -np.inf)
+                in_support = np.isfinite(log_prior_candidates)
+                if np.any(in_support):
+                    log_like_candidates[in_support] = self.evaluate_log_likelihood(candidates[in_support])
+                with np.errstate(invalid='ignore'):
+                    log_ratio = log_prior_candidates + beta_new * log_like_candidates - log_prior - beta_new * log_like
+                unif_rvs = Uniform().rvs(nsamples=nsamples, random_state=self.random_state).reshape((-1, ))
+                accept = np.log(unif_rvs) < log_ratio
+                samples[accept] = candidates[accept]
+                log_prior[accept] = log_prior_candidates[accept]
+                log_like[accept] = log_like_candidates[accept]
+                naccepted += np.sum(accept)
+
+            beta = beta_new
+            self.betas.append(beta)
+            self.acceptance_rate.append(naccepted / (nsamples * self.nsteps))
+            # Adapt the scale of the proposal towards an acceptance rate of 0.23 for the next stage
+            scale *= np.exp(self.acceptance_rate[-1] - 0.23)
+            if self.verbose:
+                print('UQpy: TMCMC stage {} completed, beta = {:.4g}'.format(len(self.betas) - 1, beta))
+
+        self.samples = samples
+        self.log_likelihood_values = log_like
+        self.log_evidence = log_evidence
+        self.evidence = np.exp(log_evidence)
+        if self.verbose:
+            print('UQpy: TMCMC performed successfully')
+
+    def _next_beta(self, beta, log_like):
+        """
+        Find the next tempering exponent by bisection, so that the coefficient of variation of the weights is equal to
+        `cov_weights` (or return 1 if the weights towards beta=1 satisfy this criterion).
+
+        **Inputs:**
+
+        * beta (float): current tempering exponent
+        * log_like (ndarray of shape (nsamples, )): log likelihood of the current samples
+
+        **Output/Returns:**
+
+        * beta_new (float): next tempering exponent
+
+        """
+        log_like = log_like - np.max(log_like)
+
+        def cov_weights(dbeta):
+            weights = np.exp(dbeta * log_like)
+            return np.std(weights) / np.mean(weights)
+
+        if cov_weights(1. - beta) <= self.cov_weights:
+            return 1.
+        low, high = 0., 1. - beta
+        for _ in range(100):
+            middle = 0.5 * (low + high)
+            if cov_weights(middle) > self.cov_weights:
+                high = middle
+            else:
+                low = middle
+            if high - low < 1e-10 * (1. - beta):
+                break
+        return beta + low if low > 0. else beta + high
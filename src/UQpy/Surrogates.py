@@ -540,8 +540,9 @@ class Kriging:
             except np.linalg.LinAlgError:
                 return np.inf, np.zeros(n)
 
-            # Product of diagonal terms is negligible sometimes, even when cc exists.
-            if np.prod(np.diagonal(cc)) == 0:
+            # The Cholesky factor must have a positive diagonal; its product may underflow for large training sets,
+            # which is handled by the log-determinant below.
+            if np.any(np.diagonal(cc) <= 0):
                 return np.inf, np.zeros(n)
 
             cc_inv = np.linalg.inv(cc)
@@ -561,11 +562,14 @@ class Kriging:
             # Computing the process variance (Eq: 3.13, DACE)
             sigma_ = np.zeros(y.shape[1])
 
+            # Log-determinant of R from its Cholesky factor, det(R) underflows for large training sets
+            log_det_r = 2 * np.sum(np.log(np.diagonal(cc)))
+
             ll = 0
             for out_dim in range(y.shape[1]):
                 sigma_[out_dim] = (1 / m) * (np.linalg.norm(y__[:, out_dim] - np.matmul(f__, beta_[:, out_dim])) ** 2)
                 # Objective function:= log(det(sigma**2 * R)) + constant
-                ll = ll + (np.log(np.linalg.det(sigma_[out_dim] * r__)) + m * (np.log(2 * np.pi) + 1))/2
+                ll = ll + (m * np.log(sigma_[out_dim]) + log_det_r + m * (np.log(2 * np.pi) + 1))/2
 
             # Gradient of loglikelihood
             # Reference: C. E. Rasmussen & C. K. I. Williams, Gaussian Processes for Machine Learning, the MIT Press,
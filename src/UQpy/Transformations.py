@@ -174,9 +174,12 @@ class Nataf:
             elif all(isinstance(x, Normal) for x in dist_object):
                 self.corr_z = self.corr_x
             else:
-                self.corr_z, self.itam_error1, self.itam_error2 = self.itam(self.dist_object, self.corr_x, self.beta,
-                                                                            self.itam_threshold1, self.itam_threshold2,
-                                                                            self.verbose)
+                self.corr_z, self.itam_error1, self.itam_error2 = self.itam(self.dist_object, self.corr_x,
+                                                                            itam_max_iter=self.itam_max_iter,
+                                                                            beta=self.beta,
+                                                                            itam_threshold1=self.itam_threshold1,
+                                                                            itam_threshold2=self.itam_threshold2,
+                                                                            verbose=self.verbose)
         elif corr_z is not None:
             if np.all(np.equal(self.corr_z, np.eye(self.dimension))):
                 self.corr_x = self.corr_z
@@ -319,9 +322,9 @@ class Nataf:
         if verbose:
             print("UQpy: Initializing Iterative Translation Approximation Method (ITAM)")
 
+        from UQpy.Utilities import nearest_correlation
         for k in range(itam_max_iter):
             error0 = itam_error1[k]
-            from UQpy.Utilities import nearest_psd
             corr0 = Nataf.distortion_z2x(dist_object, corr_z0, verbose)
 
             max_ratio = np.amax(np.ones((len(corr_x), len(corr_x))) / abs(corr_z0))
@@ -332,7 +335,7 @@ class Nataf:
             corr_z[corr_z < -1.0] = (max_ratio + 1) / 2 * corr_z0[corr_z < -1.0]
             corr_z[corr_z > 1.0] = (max_ratio + 1) / 2 * corr_z0[corr_z > 1.0]
 
-            corr_z = np.array(nearest_psd(corr_z))
+            corr_z = nearest_correlation(corr_z)
 
             corr_z0 = corr_z.copy()
 
@@ -16,27 +16,52 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import numpy as np
+import scipy.sparse as sparse
 import scipy.stats as stats
 
 from UQpy.RunModel import RunModel
 
 
-def svd(matrix, rank=None, tol=None):
+def svd(matrix, rank=None, tol=None, randomized=False, n_oversamples=10, n_power_iter=2, random_state=None):
     """
     Compute the singular value decomposition (SVD) of a matrix.
 
+    The thin (economy) SVD is computed, so the left singular vectors of a ``shape=(m, n)`` matrix are never formed
+    beyond ``min(m, n)`` columns. If `rank` is provided and `randomized` is True, a randomized truncated SVD is used
+    instead, which only requires products of the matrix with ``rank + n_oversamples`` vectors.
+
     **Inputs:**
 
     * **matrix** (`ndarray`):
         Matrix of ``shape=(m, n)`` to perform the factorization using thin SVD
 
+    * **rank** (`int`):
+        Number of singular values to keep.
+
+        Default: None (the rank is estimated using `tol`).
+
     * **tol** (`float`):
-        Tolerance to estimate the rank of the matrix.
+        Tolerance to estimate the rank of the matrix. Only used if `rank` is None.
 
         Default: Machine precision
 
-    * **iterations** (`rank`):
-        Number of eigenvalues to keep.
+    * **randomized** (`bool`):
+        If True and `rank` is provided, compute a randomized truncated SVD.
+
+        Default: False
+
+    * **n_oversamples** (`int`):
+        Number of additional random vectors used by the randomized SVD.
+
+        Default: 10
+
+    * **n_power_iter** (`int`):
+        Number of power iterations used by the randomized SVD.
+
+        Default: 2
+
+    * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+        Random seed used to initialize the pseudo-random number generator of the randomized SVD.
 
         Default: None
 
@@ -45,43 +70,131 @@ def svd(matrix, rank=None, tol=None):
     * **u** (`ndarray`):
         Matrix of left eigenvectors of ``shape=(m, rank)``.
 
-    * **v** (`ndarray`):
-        Matrix of right eigenvectors of ``shape=(rank, n)``.
-
     * **s** (`ndarray`):
         Matrix of eigenvalues ``shape=(rank, rank)``.
 
+    * **v** (`ndarray`):
+        Matrix of right eigenvectors of ``shape=(n, rank)``.
+
+    """
+    matrix = np.asarray(matrix)
+    if rank is not None and randomized and rank < min(matrix.shape):
+        u, s, v = _randomized_svd(matrix, rank, n_oversamples=n_oversamples, n_power_iter=n_power_iter,
+                                  random_state=random_state)
+        return u, np.diag(s), v
+
+    ui, si, vi = np.linalg.svd(matrix, full_matrices=False, hermitian=False)
+    u, s, v = _truncate_svd(ui, si, vi.T, rank=rank, tol=tol)
+
+    return u, np.diag(s), v
+
+
+def batched_svd(matrices, rank=None, tol=None):
     """
-    ui, si, vi = np.linalg.svd(matrix, full_matrices=True, hermitian=False)
-    si = np.diag(si)
-    vi = vi.T
+    Compute the singular value decomposition (SVD) of a stack of matrices with the same shape.
+
+    All matrices are factorized in a single call to ``numpy.linalg.svd`` using thin SVD, and each factorization is
+    truncated as in ``svd``.
+
+    **Inputs:**
+
+    * **matrices** (`list` or `ndarray`):
+        Matrices to factorize, either a `list` of matrices of ``shape=(m, n)`` or an `ndarray` of
+        ``shape=(nmatrices, m, n)``.
+
+    * **rank** (`int` or `list`):
+        Number of singular values to keep, either a single value for all matrices or one value per matrix.
+
+        Default: None (the rank of each matrix is estimated using `tol`).
+
+    * **tol** (`float`):
+        Tolerance to estimate the rank of the matrices. Only used if `rank` is None.
+
+        Default: Machine precision
+
+    **Output/Returns:**
+
+    * **u** (`list`):
+        Matrices of left eigenvectors, each of ``shape=(m, rank)``.
+
+    * **s** (`list`):
+        Matrices of eigenvalues, each of ``shape=(rank, rank)``.
+
+    * **v** (`list`):
+        Matrices of right eigenvectors, each of ``shape=(n, rank)``.
+
+    """
+    matrices = np.asarray(matrices)
+    if matrices.ndim != 3:
+        raise ValueError('UQpy: matrices must be a stack of matrices with the same shape.')
+    nmatrices = matrices.shape[0]
+
+    if rank is None or isinstance(rank, (int, np.integer)):
+        rank = [rank] * nmatrices
+    elif len(rank) != nmatrices:
+        raise ValueError('UQpy: rank must be an integer or a list with one value per matrix.')
+
+    ui, si, vi = np.linalg.svd(matrices, full_matrices=False, hermitian=False)
+    vi = np.swapaxes(vi, 1, 2)
+
+    u, s, v = [], [], []
+    for i in range(nmatrices):
+        u_, s_, v_ = _truncate_svd(ui[i], si[i], vi[i], rank=rank[i], tol=tol)
+        u.append(u_)
+        s.append(np.diag(s_))
+        v.append(v_)
+
+    return u, s, v
+
+
+def _truncate_svd(u, s, v, rank=None, tol=None):
     if rank is None:
-        if tol is not None:
-            rank = np.linalg.matrix_rank(si, tol=tol)
-        else:
-            rank = np.linalg.matrix_rank(si)
-        u = ui[:, :rank]
-        s = si[:rank, :rank]
-        v = vi[:, :rank]
+        if tol is None:
+            tol = s.max(initial=0) * s.shape[0] * np.finfo(s.dtype).eps
+        rank = int(np.count_nonzero(s > tol))
+    rank = int(rank)
+    return u[:, :rank], s[:rank], v[:, :rank]
+
+
+def _randomized_svd(matrix, rank, n_oversamples=10, n_power_iter=2, random_state=None):
+    if isinstance(random_state, int):
+        random_state = np.random.RandomState(random_state)
+    elif not isinstance(random_state, (type(None), np.random.RandomState)):
+        raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+
+    m, n = matrix.shape
+    nvectors = min(rank + n_oversamples, m, n)
+    if random_state is None:
+        omega = np.random.normal(size=(n, nvectors))
     else:
-        u = ui[:, :rank]
-        s = si[:rank, :rank]
-        v = vi[:, :rank]
+        omega = random_state.normal(size=(n, nvectors))
 
-    return u, s, v
+    # Range finder with power iterations, re-orthonormalized at each step for stability.
+    q, _ = np.linalg.qr(matrix @ omega)
+    for _ in range(n_power_iter):
+        q, _ = np.linalg.qr(matrix.T @ q)
+        q, _ = np.linalg.qr(matrix @ q)
+
+    ub, s, vt = np.linalg.svd(q.T @ matrix, full_matrices=False)
+    u = q @ ub
+    return u[:, :rank], s[:rank], vt[:rank, :].T
 
 
 def nearest_psd(input_matrix, iterations=10):
     """
-    A function to compute the nearest positive semi-definite matrix of a given matrix [3]_.
+    A function to compute the nearest positive semi-definite matrix with unit diagonal (correlation matrix) of a given
+    matrix.
+
+    This function is kept for backward compatibility and calls ``nearest_correlation`` with `iterations` as the
+    maximum number of iterations.
 
     **Inputs:**
 
     * **input_matrix** (`ndarray`):
-        Matrix to find the nearest PD.
+        Matrix to find the nearest PSD.
 
     * **iterations** (`int`):
-        Number of iterations to perform.
+        Maximum number of iterations to perform.
 
         Default: 10
 
@@ -92,20 +205,97 @@ def nearest_psd(input_matrix, iterations=10):
 
     """
 
-    n = input_matrix.shape[0]
-    w = np.identity(n)
-    # w is the matrix used for the norm (assumed to be Identity matrix here)
-    # the algorithm should work for any diagonal W
-    delta_s = 0
-    psd_matrix = input_matrix.copy()
-    for k in range(iterations):
+    return nearest_correlation(input_matrix, max_iter=iterations)
+
 
-        r_k = psd_matrix - delta_s
-        x_k = _get_ps(r_k, w=w)
-        delta_s = x_k - r_k
-        psd_matrix = _get_pu(x_k, w=w)
+def nearest_correlation(input_matrix, tol=1e-8, max_iter=100, anderson_depth=2):
+    """
+    A function to compute the nearest correlation matrix (positive semi-definite with unit diagonal) of a given
+    symmetric matrix.
 
-    return psd_matrix
+    The alternating projections method of Higham [1]_ with Dykstra's correction is used, accelerated with Anderson
+    acceleration [4]_. The projection onto the positive semi-definite cone uses a symmetric eigendecomposition and the
+    iterations stop as soon as the distance between the two projections drops below `tol`. If the input matrix is
+    already a correlation matrix, a single eigendecomposition is performed.
+
+    **Inputs:**
+
+    * **input_matrix** (`ndarray`):
+        Symmetric matrix to find the nearest correlation matrix.
+
+    * **tol** (`float`):
+        Tolerance on the relative distance between the positive semi-definite and the unit diagonal iterates.
+
+        Default: 1e-8
+
+    * **max_iter** (`int`):
+        Maximum number of iterations to perform.
+
+        Default: 100
+
+    * **anderson_depth** (`int`):
+        Number of previous iterates used by the Anderson acceleration. If 0, plain alternating projections are
+        performed.
+
+        Default: 2
+
+    **Output/Returns:**
+
+    * **corr_matrix** (`ndarray`):
+        Nearest correlation matrix to input_matrix.
+
+    """
+
+    a = np.array(input_matrix, dtype=float)
+    if a.ndim != 2 or a.shape[0] != a.shape[1]:
+        raise ValueError('UQpy: input_matrix must be a square matrix.')
+    a = (a + a.T) / 2
+    n = a.shape[0]
+
+    # The Dykstra iteration Y_k = P_U(P_S(Y_{k-1} - dS_{k-1})) is written as a fixed point iteration r = g(r) on
+    # r = Y - dS, with g(r) = r + P_U(P_S(r)) - P_S(r), to which Anderson acceleration is applied.
+    r = a.copy()
+    x = r
+    delta_f, delta_g = [], []
+    f_old, g_old = None, None
+    for k in range(max_iter):
+        x = _project_psd(r)
+        # P_U only resets the diagonal, so g(r) - r = P_U(x) - x is diagonal.
+        f = np.diag(1.0 - np.diag(x))
+        g_r = r + f
+
+        if np.linalg.norm(f) <= tol * max(np.linalg.norm(x), 1.0):
+            break
+
+        if anderson_depth > 0:
+            if f_old is not None:
+                delta_f.append((f - f_old).ravel())
+                delta_g.append((g_r - g_old).ravel())
+                if len(delta_f) > anderson_depth:
+                    delta_f.pop(0)
+                    delta_g.pop(0)
+            f_old, g_old = f, g_r
+            if delta_f:
+                gamma = np.linalg.lstsq(np.column_stack(delta_f), f.ravel(), rcond=None)[0]
+                g_r = g_r - (np.column_stack(delta_g) @ gamma).reshape(n, n)
+                g_r = (g_r + g_r.T) / 2
+        r = g_r
+
+    # Rescale the positive semi-definite iterate to unit diagonal, so the output is a valid correlation matrix.
+    d = np.sqrt(np.maximum(np.diag(x), np.finfo(float).tiny))
+    corr_matrix = x / np.outer(d, d)
+    corr_matrix = (corr_matrix + corr_matrix.T) / 2
+    np.fill_diagonal(corr_matrix, 1.0)
+
+    return corr_matrix
+
+
+def _project_psd(a):
+    eig_val, eig_vec = np.linalg.eigh(a)
+    if eig_val[0] >= 0:
+        return a.copy()
+    eig_vec_plus = eig_vec[:, eig_val > 0]
+    return (eig_vec_plus * eig_val[eig_val > 0]) @ eig_vec_plus.T
 
 
 def nearest_pd(input_matrix):
@@ -169,10 +359,14 @@ def run_parallel_python(model_script, model_object_name, sample, dict_kwargs=Non
     return par_res
 
 
-def gradient(runmodel_object=None, point=None, order='first', df_step=None):
+def gradient(runmodel_object=None, point=None, order='first', df_step=None, scheme='central'):
     """
     This method estimates the gradients (1st, 2nd, mixed) of a function using a finite difference scheme in the
-    standard normal space. First order gradients are calculated using central finite differences.
+    standard normal space.
+
+    The finite difference stencil for all points and all directions is assembled at once, duplicated stencil points
+    (e.g. the center point shared by the second order and mixed derivatives) are removed, and the model is evaluated
+    with a single call to ``RunModel.run`` or to the `callable`, so that the evaluations can run in parallel.
 
     **Inputs:**
 
@@ -180,128 +374,183 @@ def gradient(runmodel_object=None, point=None, order='first', df_step=None):
         The numerical model. It should be of type `RunModel` (see ``RunModel`` class) or a `callable`.
 
     * **point** (`ndarray`):
-        The point to evaluate the gradient with shape ``point``.shape=(1, dimension)
+        The points to evaluate the gradient with shape ``point.shape=(npoints, dimension)``
 
     * **order** (`str`):
-        Order of the gradient. Available options: 'first', 'second', 'mixed'.
+        Order of the gradient. Available options: 'first', 'second', 'mixed', 'hessian'.
 
-        Default: 'First'.
+        Default: 'first'.
 
-    * **df_step** (`float`):
-        Finite difference step.
+    * **df_step** (`float` or `list`):
+        Finite difference step, either a single value or one value per dimension.
 
         Default: 0.001.
 
+    * **scheme** (`str`):
+        Finite difference scheme. Available options:
+
+        - 'central': central differences.
+        - 'forward': forward differences.
+        - 'richardson': Richardson extrapolation of central differences with steps `df_step` and `df_step/2`.
+        - 'complex': complex-step approximation (only for `order='first'` and a `callable` model that accepts complex
+          inputs).
+
+        Default: 'central'.
+
     **Output/Returns:**
 
     * **du_dj** (`ndarray`):
-        Vector of first-order gradients (if order = 'first').
+        First-order gradients of shape ``(npoints, dimension)`` (if order = 'first').
 
     * **d2u_dj** (`ndarray`):
-        Vector of second-order gradients (if order = 'second').
+        Second-order gradients of shape ``(npoints, dimension)`` (if order = 'second').
 
     * **d2u_dij** (`ndarray`):
-        Vector of mixed gradients (if order = 'mixed').
+        Mixed gradients of shape ``(npoints, dimension * (dimension - 1) / 2)`` (if order = 'mixed').
+
+    * **hessian** (`ndarray`):
+        Hessian matrices of shape ``(npoints, dimension, dimension)`` (if order = 'hessian').
 
     """
     point = np.atleast_2d(point)
-
-    dimension = point.shape[1]
-
-    if df_step is None:
-        df_step = [0.001] * dimension
-    elif isinstance(df_step, float):
-        df_step = [df_step] * dimension
-    elif isinstance(df_step, list):
-        if len(df_step) == 1:
-            df_step = [df_step[0]] * dimension
+    npoints, dimension = point.shape
 
     if not callable(runmodel_object) and not isinstance(runmodel_object, RunModel):
         raise RuntimeError('A RunModel object or callable function must be provided as model.')
 
-    def func(m):
-        def func_eval(x):
-            if isinstance(m, RunModel):
-                m.run(samples=x, append_samples=False)
-                return np.array(m.qoi_list).flatten()
-            else:
-                return m(x).flatten()
-
-        return func_eval
-
-    f_eval = func(m=runmodel_object)
-
-    if order.lower() == 'first':
-        du_dj = np.zeros([point.shape[0], dimension])
-
-        for ii in range(dimension):
-            eps_i = df_step[ii]
-            u_i1_j = point.copy()
-            u_i1_j[:, ii] = u_i1_j[:, ii] + eps_i
-            u_1i_j = point.copy()
-            u_1i_j[:, ii] = u_1i_j[:, ii] - eps_i
-
-            qoi_plus = f_eval(u_i1_j)
-            qoi_minus = f_eval(u_1i_j)
-
-            du_dj[:, ii] = ((qoi_plus - qoi_minus) / (2 * eps_i))
-
-        return du_dj
-
-    elif order.lower() == 'second':
-        # print('Calculating second order derivatives..')
-        d2u_dj = np.zeros([point.shape[0], dimension])
-        for ii in range(dimension):
-            u_i1_j = point.copy()
-            u_i1_j[:, ii] = u_i1_j[:, ii] + df_step[ii]
-            u_1i_j = point.copy()
-            u_1i_j[:, ii] = u_1i_j[:, ii] - df_step[ii]
-
-            qoi_plus = f_eval(u_i1_j)
-            qoi = f_eval(point)
-            qoi_minus = f_eval(u_1i_j)
-
-            d2u_dj[:, ii] = ((qoi_plus - 2 * qoi + qoi_minus) / (df_step[ii] * df_step[ii]))
+    df_step = _preprocess_df_step(df_step, dimension, default=0.001)
+    order = order.lower()
+    scheme = scheme.lower()
+
+    if scheme == 'complex':
+        if order != 'first':
+            raise NotImplementedError('UQpy: The complex-step scheme is only available for first order gradients.')
+        if isinstance(runmodel_object, RunModel):
+            raise TypeError('UQpy: The complex-step scheme requires a callable model that accepts complex inputs.')
+        offsets = 1j * np.diag(df_step)
+        stencil = (point[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, dimension)
+        qoi = np.asarray(runmodel_object(stencil)).flatten().reshape(npoints, dimension)
+        return np.imag(qoi) / df_step
+
+    offsets, weights = _finite_difference_stencil(dimension, df_step, order=order, scheme=scheme)
+    stencil = (point[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, dimension)
+
+    if isinstance(runmodel_object, RunModel):
+        runmodel_object.run(samples=stencil, append_samples=False)
+        qoi = np.array(runmodel_object.qoi_list).flatten()
+    else:
+        qoi = np.asarray(runmodel_object(stencil)).flatten()
 
-        return d2u_dj
+    derivatives = np.asarray(weights.T @ qoi.reshape(npoints, offsets.shape[0]).T).T
+    if order == 'hessian':
+        return _assemble_hessian(derivatives, dimension)
+    return derivatives
 
-    elif order.lower() == 'mixed':
 
-        import itertools
-        range_ = list(range(dimension))
-        d2u_dij = np.zeros([point.shape[0], int(dimension * (dimension - 1) / 2)])
-        count = 0
-        for i in itertools.combinations(range_, 2):
-            u_i1_j1 = point.copy()
-            u_i1_1j = point.copy()
-            u_1i_j1 = point.copy()
-            u_1i_1j = point.copy()
+def _preprocess_df_step(df_step, dimension, default):
+    if df_step is None:
+        df_step = default
+    df_step = np.atleast_1d(np.asarray(df_step, dtype=float)).flatten()
+    if df_step.size == 1:
+        df_step = np.repeat(df_step, dimension)
+    elif df_step.size != dimension:
+        raise ValueError('UQpy: df_step must be a float or a list with one value per dimension.')
+    return df_step
 
-            eps_i1_0 = df_step[i[0]]
-            eps_i1_1 = df_step[i[1]]
 
-            u_i1_j1[:, i[0]] += eps_i1_0
-            u_i1_j1[:, i[1]] += eps_i1_1
+def _finite_difference_stencil(dimension, df_step, order='first', scheme='central'):
+    """
+    Private function: Build the finite difference stencil of a point.
 
-            u_i1_1j[:, i[0]] += eps_i1_0
-            u_i1_1j[:, i[1]] -= eps_i1_1
+    Returns the unique offsets of shape ``(noffsets, dimension)`` and the sparse weights of shape
+    ``(noffsets, nderivatives)`` such that the derivatives at a point `x` are given by ``weights.T @ f(x + offsets)``.
+    For order 'hessian', the derivatives are ordered as the second order derivatives followed by the mixed derivatives.
+    """
+    if order not in ['first', 'second', 'mixed', 'hessian']:
+        raise ValueError("UQpy: order must be one of 'first', 'second', 'mixed' or 'hessian'.")
+    if scheme not in ['central', 'forward', 'richardson']:
+        raise ValueError("UQpy: scheme must be one of 'central', 'forward', 'richardson' or 'complex'.")
+
+    if scheme == 'richardson':
+        offsets_h, cols_h, values_h, ncols = _stencil_triplets(dimension, df_step, order, 'central')
+        offsets_h2, cols_h2, values_h2, _ = _stencil_triplets(dimension, df_step / 2, order, 'central')
+        return _merge_stencil(np.vstack([offsets_h, offsets_h2]), np.concatenate([cols_h, cols_h2]),
+                              np.concatenate([-values_h / 3, 4 * values_h2 / 3]), ncols)
+
+    return _merge_stencil(*_stencil_triplets(dimension, df_step, order, scheme))
+
+
+def _stencil_triplets(dimension, df_step, order, scheme):
+    # Offsets of the stencil points, with the column (derivative) and the coefficient of each point.
+    diagonal = np.arange(dimension)
+    offsets, cols, values = [], [], []
+
+    def add(steps, coefficients, column, first=None, second=None):
+        offset = np.zeros((column.size, dimension))
+        if first is not None:
+            offset[np.arange(column.size), first[0]] += first[1]
+        if second is not None:
+            offset[np.arange(column.size), second[0]] += second[1]
+        offsets.append(offset)
+        cols.append(column)
+        values.append(coefficients / steps)
+
+    ncols = 0
+    if order == 'first':
+        if scheme == 'central':
+            add(2 * df_step, 1., diagonal, first=(diagonal, df_step))
+            add(2 * df_step, -1., diagonal, first=(diagonal, -df_step))
+        else:
+            add(df_step, 1., diagonal, first=(diagonal, df_step))
+            add(df_step, -1., diagonal)
+        ncols = dimension
+
+    if order in ['second', 'hessian']:
+        h2 = df_step ** 2
+        if scheme == 'central':
+            add(h2, 1., diagonal, first=(diagonal, df_step))
+            add(h2, -2., diagonal)
+            add(h2, 1., diagonal, first=(diagonal, -df_step))
+        else:
+            add(h2, 1., diagonal, first=(diagonal, 2 * df_step))
+            add(h2, -2., diagonal, first=(diagonal, df_step))
+            add(h2, 1., diagonal)
+        ncols = dimension
+
+    if order in ['mixed', 'hessian']:
+        i, j = np.triu_indices(dimension, k=1)
+        column = ncols + np.arange(i.size)
+        hi, hj = df_step[i], df_step[j]
+        if scheme == 'central':
+            hij = 4 * hi * hj
+            for si, sj in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+                add(hij, float(si * sj), column, first=(i, si * hi), second=(j, sj * hj))
+        else:
+            hij = hi * hj
+            add(hij, 1., column, first=(i, hi), second=(j, hj))
+            add(hij, -1., column, first=(i, hi))
+            add(hij, -1., column, second=(j, hj))
+            add(hij, 1., column)
+        ncols = ncols + i.size
 
-            u_1i_j1[:, i[0]] -= eps_i1_0
-            u_1i_j1[:, i[1]] += eps_i1_1
+    return np.vstack(offsets), np.concatenate(cols), np.concatenate(values), ncols
 
-            u_1i_1j[:, i[0]] -= eps_i1_0
-            u_1i_1j[:, i[1]] -= eps_i1_1
 
-            print('hi')
-            qoi_0 = f_eval(u_i1_j1)
-            qoi_1 = f_eval(u_i1_1j)
-            qoi_2 = f_eval(u_1i_j1)
-            qoi_3 = f_eval(u_1i_1j)
+def _merge_stencil(offsets, cols, values, ncols):
+    # Remove the duplicated offsets, summing their coefficients in a sparse weight matrix.
+    unique_offsets, inverse = np.unique(offsets, axis=0, return_inverse=True)
+    weights = sparse.csr_matrix((values, (inverse.reshape(-1), cols)), shape=(unique_offsets.shape[0], ncols))
+    return unique_offsets, weights
 
-            d2u_dij[:, count] = ((qoi_0 + qoi_3 - qoi_1 - qoi_2) / (4 * eps_i1_0 * eps_i1_1))
 
-            count += 1
-        return d2u_dij
+def _assemble_hessian(derivatives, dimension):
+    hessian = np.zeros((derivatives.shape[0], dimension, dimension))
+    diagonal = np.arange(dimension)
+    hessian[:, diagonal, diagonal] = derivatives[:, :dimension]
+    upper_i, upper_j = np.triu_indices(dimension, k=1)
+    hessian[:, upper_i, upper_j] = derivatives[:, dimension:]
+    hessian[:, upper_j, upper_i] = derivatives[:, dimension:]
+    return hessian
 
 
 def _bi_variate_normal_pdf(x1, x2, rho):
@@ -335,26 +584,6 @@ def _bi_variate_normal_pdf(x1, x2, rho):
 #
 #     return np.linspace(0, (1 / (2 * dt) - 1 / t), num), m_ps
 
-def _get_a_plus(a):
-    eig_val, eig_vec = np.linalg.eig(a)
-    q = np.array(eig_vec)
-    x_diagonal = np.array(np.diag(np.maximum(eig_val, 0)))
-
-    return q * x_diagonal * q.T
-
-
-def _get_ps(a, w=None):
-    w05 = np.array(w ** .5)
-
-    return w05.I * _get_a_plus(w05 * a * w05) * w05.I
-
-
-def _get_pu(a, w=None):
-    a_ret = np.array(a.copy())
-    a_ret[w > 0] = np.array(w)[w > 0]
-    return np.array(a_ret)
-
-
 def _nn_coord(x, k):
     
     """
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from UQpy.Distributions import Normal
+from UQpy.Reliability import LineSampling, DirectionalSimulation, SubsetSimulation
+from UQpy.RunModel import RunModel
+
+
+@pytest.fixture
+def near_origin_model(tmp_path, monkeypatch):
+    # Limit state g = 0.5 - u1, closer to the origin than the first point of the default grids, its shifted version and
+    # a limit state far from the origin
+    (tmp_path / 'near_origin_limit_state.py').write_text(
+        'def g(samples=None):\n'
+        '    return 0.5 - samples[:, 0]\n'
+        '\n'
+        '\n'
+        'def g_shifted(samples=None):\n'
+        '    return -0.5 - samples[:, 0]\n'
+        '\n'
+        '\n'
+        'def g_far(samples=None):\n'
+        '    return 3 - samples[:, 0]\n')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def model(name):
+        return RunModel(model_script='near_origin_limit_state.py', model_object_name=name, vec=True)
+    return model
+
+
+def test_line_sampling_root_below_grid(near_origin_model):
+    ls = LineSampling(dist_object=[Normal(0, 1), Normal(0, 1)], runmodel_object=near_origin_model('g'),
+                      direction=[1, 0], nlines=20, random_state=1)
+    assert np.allclose(ls.roots, 0.5, atol=1e-3)
+    assert np.isclose(ls.pf, stats.norm.cdf(-0.5), rtol=1e-3)
+
+
+def test_line_sampling_negative_root(near_origin_model):
+    ls = LineSampling(dist_object=[Normal(0, 1), Normal(0, 1)], runmodel_object=near_origin_model('g_shifted'),
+                      direction=[1, 0], nlines=20, random_state=1)
+    assert np.allclose(ls.roots, -0.5, atol=1e-3)
+    assert np.isclose(ls.pf, stats.norm.cdf(0.5), rtol=1e-3)
+
+
+def test_directional_simulation_root_below_grid(near_origin_model):
+    ds = DirectionalSimulation(dist_object=[Normal(0, 1), Normal(0, 1)], runmodel_object=near_origin_model('g'),
+                               ndirections=2000, random_state=1)
+    crossing = ds.directions[:, 0] * ds.grid[-1] > 0.5
+    assert np.allclose(ds.roots[crossing], 0.5 / ds.directions[crossing, 0], atol=1e-3)
+    assert np.all(np.isinf(ds.roots[~crossing]))
+    assert abs(ds.pf - stats.norm.cdf(-0.5)) < 3 * ds.cov * ds.pf
+
+
+def test_subset_simulation_block_size_requires_single_chain_kernel(near_origin_model):
+    from UQpy.SampleMethods import Stretch
+    with pytest.raises(ValueError):
+        SubsetSimulation(runmodel_object=near_origin_model('g'), mcmc_class=Stretch, nsamples_per_ss=100,
+                         block_size=5, dimension=2, nchains=10, log_pdf_target=lambda x: -np.sum(x ** 2, axis=1) / 2)
+
+
+def test_subset_simulation_block_size_requires_integer_chain_length(near_origin_model):
+    from UQpy.SampleMethods import MMH
+    with pytest.raises(AttributeError):
+        SubsetSimulation(runmodel_object=near_origin_model('g_far'), mcmc_class=MMH, nsamples_per_ss=1000, p_cond=0.3,
+                         block_size=5, dimension=2, nchains=50, random_state=2,
+                         log_pdf_target=lambda x: -np.sum(x ** 2, axis=1) / 2)